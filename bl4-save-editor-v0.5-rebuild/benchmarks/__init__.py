@@ -0,0 +1 @@
+"""Performance benchmarks (python -m benchmarks.run --help)."""
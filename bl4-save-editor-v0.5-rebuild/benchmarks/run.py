@@ -0,0 +1,190 @@
+"""Load/edit/save benchmarks over synthetic saves, run headlessly.
+
+Examples:
+    python -m benchmarks.run                       # small + medium, 3 runs each
+    python -m benchmarks.run --sizes large -n 5 -o results/large.json
+    python -m benchmarks.run --backpack 20000 --bank 0 -o big_backpack.json
+    python -m benchmarks.run -o new.json --compare old.json
+
+Each benchmark is timed `-n` times; the JSON output keeps min/median/mean
+per operation together with the environment, so runs can be compared.
+"""
+import argparse, json, os, platform, statistics, sys, tempfile, time
+
+# no window system needed
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from benchmarks.synthetic import SIZES, make_character_save, make_profile_save
+
+
+def _timeit(fn, repeat):
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - t0) * 1000.0)
+    return {
+        'min_ms': min(runs),
+        'median_ms': statistics.median(runs),
+        'mean_ms': statistics.fmean(runs),
+        'runs': len(runs),
+    }
+
+
+def _make_tabs():
+    from bl4_editor.ui.tabs.character_tab import CharacterTab
+    from bl4_editor.ui.tabs.items_tab import ItemsTab
+    from bl4_editor.ui.tabs.progression_tab import ProgressionTab
+    from bl4_editor.ui.tabs.stats_tab import StatsTab
+    from bl4_editor.ui.tabs.world_tab import WorldTab
+    from bl4_editor.ui.tabs.unlockables_tab import UnlockablesTab
+    from bl4_editor.ui.tabs.profile_tab import ProfileTab
+    return {
+        'character': CharacterTab(),
+        'items': ItemsTab(),
+        'progression': ProgressionTab(),
+        'stats': StatsTab(),
+        'world': WorldTab(),
+        'unlockables': UnlockablesTab(),
+        'profile': ProfileTab(),
+    }
+
+
+def bench_save(kind, data, workdir, repeat):
+    """Time file and tab operations for one save; returns {operation: stats}."""
+    from bl4_editor.core import fileio
+    from bl4_editor.core.controller import TabController
+    path = os.path.join(workdir, f'{kind}.yaml')
+    timings = {}
+
+    timings['safe_write_yaml'] = _timeit(lambda: fileio.safe_write_yaml(path, data, atomic=True, make_backup=False), repeat)
+    size = os.path.getsize(path)
+    timings['open_file'] = _timeit(lambda: fileio.open_file(path, use_cache=False), repeat)
+    # tabs get the parsed data, as they would after opening (this also fills the parse cache)
+    _yaml_path, loaded = fileio.open_file(path, use_cache=True)
+    timings['open_file_cached'] = _timeit(lambda: fileio.open_file(path, use_cache=True), repeat)
+
+    tabs = _make_tabs()
+    controller = TabController(tabs)
+    timings['load_into_tabs'] = _timeit(lambda: controller.load_into_tabs(loaded), repeat)
+    items_payload = loaded if 'domains' in loaded or 'shared' in loaded else loaded.get('state', loaded)
+    timings['items_tab_populate'] = _timeit(lambda: tabs['items'].load_data(items_payload), repeat)
+    timings['save_from_tabs_all'] = _timeit(lambda: controller.save_from_tabs(loaded, only_dirty=False), repeat)
+
+    def one_edit_then_save():
+        controller.mark_dirty('world', ('bench',))
+        controller.save_from_tabs(loaded)
+    timings['save_from_tabs_one_dirty'] = _timeit(one_edit_then_save, repeat)
+    for tab in tabs.values():
+        tab.deleteLater()
+    return {'file_bytes': size, 'timings': timings}
+
+
+def _environment():
+    import yaml
+    try:
+        import PySide6
+        pyside = PySide6.__version__
+    except Exception:
+        pyside = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'pyyaml': yaml.__version__,
+        'libyaml': bool(getattr(yaml, '__with_libyaml__', False)),
+        'pyside6': pyside,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def run(cases, repeat=3, seed=0):
+    """cases: list of (name, params). Returns the results dict written as JSON."""
+    from PySide6 import QtWidgets
+    from bl4_editor.core import logger, parse_cache
+    logger.init(to_file=False)
+    logger.set_level('WARNING')
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    results = {'environment': _environment(), 'repeat': repeat, 'seed': seed, 'cases': []}
+    with tempfile.TemporaryDirectory(prefix='bl4_bench_') as workdir:
+        parse_cache.CACHE_DIR = os.path.join(workdir, 'parse_cache')
+        for name, params in cases:
+            t0 = time.perf_counter()
+            character = make_character_save(seed=seed, **params)
+            profile = make_profile_save(seed=seed, **params)
+            gen_ms = (time.perf_counter() - t0) * 1000.0
+            case = {'name': name, 'params': params, 'generate_ms': gen_ms, 'saves': {}}
+            for kind, data in (('character', character), ('profile', profile)):
+                case['saves'][kind] = bench_save(kind, data, workdir, repeat)
+                app.processEvents()
+            results['cases'].append(case)
+            print(format_case(case))
+    return results
+
+
+def format_case(case, baseline=None):
+    lines = [f"== {case['name']} {case['params']}"]
+    for kind, res in case['saves'].items():
+        lines.append(f"  {kind} ({res['file_bytes'] / 1024:.0f} KiB YAML)")
+        base = (baseline or {}).get(kind, {}).get('timings', {})
+        for op, t in res['timings'].items():
+            line = f"    {op:<26} {t['median_ms']:10.2f} ms (min {t['min_ms']:.2f})"
+            if op in base and base[op]['median_ms'] > 0:
+                line += f"   x{t['median_ms'] / base[op]['median_ms']:.2f} vs baseline"
+            lines.append(line)
+    return '\n'.join(lines)
+
+
+def compare(results, baseline):
+    by_name = {c['name']: c['saves'] for c in baseline.get('cases', [])}
+    out = []
+    for case in results['cases']:
+        if case['name'] in by_name:
+            out.append(format_case(case, by_name[case['name']]))
+    return '\n'.join(out) if out else 'No matching cases in baseline'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='small,medium', help=f"comma-separated presets: {', '.join(SIZES)}")
+    parser.add_argument('--backpack', type=int, help='custom case: items in state.inventory.items.backpack')
+    parser.add_argument('--bank', type=int, help='custom case: items in domains.local.shared.inventory.items.bank')
+    parser.add_argument('--equipped', type=int, help='custom case: items in equipped_inventory')
+    parser.add_argument('--lostloot', type=int, help='custom case: items in state.lostloot.items')
+    parser.add_argument('--world-nodes', type=int, help='custom case: entries in the world tree')
+    parser.add_argument('--progression-nodes', type=int, help='custom case: entries in the progression tree')
+    parser.add_argument('-n', '--repeat', type=int, default=3, help='timed runs per operation (default 3)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--out', help='write results as JSON')
+    parser.add_argument('--compare', metavar='JSON', help='print ratios against an earlier results file')
+    args = parser.parse_args(argv)
+
+    custom = {k: getattr(args, k) for k in ('backpack', 'bank', 'equipped', 'lostloot', 'world_nodes', 'progression_nodes')
+              if getattr(args, k) is not None}
+    if custom:
+        params = dict(SIZES['small'])
+        params.update(custom)
+        cases = [('custom', params)]
+    else:
+        cases = []
+        for name in args.sizes.split(','):
+            name = name.strip()
+            if name not in SIZES:
+                parser.error(f'unknown size {name!r}')
+            cases.append((name, SIZES[name]))
+
+    results = run(cases, repeat=max(1, args.repeat), seed=args.seed)
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f'Wrote {args.out}')
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            print(compare(results, json.load(f)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
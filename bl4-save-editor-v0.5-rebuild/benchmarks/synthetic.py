@@ -0,0 +1,101 @@
+"""Synthetic BL4-shaped save data for benchmarks.
+
+make_character_save() builds a character save with items in
+state.inventory.items.backpack, state.inventory.equipped_inventory and
+state.lostloot.items, plus nested world/progression trees;
+make_profile_save() builds a profile with
+domains.local.shared.inventory.items.bank. Output is deterministic for a
+given seed.
+"""
+import random
+
+_SERIAL_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789!#$%&()*+-;<=>?^_`{/}~'
+
+# name -> parameters for make_character_save / make_profile_save
+SIZES = {
+    'small': dict(backpack=50, bank=100, equipped=8, lostloot=10, world_nodes=500, progression_nodes=500),
+    'medium': dict(backpack=500, bank=1000, equipped=16, lostloot=100, world_nodes=5000, progression_nodes=5000),
+    'large': dict(backpack=5000, bank=10000, equipped=32, lostloot=1000, world_nodes=50000, progression_nodes=50000),
+}
+
+
+def _serial(rng):
+    return '@Ug' + ''.join(rng.choice(_SERIAL_CHARS) for _ in range(rng.randint(30, 60)))
+
+
+def _item(rng):
+    item = {'serial': _serial(rng), 'state_flags': rng.choice((0, 1, 3, 5, 9, 17))}
+    if rng.random() < 0.1:
+        item['notes'] = 'fav'
+    return item
+
+
+def _tree(rng, nodes, fanout=8, prefix='node'):
+    """Nested dict with about `nodes` entries mixing dicts, lists and scalars."""
+    root = {}
+    frontier = [root]
+    made = 0
+    while made < nodes and frontier:
+        parent = frontier.pop(0)
+        for i in range(fanout):
+            if made >= nodes:
+                break
+            key = f'{prefix}_{made}'
+            kind = rng.random()
+            if kind < 0.3:
+                child = {}
+                parent[key] = child
+                frontier.append(child)
+            elif kind < 0.4:
+                parent[key] = [rng.randint(0, 1000) for _ in range(rng.randint(1, 6))]
+            elif kind < 0.7:
+                parent[key] = rng.randint(0, 100000)
+            elif kind < 0.85:
+                parent[key] = rng.random() < 0.5
+            else:
+                parent[key] = f'value_{rng.randint(0, 99999)}'
+            made += 1
+    return root
+
+
+def make_character_save(backpack=500, equipped=16, lostloot=100, world_nodes=5000, progression_nodes=5000, seed=0, **_):
+    rng = random.Random(seed)
+    slots = ('weapon1', 'weapon2', 'weapon3', 'weapon4', 'shield', 'grenade', 'classmod', 'artifact')
+    equipped_inv = {}
+    for i in range(equipped):
+        equipped_inv.setdefault(slots[i % len(slots)], []).append(_item(rng))
+    return {
+        'state': {
+            'char_guid': f'{rng.getrandbits(128):032X}',
+            'class': 'Char_DarkSiren',
+            'char_name': 'Bench',
+            'player_difficulty': 'Normal',
+            'experience': [{'type': 'Character', 'level': 50, 'points': 3430227},
+                           {'type': 'Specialization', 'level': 10, 'points': 40000}],
+            'currencies': {'cash': 123456789, 'eridium': 4200},
+            'inventory': {
+                'items': {'backpack': {f'slot_{i}': _item(rng) for i in range(backpack)}},
+                'equipped_inventory': equipped_inv,
+            },
+            'lostloot': {'items': {f'slot_{i}': _item(rng) for i in range(lostloot)}},
+            'world': _tree(rng, world_nodes, prefix='world'),
+            'progression': _tree(rng, progression_nodes, prefix='prog'),
+            'stats': _tree(rng, max(1, world_nodes // 10), prefix='stat'),
+        },
+    }
+
+
+def make_profile_save(bank=1000, seed=0, **_):
+    rng = random.Random(seed + 1)
+    return {
+        'inputprefs': {'sensitivity': 0.5, 'invert_y': False},
+        'ui': {'hud_scale': 1.0},
+        'onlineprefs': {'crossplay': True},
+        'domains': {
+            'local': {
+                'shared': {
+                    'inventory': {'items': {'bank': {f'slot_{i}': _item(rng) for i in range(bank)}}},
+                },
+            },
+        },
+    }
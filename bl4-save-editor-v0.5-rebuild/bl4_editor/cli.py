@@ -0,0 +1,249 @@
+"""Headless batch tool for BL4 saves (no PySide6 required).
+
+Examples:
+    python -m bl4_editor.cli decrypt saves/ -o out/ -u 7656119...
+    python -m bl4_editor.cli encrypt out/*.yaml -o saves/ -u 7656119...
+    python -m bl4_editor.cli edit saves/ --set state.currencies.cash=999999 --in-place
+    python -m bl4_editor.cli edit saves/ --script my_edits.py -o edited/
+    python -m bl4_editor.cli validate saves/ -j 8
+
+A --script file must define `edit(data, path)`; it may mutate `data` in place
+or return a replacement object.
+"""
+import argparse, glob, logging, os, runpy, shutil, sys, time, yaml
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from bl4_editor.core import crypt as crypt_mod
+from bl4_editor.core import fileio
+from bl4_editor.core import logger
+from bl4_editor.core import settings as core_settings
+from bl4_editor.core.datapath import parse_path, set_by_path
+
+SAVE_EXTS = ('.sav',)
+YAML_EXTS = ('.yaml', '.yml')
+
+
+def collect_files(inputs, exts, recursive=False):
+    """Expand files/directories/globs into a sorted list of matching files."""
+    found = []
+    for item in inputs:
+        matches = glob.glob(item) or [item]
+        for m in matches:
+            if os.path.isdir(m):
+                pattern = os.path.join(m, '**', '*') if recursive else os.path.join(m, '*')
+                for p in glob.glob(pattern, recursive=recursive):
+                    if os.path.isfile(p) and p.lower().endswith(exts):
+                        found.append(os.path.abspath(p))
+            elif os.path.isfile(m) and m.lower().endswith(exts):
+                found.append(os.path.abspath(m))
+    return sorted(set(found))
+
+
+def parse_assignment(text):
+    """Parse 'a.b.c=value' into (path list, value); value is read as YAML."""
+    if '=' not in text:
+        raise argparse.ArgumentTypeError(f'expected PATH=VALUE, got {text!r}')
+    key, raw = text.split('=', 1)
+    path = parse_path(key)
+    if not path:
+        raise argparse.ArgumentTypeError(f'empty path in {text!r}')
+    try:
+        value = yaml.safe_load(raw) if raw != '' else ''
+    except yaml.YAMLError:
+        value = raw
+    return path, value
+
+
+def _out_path(src, out_dir, ext):
+    stem = os.path.basename(src)
+    if ext:
+        stem = os.path.splitext(stem)[0] + ext
+    return os.path.join(out_dir or os.path.dirname(src), stem)
+
+
+def _backup(path):
+    if os.path.exists(path):
+        shutil.copy2(path, path + '.bak')
+
+
+def validate_data(data):
+    """Check that data is a mapping and survives a dump/parse round trip."""
+    if not isinstance(data, dict):
+        raise ValueError(f'top-level YAML is {type(data).__name__}, expected a mapping')
+    text = fileio.safe_dump_yaml(data)
+    if yaml.load(text, Loader=fileio.PatchedLoader) != data:
+        raise ValueError('data does not survive a YAML round trip')
+    return text
+
+
+def _make_crypt():
+    return crypt_mod.CryptWrapper(exe_path=crypt_mod.default_exe_path(), logger=logger)
+
+
+# --- per-file jobs (run in worker processes) ---------------------------------
+
+def job_decrypt(src, opts):
+    raw = _make_crypt().decrypt_bytes(src, userid=opts['userid'])
+    if raw is None:
+        raise RuntimeError('Decryption failed (see logs)')
+    if opts['validate']:
+        validate_data(yaml.load(raw, Loader=fileio.PatchedLoader))
+    dest = _out_path(src, opts['out_dir'], '.yaml')
+    with open(dest, 'wb') as f:
+        f.write(raw)
+    return dest
+
+
+def job_encrypt(src, opts):
+    with open(src, 'rb') as f:
+        raw = f.read()
+    if opts['validate']:
+        validate_data(yaml.load(raw, Loader=fileio.PatchedLoader))
+    dest = _out_path(src, opts['out_dir'], '.sav')
+    if opts['backup']:
+        _backup(dest)
+    if not _make_crypt().encrypt_bytes(raw, dest, userid=opts['userid']):
+        raise RuntimeError('Encryption failed (see logs)')
+    return dest
+
+
+def job_edit(src, opts):
+    # batch runs leave no parse-cache pickles behind
+    _, data = fileio.open_file(src, userid=opts['userid'], use_cache=False)
+    for path, value in opts['assignments']:
+        if not set_by_path(data, path, value):
+            raise ValueError(f"cannot set {'.'.join(map(str, path))}")
+    if opts['script']:
+        ns = runpy.run_path(opts['script'])
+        if not callable(ns.get('edit')):
+            raise RuntimeError(f"{opts['script']} does not define edit(data, path)")
+        result = ns['edit'](data, src)
+        if result is not None:
+            data = result
+    # the document is dumped once: validation's text is what gets written
+    text = validate_data(data) if opts['validate'] else None
+    dest = src if opts['in_place'] else _out_path(src, opts['out_dir'], None)
+    if opts['backup']:
+        _backup(dest)
+    if dest.lower().endswith(SAVE_EXTS):
+        if text is None:
+            text = fileio.safe_dump_yaml(data)
+        if not _make_crypt().encrypt_bytes(text.encode('utf-8'), dest, userid=opts['userid']):
+            raise RuntimeError('Encryption failed (see logs)')
+    else:
+        fileio.safe_write_yaml(dest, data, atomic=True, text=text)
+    return dest
+
+
+def job_validate(src, opts):
+    _, data = fileio.open_file(src, userid=opts['userid'], use_cache=False)
+    validate_data(data)
+    return src
+
+
+JOBS = {
+    'decrypt': (job_decrypt, SAVE_EXTS),
+    'encrypt': (job_encrypt, YAML_EXTS),
+    'edit': (job_edit, SAVE_EXTS + YAML_EXTS),
+    'validate': (job_validate, SAVE_EXTS + YAML_EXTS),
+}
+
+
+def _worker_init(verbose):
+    # spawned workers log to the console only (no log file per process)
+    logger.init(to_file=False)
+    logger.set_console_level(logging.DEBUG if verbose else logging.WARNING)
+
+
+def _run_one(command, src, opts):
+    t0 = time.perf_counter()
+    try:
+        dest = JOBS[command][0](src, opts)
+        return src, True, dest, time.perf_counter() - t0
+    except Exception as e:
+        return src, False, f'{type(e).__name__}: {e}', time.perf_counter() - t0
+
+
+def run_batch(command, files, opts, jobs=None, verbose=False):
+    """Run `command` over files, yielding (src, ok, dest_or_error, seconds) as they finish."""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(files) <= 1:
+        _worker_init(verbose)
+        for src in files:
+            yield _run_one(command, src, opts)
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_worker_init, initargs=(verbose,)) as pool:
+        futures = [pool.submit(_run_one, command, src, opts) for src in files]
+        for fut in as_completed(futures):
+            yield fut.result()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m bl4_editor.cli', description='Batch decrypt/edit/encrypt BL4 saves without the GUI.')
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('inputs', nargs='+', help='files, directories or glob patterns')
+    common.add_argument('-u', '--userid', help='SteamID64 / user id (defaults to the saved last_userid)')
+    common.add_argument('-o', '--out-dir', help='output directory (defaults to next to each input)')
+    common.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    common.add_argument('-r', '--recursive', action='store_true', help='recurse into directories')
+    common.add_argument('--no-backup', dest='backup', action='store_false', help='do not write .bak files before overwriting')
+    common.add_argument('--no-validate', dest='validate', action='store_false', help='skip the YAML validation step')
+    common.add_argument('-v', '--verbose', action='store_true', help='show debug logging')
+    common.add_argument('--log-dir', help='also write a debug log file here (default: log to stderr only)')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('decrypt', parents=[common], help='.sav -> .yaml')
+    sub.add_parser('encrypt', parents=[common], help='.yaml -> .sav')
+    edit = sub.add_parser('edit', parents=[common], help='apply edits, validate and write back')
+    edit.add_argument('--set', dest='assignments', action='append', type=parse_assignment, default=[], metavar='PATH=VALUE', help='set a dotted path (value parsed as YAML); repeatable')
+    edit.add_argument('--script', help='python file defining edit(data, path)')
+    edit.add_argument('--in-place', action='store_true', help='overwrite the input files')
+    sub.add_parser('validate', parents=[common], help='decrypt/parse and check each file')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # no ./logs in the caller's cwd unless a log directory is asked for
+    logger.init(log_dir=args.log_dir, to_file=bool(args.log_dir))
+    command = args.command
+    files = collect_files(args.inputs, JOBS[command][1], recursive=args.recursive)
+    if not files:
+        print('No matching input files', file=sys.stderr)
+        return 2
+    userid = args.userid or core_settings.get_setting('last_userid', '')
+    needs_userid = command == 'encrypt' or any(f.lower().endswith(SAVE_EXTS) for f in files)
+    if needs_userid and not userid:
+        print('A UserID is required for .sav files (use -u)', file=sys.stderr)
+        return 2
+    if command == 'edit':
+        if not args.assignments and not args.script:
+            print('edit needs at least one --set or --script', file=sys.stderr)
+            return 2
+        if not args.in_place and not args.out_dir:
+            print('edit needs --out-dir or --in-place', file=sys.stderr)
+            return 2
+    if args.out_dir:
+        os.makedirs(args.out_dir, exist_ok=True)
+
+    opts = {
+        'userid': userid,
+        'out_dir': args.out_dir,
+        'backup': args.backup,
+        'validate': args.validate,
+        'assignments': getattr(args, 'assignments', []),
+        'script': os.path.abspath(args.script) if getattr(args, 'script', None) else None,
+        'in_place': getattr(args, 'in_place', False),
+    }
+    t0 = time.perf_counter()
+    failed = 0
+    for src, ok, detail, secs in run_batch(command, files, opts, jobs=args.jobs, verbose=args.verbose):
+        if ok:
+            print(f'OK    {src} -> {detail} ({secs:.2f}s)')
+        else:
+            failed += 1
+            print(f'FAIL  {src}: {detail}', file=sys.stderr)
+    print(f'{command}: {len(files) - failed}/{len(files)} succeeded in {time.perf_counter() - t0:.2f}s')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
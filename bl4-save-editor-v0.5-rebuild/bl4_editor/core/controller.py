@@ -1,22 +1,134 @@
 # Updated bl4_editor/core/controller.py
-from typing import Dict, Any
-from bl4_editor.core import logger
+from typing import Dict, Any, Iterable, List, Optional
+from bl4_editor.core import logger, trace
+from bl4_editor.core.datapath import get_by_path, set_by_path
 
 class TabController:
-    """Enhanced controller with proper data flow management"""
+    """Enhanced controller with proper data flow management
+
+    Tabs that emit data_edited(path) are dirty-tracked: only edited tabs are
+    merged on save, and refresh reloads only tabs whose data was changed by
+    another tab. Tabs without that signal are always treated as dirty.
+    """
     
     def __init__(self, tabs: Dict[str, Any]):
         self.tabs = tabs
+        # tab name -> paths edited in that tab (relative to its data; () = anywhere)
+        self.dirty: Dict[str, set] = {}
+        # absolute save path -> name of the tab that changed it
+        self.dirty_paths: Dict[tuple, str] = {}
+        self._tracked = set()
+        # bumped on every tab edit (lets views tell whether they are behind)
+        self.edit_count = 0
+        # bumped on every load_into_tabs (the data or parts of it were replaced)
+        self.load_count = 0
+        self._data = None
+        self._sources: Dict[str, tuple] = {}
+        for name, tab in tabs.items():
+            signal = getattr(tab, 'data_edited', None)
+            if signal is None:
+                continue
+            try:
+                signal.connect(lambda path, n=name: self.mark_dirty(n, path))
+                self._tracked.add(name)
+            except Exception:
+                pass
+
+    # --- dirty tracking ----------------------------------------------------
+
+    def mark_dirty(self, tab_name: str, path: Optional[Iterable[Any]] = None):
+        """Record an edit made in tab_name at path (relative to the tab's data)."""
+        rel = tuple(path) if path else ()
+        self.edit_count += 1
+        self.dirty.setdefault(tab_name, set()).add(rel)
+        src = self._sources.get(tab_name)
+        if src is None:
+            return
+        # paths are relative to the payload the tab was given; tabs that narrow
+        # it further (profile) are recorded at their source path
+        tab_data = getattr(self.tabs.get(tab_name), 'data', None)
+        src_data = get_by_path(self._data, list(src))
+        if tab_data is not src_data:
+            # character gets {'state': state}: its paths start with that key
+            wrapped = (src and rel[:1] == src[-1:] and isinstance(tab_data, dict)
+                       and tab_data.get(src[-1]) is src_data)
+            rel = rel[1:] if wrapped else ()
+        self.dirty_paths[src + rel] = tab_name
+
+    def is_dirty(self, tab_name: Optional[str] = None) -> bool:
+        if tab_name is None:
+            return bool(self.dirty) or bool(self._tracked ^ set(self.tabs))
+        return tab_name not in self._tracked or tab_name in self.dirty
+
+    def clear_dirty(self):
+        self.dirty.clear()
+        self.dirty_paths.clear()
+
+    def stale_tabs(self) -> set:
+        """Tabs showing data that another tab has edited since they were loaded."""
+        stale = set()
+        if not isinstance(self._data, dict):
+            return stale
+        for path, origin in self.dirty_paths.items():
+            stale |= self.tabs_for_changes(self._data, [path]) - {origin}
+        return stale
     
-    def load_into_tabs(self, data: Dict[str, Any]):
-        """Load save data into appropriate tabs"""
+    def source_paths(self, data: Dict[str, Any]) -> Dict[str, tuple]:
+        """Map each tab to the path of the subtree load_into_tabs gives it ('()' = whole save)."""
+        paths = {}
+        if not isinstance(data, dict):
+            return paths
+        has_state = isinstance(data.get('state'), dict)
+        if 'character' in self.tabs and 'state' in data:
+            paths['character'] = ('state',)
+        if 'items' in self.tabs:
+            if 'shared' in data and isinstance(data['shared'], dict):
+                paths['items'] = ()
+            else:
+                paths['items'] = ('state',) if 'state' in data else ()
+        for tab_name in ['progression', 'stats', 'world', 'unlockables', 'profile']:
+            if tab_name not in self.tabs:
+                continue
+            if has_state and tab_name in data['state']:
+                paths[tab_name] = ('state', tab_name)
+            elif tab_name in data:
+                paths[tab_name] = (tab_name,)
+            elif tab_name == 'profile' and any(k in data for k in ('inputprefs', 'ui', 'onlineprefs', 'domains', 'shared')):
+                paths[tab_name] = ()
+        return paths
+
+    def tabs_for_changes(self, data: Dict[str, Any], changed: Iterable[tuple]) -> set:
+        """Names of tabs whose source subtree overlaps any of the changed paths."""
+        changed = list(changed)
+        affected = set()
+        for tab_name, src in self.source_paths(data).items():
+            for p in changed:
+                n = min(len(p), len(src))
+                if p[:n] == src[:n]:
+                    affected.add(tab_name)
+                    break
+        return affected
+
+    @trace.traced('controller.load_into_tabs', 'Tabs')
+    def load_into_tabs(self, data: Dict[str, Any], only: Optional[Iterable[str]] = None):
+        """Load save data into appropriate tabs (only the named ones, if given)"""
         if not isinstance(data, dict):
             logger.warning("Data is not a dictionary")
             return
+        only = None if only is None else set(only)
+        self.load_count += 1
+        self._data = data
+        self._sources = self.source_paths(data)
+        if only is None:
+            self.clear_dirty()
+        else:
+            for name in only:
+                self.dirty.pop(name, None)
         # Load character data (state goes to character)
-        if 'character' in self.tabs and 'state' in data:
+        if 'character' in self.tabs and 'state' in data and (only is None or 'character' in only):
             try:
-                self.tabs['character'].load_data({'state': data['state']})
+                with trace.span('tab.character.load_data', 'Tabs'):
+                    self.tabs['character'].load_data({'state': data['state']})
                 logger.info("Loaded character data")
             except Exception as e:
                 logger.warning(f"Character tab load failed: {e}")
@@ -25,20 +137,21 @@ class TabController:
         state_root = data.get('state', data)
 
         # Load items data - pass the full state/profile dict so ItemsTab can preserve originals
-        if 'items' in self.tabs:
+        if 'items' in self.tabs and (only is None or 'items' in only):
             try:
                 # if this is a profile save, items may live under data['shared']
-                if 'shared' in data and isinstance(data['shared'], dict):
-                    self.tabs['items'].load_data(data)
-                else:
-                    self.tabs['items'].load_data(state_root)
+                with trace.span('tab.items.load_data', 'Tabs'):
+                    if 'shared' in data and isinstance(data['shared'], dict):
+                        self.tabs['items'].load_data(data)
+                    else:
+                        self.tabs['items'].load_data(state_root)
                 logger.info("Loaded items data")
             except Exception as e:
                 logger.warning(f"Items tab load failed: {e}")
 
         # Load other tab data (search both top-level and state)
         for tab_name in ['progression', 'stats', 'world', 'unlockables', 'profile']:
-            if tab_name in self.tabs:
+            if tab_name in self.tabs and (only is None or tab_name in only):
                 # prefer state_root then top-level
                 payload = None
                 if isinstance(state_root, dict) and tab_name in state_root:
@@ -54,17 +167,27 @@ class TabController:
 
                 if payload is not None and hasattr(self.tabs[tab_name], 'load_data'):
                     try:
-                        self.tabs[tab_name].load_data(payload)
+                        with trace.span(f'tab.{tab_name}.load_data', 'Tabs'):
+                            self.tabs[tab_name].load_data(payload)
                         logger.info(f"Loaded {tab_name} data")
                     except Exception as e:
                         logger.warning(f"Failed loading {tab_name}: {e}")
     
-    def save_from_tabs(self, data: Dict[str, Any]):
-        """Collect data from tabs back into the main data structure"""
+    @trace.traced('controller.save_from_tabs', 'Tabs')
+    def save_from_tabs(self, data: Dict[str, Any], only_dirty: bool = True) -> List[str]:
+        """Collect data from tabs back into the main data structure.
+
+        Clean tabs are skipped unless only_dirty is False. Returns the names
+        of the tabs that were merged.
+        """
+        merged = []
         for tab_name, tab_instance in self.tabs.items():
+            if only_dirty and not self.is_dirty(tab_name):
+                continue
             if hasattr(tab_instance, 'save_data'):
                 try:
-                    tab_data = tab_instance.save_data()
+                    with trace.span(f'tab.{tab_name}.save_data', 'Tabs'):
+                        tab_data = tab_instance.save_data()
                     if tab_data:
                         # Merge tab data back into main data
                         if tab_name == 'character':
@@ -72,12 +195,23 @@ class TabController:
                             if isinstance(tab_data, dict) and 'state' in tab_data:
                                 data['state'] = tab_data['state']
                         elif tab_name == 'items':
-                            # Items tab returns the full modified data structure
-                            if isinstance(tab_data, dict):
+                            # Items tab edits the loaded dicts in place; only merge
+                            # when it holds a structure that is not part of data
+                            if isinstance(tab_data, dict) and tab_data is not data and tab_data is not data.get('state'):
                                 data.update(tab_data)
                         else:
-                            # Other tabs return their section data directly
-                            data[tab_name] = tab_data
-                        logger.debug(f"Saved data from {tab_name} tab")
+                            # Other tabs return their section data directly; write it
+                            # back where it was loaded from (nothing to do if in place)
+                            src = self._sources.get(tab_name) if data is self._data else None
+                            if src:
+                                if get_by_path(data, list(src)) is not tab_data:
+                                    set_by_path(data, list(src), tab_data)
+                            elif src is None:
+                                data[tab_name] = tab_data
+                        merged.append(tab_name)
+                        logger.debug("Saved data from %s tab", tab_name)
                 except Exception as e:
                     logger.error(f"Error saving data from {tab_name} tab: {e}")
+        for tab_name in merged:
+            self.dirty.pop(tab_name, None)
+        return merged
@@ -1,42 +1,117 @@
-import subprocess
+import os, subprocess, tempfile
+from bl4_editor.core import savcrypt
+from bl4_editor.core import settings as core_settings
+from bl4_editor.core import trace
+
+# 'auto' tries the in-process codec first and falls back to the CLI
+BACKENDS = ('auto', 'native', 'cli')
+
+def default_exe_path():
+    # prefer bundled exe in workspace if present
+    exe = os.path.join(os.getcwd(), 'bl4-crypt-cli.exe')
+    return exe if os.path.exists(exe) else 'bl4-crypt-cli'
 
 class CryptWrapper:
-    def __init__(self, exe_path='bl4-crypt-cli.exe', logger=None):
+    def __init__(self, exe_path='bl4-crypt-cli.exe', logger=None, backend=None):
         self.exe_path = exe_path
         self.logger = logger
+        if backend is None:
+            backend = core_settings.get_setting('crypt_backend', 'auto')
+        self.backend = backend if backend in BACKENDS else 'auto'
 
-    def decrypt(self, input_file, output_file, userid=None):
-        args = [self.exe_path, 'decrypt', '-i', str(input_file), '-o', str(output_file)]
-        if userid:
-            args.extend(['-u', str(userid)])
-        if self.logger:
-            self.logger.debug(f'[Crypt] Args: {args}', category='Crypt')
+    @trace.traced('crypt.decrypt', 'Crypt')
+    def decrypt_bytes(self, input_file, userid=None, sav_bytes=None):
+        """Decrypt a .sav and return the YAML bytes (None on failure).
+
+        sav_bytes: the file's contents if the caller already read them (the
+        in-process backend then does not read input_file again).
+        """
+        if self.backend != 'cli':
+            try:
+                if sav_bytes is None:
+                    with open(input_file, 'rb') as f:
+                        sav_bytes = f.read()
+                out = savcrypt.decrypt_sav(sav_bytes, userid)
+                if self.logger:
+                    self.logger.debug('Decrypted %s in-process (%d bytes)', input_file, len(out), category='Crypt')
+                return out
+            except (OSError, savcrypt.SavCryptError) as e:
+                if self.backend == 'native':
+                    if self.logger: self.logger.error('In-process decrypt failed: %s', e, category='Crypt')
+                    return None
+                if self.logger: self.logger.debug('In-process decrypt failed, using CLI: %s', e, category='Crypt')
+        fd, tmp_path = tempfile.mkstemp(suffix='.yaml')
+        os.close(fd)
         try:
-            proc = subprocess.run(args, capture_output=True, text=True)
-        except FileNotFoundError as e:
-            if self.logger: self.logger.error(f'Crypt executable not found: {e}', category='Crypt')
-            return False
-        if proc.returncode != 0:
-            if self.logger: self.logger.error(proc.stderr.strip(), category='Crypt')
+            if not self._run_cli('decrypt', input_file, tmp_path, userid):
+                return None
+            with open(tmp_path, 'rb') as f:
+                return f.read()
+        finally:
+            try:
+                os.unlink(tmp_path)
+            except Exception:
+                pass
+
+    @trace.traced('crypt.encrypt', 'Crypt')
+    def encrypt_bytes(self, yaml_bytes, output_file, userid=None):
+        """Encrypt YAML bytes and write the .sav to output_file."""
+        if self.backend != 'cli':
+            try:
+                raw = savcrypt.encrypt_sav(yaml_bytes, userid)
+                with open(output_file, 'wb') as f:
+                    f.write(raw)
+                if self.logger:
+                    self.logger.debug('Encrypted %s in-process (%d bytes)', output_file, len(raw), category='Crypt')
+                return True
+            except (OSError, savcrypt.SavCryptError) as e:
+                if self.backend == 'native':
+                    if self.logger: self.logger.error('In-process encrypt failed: %s', e, category='Crypt')
+                    return False
+                if self.logger: self.logger.debug('In-process encrypt failed, using CLI: %s', e, category='Crypt')
+        fd, tmp_path = tempfile.mkstemp(suffix='.yaml')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(yaml_bytes)
+            return self._run_cli('encrypt', tmp_path, output_file, userid)
+        finally:
+            try:
+                os.unlink(tmp_path)
+            except Exception:
+                pass
+
+    def decrypt(self, input_file, output_file, userid=None):
+        if self.backend == 'cli':
+            return self._run_cli('decrypt', input_file, output_file, userid)
+        data = self.decrypt_bytes(input_file, userid=userid)
+        if data is None:
             return False
-        if self.logger and proc.stdout.strip():
-            self.logger.debug(proc.stdout.strip(), category='Crypt')
+        with open(output_file, 'wb') as f:
+            f.write(data)
         return True
 
     def encrypt(self, input_file, output_file, userid=None):
-        args = [self.exe_path, 'encrypt', '-i', str(input_file), '-o', str(output_file)]
+        if self.backend == 'cli':
+            return self._run_cli('encrypt', input_file, output_file, userid)
+        with open(input_file, 'rb') as f:
+            data = f.read()
+        return self.encrypt_bytes(data, output_file, userid=userid)
+
+    @trace.traced('crypt.cli', 'Crypt')
+    def _run_cli(self, mode, input_file, output_file, userid=None):
+        args = [self.exe_path, mode, '-i', str(input_file), '-o', str(output_file)]
         if userid:
             args.extend(['-u', str(userid)])
         if self.logger:
-            self.logger.debug(f'[Crypt] Args: {args}', category='Crypt')
+            self.logger.debug('Args: %s', args, category='Crypt')
         try:
             proc = subprocess.run(args, capture_output=True, text=True)
         except FileNotFoundError as e:
-            if self.logger: self.logger.error(f'Crypt executable not found: {e}', category='Crypt')
+            if self.logger: self.logger.error('Crypt executable not found: %s', e, category='Crypt')
             return False
         if proc.returncode != 0:
-            if self.logger: self.logger.error(proc.stderr.strip(), category='Crypt')
+            if self.logger: self.logger.error('%s', proc.stderr.strip(), category='Crypt')
             return False
         if self.logger and proc.stdout.strip():
-            self.logger.debug(proc.stdout.strip(), category='Crypt')
+            self.logger.debug('%s', proc.stdout.strip(), category='Crypt')
         return True
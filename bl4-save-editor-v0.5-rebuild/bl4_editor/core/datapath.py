@@ -0,0 +1,125 @@
+from typing import Any, List
+
+
+def parse_path(text: str) -> List[Any]:
+    """Split a dotted path like 'state.experience.0.level' into keys.
+
+    Purely numeric segments become ints so they can index lists.
+    """
+    parts = []
+    for p in str(text).split('.'):
+        if p == '':
+            continue
+        parts.append(int(p) if p.lstrip('-').isdigit() else p)
+    return parts
+
+
+def format_path(path: List[Any]) -> str:
+    return '.'.join(str(p) for p in path)
+
+
+def get_by_path(data: Any, path: List[Any], default: Any = None) -> Any:
+    cur = data
+    for p in path:
+        if isinstance(cur, dict):
+            if p in cur:
+                cur = cur[p]
+            elif str(p) in cur:
+                cur = cur[str(p)]
+            else:
+                return default
+        elif isinstance(cur, list) and isinstance(p, int) and -len(cur) <= p < len(cur):
+            cur = cur[p]
+        else:
+            return default
+    return cur
+
+
+def relative_path(data: Any, path: List[Any], root: Any):
+    """path with the part leading from data to the object root removed.
+
+    root is found by identity along path (e.g. the subtree a tab was given);
+    returns None when path does not pass through it.
+    """
+    cur = data
+    for i in range(len(path) + 1):
+        if cur is root:
+            return list(path[i:])
+        if i == len(path):
+            break
+        key = path[i]
+        if isinstance(cur, dict) and key in cur:
+            cur = cur[key]
+        elif isinstance(cur, list) and isinstance(key, int) and 0 <= key < len(cur):
+            cur = cur[key]
+        else:
+            break
+    return None
+
+
+def set_by_path(data: Any, path: List[Any], value: Any) -> bool:
+    if data is None or not path:
+        return False
+    cur = data
+    for p in path[:-1]:
+        if isinstance(cur, dict):
+            cur = cur.setdefault(p, {})
+        elif isinstance(cur, list) and isinstance(p, int):
+            while p >= len(cur):
+                cur.append({})
+            cur = cur[p]
+        else:
+            return False
+    last = path[-1]
+    if isinstance(cur, dict):
+        cur[last] = value
+        return True
+    if isinstance(cur, list) and isinstance(last, int):
+        while last >= len(cur):
+            cur.append(None)
+        cur[last] = value
+        return True
+    return False
+
+
+def diff_paths(old: Any, new: Any, depth: int = 2, _path: tuple = ()) -> List[tuple]:
+    """Paths (tuples) where new differs from old, descending `depth` dict levels.
+
+    Below that depth whole subtrees are compared with ==, so a change deep in
+    state.inventory is reported as ('state', 'inventory').
+    """
+    if depth > 0 and isinstance(old, dict) and isinstance(new, dict):
+        changed = []
+        for k in old:
+            if k not in new:
+                changed.append(_path + (k,))
+        for k, v in new.items():
+            if k not in old:
+                changed.append(_path + (k,))
+            elif old[k] is not v:
+                changed.extend(diff_paths(old[k], v, depth - 1, _path + (k,)))
+        return changed
+    if old is new or (type(old) is type(new) and old == new):
+        return []
+    return [_path]
+
+
+def apply_paths(target: dict, source: dict, paths: List[tuple]) -> None:
+    """Copy each path from source into target (deleting it where source lacks it).
+
+    Used with diff_paths so that unchanged subtrees of target keep their
+    identity. The empty path cannot be applied; callers replace the root.
+    """
+    for path in paths:
+        if not path:
+            continue
+        dst = get_by_path(target, list(path[:-1]))
+        src = get_by_path(source, list(path[:-1]))
+        key = path[-1]
+        if not isinstance(dst, dict):
+            set_by_path(target, list(path), get_by_path(source, list(path)))
+            continue
+        if isinstance(src, dict) and key in src:
+            dst[key] = src[key]
+        else:
+            dst.pop(key, None)
@@ -1,8 +1,17 @@
 import os, tempfile, shutil, subprocess, yaml, time
 from bl4_editor.core import crypt as crypt_mod
-from bl4_editor.core import logger
+from bl4_editor.core import logger, trace, parse_cache
 
-class PatchedLoader(yaml.FullLoader):
+# use the libyaml-backed parser/emitter when PyYAML was built with it; the
+# constructor/representer layers are the same Python classes either way
+try:
+    from yaml import CFullLoader as _BaseLoader, CSafeDumper as _BaseDumper
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import FullLoader as _BaseLoader, SafeDumper as _BaseDumper
+    HAS_LIBYAML = False
+
+class PatchedLoader(_BaseLoader):
     pass
 
 def _unknown_tag_constructor(loader, tag_suffix, node):
@@ -17,43 +26,133 @@ def _unknown_tag_constructor(loader, tag_suffix, node):
 
 yaml.add_multi_constructor('!', _unknown_tag_constructor, Loader=PatchedLoader)
 
-def open_file(path, userid=None):
-    path = os.path.abspath(path)
-    # ensure local temp folder exists in workspace
+def _workspace_temp():
+    # local temp folder in workspace, only created when a copy is requested
     workspace_temp = os.path.join(os.getcwd(), 'temp')
     os.makedirs(workspace_temp, exist_ok=True)
+    return workspace_temp
+
+def open_file(path, userid=None, materialize=False, use_cache=None):
+    """Open a .yaml/.yml or .sav and return (yaml_path, data).
 
+    YAML is parsed straight from the source file and .sav files are decrypted
+    and parsed in memory. Only when `materialize` is True is a working copy
+    written to ./temp; yaml_path is then that copy. Otherwise yaml_path is the
+    source for YAML files and None for .sav files.
+
+    Parsed data is cached by file content (see parse_cache), so re-opening an
+    unchanged file skips decryption and parsing. use_cache defaults to the
+    'parse_cache_enabled' setting.
+    """
+    path = os.path.abspath(path)
+    if use_cache is None:
+        use_cache = parse_cache.enabled()
+    with trace.span('fileio.open_file', 'IO', path=os.path.basename(path)):
+        return _open_file(path, userid, materialize, use_cache)
+
+def _open_file(path, userid, materialize, use_cache):
     if path.lower().endswith(('.yaml','.yml')):
+        with open(path, 'rb') as f:
+            src = f.read()
+        key = parse_cache.make_key(src) if use_cache else None
+        data = parse_cache.get(key) if key else None
+        if data is None:
+            with trace.span('yaml.parse', 'IO'):
+                data = yaml.load(src, Loader=PatchedLoader)
+            if key:
+                parse_cache.put(key, data)
+        if not materialize:
+            return path, data
         # copy YAML into workspace temp for editing
         base = os.path.basename(path)
         # add timestamp to avoid clobbering
-        dest = os.path.join(workspace_temp, f"{int(time.time())}_{base}")
+        dest = os.path.join(_workspace_temp(), f"{int(time.time())}_{base}")
         shutil.copy2(path, dest)
-        with open(dest, 'r', encoding='utf-8') as f:
-            data = yaml.load(f, Loader=PatchedLoader)
         return dest, data
     if path.lower().endswith('.sav'):
         if not userid:
             raise RuntimeError("UserID required to open .sav")
-        tmp = os.path.join(workspace_temp, os.path.basename(path) + '.yaml')
-        # prefer bundled exe in workspace if present
-        exe = os.path.join(os.getcwd(), 'bl4-crypt-cli.exe') if os.path.exists(os.path.join(os.getcwd(),'bl4-crypt-cli.exe')) else 'bl4-crypt-cli'
-        crypt = crypt_mod.CryptWrapper(exe_path=exe, logger=logger)
-        ok = crypt.decrypt(path, tmp, userid=userid)
-        if not ok:
+        key = None
+        sav_bytes = None
+        # a working copy needs the decrypted bytes, so only plain opens use the cache
+        if use_cache and not materialize:
+            with open(path, 'rb') as f:
+                sav_bytes = f.read()
+            key = parse_cache.make_key(sav_bytes, userid)
+            data = parse_cache.get(key)
+            if data is not None:
+                return None, data
+        crypt = crypt_mod.CryptWrapper(exe_path=crypt_mod.default_exe_path(), logger=logger)
+        # on a cache miss the bytes read for the key are decrypted as they are
+        raw = crypt.decrypt_bytes(path, userid=userid, sav_bytes=sav_bytes)
+        if raw is None:
             raise RuntimeError('Decryption failed (see logs)')
-        with open(tmp, 'r', encoding='utf-8') as f:
-            data = yaml.load(f, Loader=PatchedLoader)
+        with trace.span('yaml.parse', 'IO'):
+            data = yaml.load(raw, Loader=PatchedLoader)
+        if key:
+            parse_cache.put(key, data)
+        if not materialize:
+            return None, data
+        tmp = os.path.join(_workspace_temp(), os.path.basename(path) + '.yaml')
+        with open(tmp, 'wb') as f:
+            f.write(raw)
         return tmp, data
     raise RuntimeError('Unsupported file type')
 
 
-def safe_write_yaml(path, data, atomic=True, make_backup=False):
+def _open_one(path, userid, materialize, use_cache=False):
+    # module-level so it can be pickled into worker processes
+    try:
+        yaml_path, data = open_file(path, userid=userid, materialize=materialize, use_cache=use_cache)
+        return path, yaml_path, data, None
+    except Exception as e:
+        return path, None, None, f'{type(e).__name__}: {e}'
+
+def open_many(paths, userid=None, workers=None, materialize=False, use_cache=False):
+    """Open many files in parallel, yielding results as they complete.
+
+    Decryption and YAML parsing run in a ProcessPoolExecutor so they scale
+    across cores. Yields (path, yaml_path, data, error) tuples in completion
+    order; error is None on success, otherwise a message and data is None.
+    workers defaults to the CPU count; 1 opens the files in this process.
+    Batch opens bypass the parse cache unless use_cache is True.
+    """
+    paths = list(paths)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(paths)))
+    if workers == 1:
+        for p in paths:
+            yield _open_one(p, userid, materialize, use_cache)
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    # spawned workers log to the console only (no log file per process)
+    with ProcessPoolExecutor(max_workers=workers, initializer=logger.init, initargs=(None, False)) as pool:
+        futures = [pool.submit(_open_one, p, userid, materialize, use_cache) for p in paths]
+        for fut in as_completed(futures):
+            yield fut.result()
+
+
+class NoAliasDumper(_BaseDumper):
+    # every object gets its own node, so shared references are written out
+    # in full instead of as anchors/aliases (no copy of the data needed)
+    def ignore_aliases(self, _data):
+        return True
+
+
+def safe_dump_yaml(data):
+    """Return YAML text for data using the same no-alias rules as safe_write_yaml."""
+    with trace.span('yaml.dump', 'IO'):
+        return yaml.dump(data, Dumper=NoAliasDumper, sort_keys=False, allow_unicode=True)
+
+
+def safe_write_yaml(path, data, atomic=True, make_backup=False, text=None):
     """Write YAML to path while preventing PyYAML from emitting anchors/aliases.
 
-    To avoid emitting YAML anchors (e.g. "&id001"), we normalize the data
-    by round-tripping through JSON where possible to break shared object
-    identity. We then dump using a dumper that ignores aliases.
+    The live structure is serialized directly with a dumper that ignores
+    aliases, so no anchors (e.g. "&id001") are emitted and no copy of the data
+    is built. Types the safe representer does not support raise
+    yaml.representer.RepresenterError instead of being coerced.
 
     Parameters:
     - path: destination file path
@@ -63,32 +162,19 @@ def safe_write_yaml(path, data, atomic=True, make_backup=False):
               directly to `path`.
     - make_backup: if True and the destination exists, create a timestamped
                    backup before replacing it.
+    - text: YAML already produced by safe_dump_yaml(data); written as is
+            instead of dumping data a second time.
     """
-    class NoAliasDumper(yaml.SafeDumper):
-        def ignore_aliases(self, _data):
-            return True
-
-    # Try to normalize via JSON to break Python object identity which causes
-    # PyYAML to emit anchors. Fall back to a deepcopy if JSON fails.
-    norm = None
-    try:
-        import json
-        norm = json.loads(json.dumps(data))
-    except Exception:
-        # fallback: use yaml round-trip to get a fresh structure
-        try:
-            norm = yaml.load(yaml.dump(data), Loader=PatchedLoader)
-        except Exception:
-            # last resort: deepcopy
-            import copy
-            norm = copy.deepcopy(data)
-
     dest_dir = os.path.dirname(os.path.abspath(path)) or '.'
     os.makedirs(dest_dir, exist_ok=True)
 
     def _write_to(pth):
-        with open(pth, 'w', encoding='utf-8') as f:
-            yaml.dump(norm, f, Dumper=NoAliasDumper, sort_keys=False, allow_unicode=True)
+        if text is not None:
+            with open(pth, 'w', encoding='utf-8') as f:
+                f.write(text)
+            return
+        with open(pth, 'w', encoding='utf-8') as f, trace.span('yaml.dump', 'IO', path=os.path.basename(path)):
+            yaml.dump(data, f, Dumper=NoAliasDumper, sort_keys=False, allow_unicode=True)
 
     if atomic:
         # prepare temp file in same directory for atomic replace
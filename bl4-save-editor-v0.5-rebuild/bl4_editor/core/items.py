@@ -0,0 +1,328 @@
+"""Item locations in a save and bulk operations on them (no Qt required).
+
+collect_items() finds the item dicts of a character state or profile save
+and returns them per section as ItemRefs. The bulk functions mutate the
+item dicts and their containers in one pass per call, grouping work per
+container, and return the refs they created or removed, so a view can
+update its row list once per batch:
+
+    sections = items.collect_items(data['state'])
+    rows, _target = sections['backpack']
+    picked = [r for r in rows if r.item.get('state_flags') == 1]
+    items.set_flags(picked, 3)
+    items.delete_items(picked[:10])
+
+This also works from `python -m bl4_editor.cli edit --script`.
+"""
+import copy
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+SECTIONS = ('backpack', 'equipped', 'bank', 'unknown')
+
+Container = Union[dict, list]
+# the container new items go to (or a callable creating it on first use); None: read-only
+Target = Optional[Union[Container, Callable[[], Container]]]
+
+
+class ItemRef:
+    """One row: an item dict plus where it lives in the save.
+
+    `container[ckey] is item` for dict containers. Items in list containers
+    are found by identity (ckey is None), so refs stay valid when other rows
+    are removed; their `key` is only a label (see relabel()).
+    """
+    __slots__ = ('key', 'item', 'container', 'ckey')
+
+    def __init__(self, key: str, item: dict, container: Union[dict, list], ckey: Any):
+        self.key = key
+        self.item = item
+        self.container = container
+        self.ckey = ckey
+
+    def detach(self) -> bool:
+        """Remove the item from its container."""
+        c = self.container
+        if isinstance(c, dict):
+            if c.get(self.ckey) is self.item:
+                del c[self.ckey]
+                return True
+            return False
+        if isinstance(c, list):
+            for i, x in enumerate(c):
+                if x is self.item:
+                    del c[i]
+                    return True
+        return False
+
+
+def free_slot(container: dict, prefix: str = 'slot') -> str:
+    n = len(container)
+    while f'{prefix}_{n}' in container:
+        n += 1
+    return f'{prefix}_{n}'
+
+
+def resolve_target(target: Target) -> Optional[Container]:
+    return target() if callable(target) else target
+
+
+def insert_item(container: Container, item: dict, key_hint: str = 'slot') -> Optional[ItemRef]:
+    """Add item to a dict (next free slot_N key) or list container."""
+    if isinstance(container, dict):
+        ckey = free_slot(container, 'slot')
+        container[ckey] = item
+        return ItemRef(ckey, item, container, ckey)
+    if isinstance(container, list):
+        container.append(item)
+        return ItemRef(f'{key_hint}_{len(container) - 1}', item, container, None)
+    return None
+
+
+def relabel(refs: Iterable[ItemRef]) -> int:
+    """Renumber the labels of list-held refs to their current positions.
+
+    Call after items were removed from a list (unknown_3 becomes unknown_2
+    once an earlier item is gone); returns how many labels changed.
+    """
+    positions: Dict[int, Dict[int, int]] = {}
+    changed = 0
+    for ref in refs:
+        c = ref.container
+        if not isinstance(c, list):
+            continue
+        pos = positions.get(id(c))
+        if pos is None:
+            pos = positions[id(c)] = {id(x): i for i, x in enumerate(c)}
+        i = pos.get(id(ref.item))
+        if i is None:
+            continue
+        key = f"{ref.key.rsplit('_', 1)[0]}_{i}"
+        if key != ref.key:
+            ref.key = key
+            changed += 1
+    return changed
+
+
+def key_prefix(rows: List[ItemRef], default: str = 'item') -> str:
+    return rows[-1].key.rsplit('_', 1)[0] if rows else default
+
+
+# --- locating items ---------------------------------------------------------
+
+def ensure_path(root: dict, keys: List[str], leaf_type=dict):
+    """Return root[k0][k1]...; missing/invalid levels are created (for adding items)."""
+    cur = root
+    for i, k in enumerate(keys):
+        want = leaf_type if i == len(keys) - 1 else dict
+        if not isinstance(cur.get(k), want):
+            cur[k] = want()
+        cur = cur[k]
+    return cur
+
+
+def profile_inventory(data: dict):
+    """Return the profile-style inventory dict (shared.inventory or domains.local.shared.inventory)"""
+    try:
+        if 'shared' in data and isinstance(data['shared'], dict):
+            inv = data['shared'].get('inventory', None)
+            if inv is not None:
+                return inv
+    except Exception:
+        pass
+    # check nested domains.local.shared.inventory path used by some exports
+    if 'domains' in data and isinstance(data['domains'], dict):
+        try:
+            local = data['domains'].get('local', {})
+            if isinstance(local, dict) and 'shared' in local and isinstance(local['shared'], dict):
+                return local['shared'].get('inventory', None)
+        except Exception:
+            pass
+    return None
+
+
+def collect_items(data: dict) -> Dict[str, Tuple[List[ItemRef], Target]]:
+    """{section: (rows, target)} for a character state dict or a profile save."""
+    rows = {name: [] for name in SECTIONS}
+    targets = {name: None for name in SECTIONS}
+    if not isinstance(data, dict):
+        return {name: (rows[name], targets[name]) for name in SECTIONS}
+
+    def add(section, key, item_data, container, ckey):
+        rows[section].append(ItemRef(key, item_data, container, ckey))
+
+    # Check for profile-style data first (shared.inventory or domains.local.shared.inventory)
+    inventory = profile_inventory(data)
+
+    if isinstance(inventory, dict):
+        items = inventory.get('items', {})
+        if isinstance(items, dict):
+            bank = items.get('bank', {})
+            if isinstance(bank, dict):
+                for slot, item_data in bank.items():
+                    if isinstance(item_data, dict):
+                        add('bank', slot, item_data, bank, slot)
+        targets['bank'] = lambda inv=inventory: ensure_path(inv, ['items', 'bank'])
+    else:
+        # Character save data
+        # primary inventory path
+        inventory = data.get('inventory', {})
+        if isinstance(inventory, dict):
+            items = inventory.get('items', {})
+            if isinstance(items, dict):
+                # Backpack items
+                backpack = items.get('backpack', {})
+                if isinstance(backpack, dict):
+                    for slot, item_data in backpack.items():
+                        if isinstance(item_data, dict):
+                            add('backpack', slot, item_data, backpack, slot)
+
+                # Unknown items
+                unknown = items.get('unknown_items', [])
+                if isinstance(unknown, list):
+                    for idx, item_data in enumerate(unknown):
+                        if isinstance(item_data, dict):
+                            add('unknown', f'unknown_{idx}', item_data, unknown, None)
+        targets['backpack'] = lambda: ensure_path(data, ['inventory', 'items', 'backpack'])
+        targets['unknown'] = lambda: ensure_path(data, ['inventory', 'items', 'unknown_items'], list)
+
+        # Equipped items: try multiple places and support various layouts
+        equipped_found = False
+
+        def _process_equipped_container(container) -> bool:
+            """Process a container that may hold equipped items in several formats.
+            Returns True if any items were added."""
+            added = False
+            if isinstance(container, dict):
+                # container might map slot -> list or slot -> dict
+                for slot, val in container.items():
+                    if isinstance(val, list):
+                        for idx, item_data in enumerate(val):
+                            if isinstance(item_data, dict):
+                                add('equipped', f'{slot}_{idx}', item_data, val, None)
+                                added = True
+                    elif isinstance(val, dict):
+                        # single item directly stored under slot
+                        add('equipped', f'{slot}_0', val, container, slot)
+                        added = True
+            elif isinstance(container, list):
+                for idx, item_data in enumerate(container):
+                    if isinstance(item_data, dict):
+                        add('equipped', f'item_{idx}', item_data, container, None)
+                        added = True
+            return added
+
+        # 1) state.inventory.equipped_inventory or similar
+        try:
+            state = data.get('state', {})
+            if isinstance(state, dict):
+                inv = state.get('inventory', {})
+                if isinstance(inv, dict):
+                    equipped_inv = inv.get('equipped_inventory') or inv.get('equippedInventory') or inv.get('equipped')
+                    if equipped_inv is not None:
+                        if _process_equipped_container(equipped_inv):
+                            equipped_found = True
+        except Exception:
+            equipped_found = False
+
+        # 2) fallback to top-level equipped_inventory (older layout)
+        if not equipped_found:
+            equipped_inv = data.get('equipped_inventory') or data.get('equippedInventory') or data.get('equipped')
+            if equipped_inv is not None:
+                if _process_equipped_container(equipped_inv):
+                    equipped_found = True
+
+        # 3) lostloot handling (state.lostloot.items)
+        try:
+            lost = None
+            state = data.get('state', {})
+            if isinstance(state, dict):
+                lostloot = state.get('lostloot', {})
+                if isinstance(lostloot, dict):
+                    lost = lostloot.get('items', None)
+            if lost and isinstance(lost, dict):
+                for slot, item_data in lost.items():
+                    if isinstance(item_data, dict):
+                        add('unknown', f'lost_{slot}', item_data, lost, slot)
+        except Exception:
+            pass
+
+    return {name: (rows[name], targets[name]) for name in SECTIONS}
+
+
+# --- bulk operations ----------------------------------------------------------
+
+def set_field(refs: Iterable[ItemRef], field: str, value: Any) -> int:
+    """Set item[field] = value on every ref (None removes the field); returns the count."""
+    n = 0
+    for ref in refs:
+        if value is None:
+            ref.item.pop(field, None)
+        else:
+            ref.item[field] = value
+        n += 1
+    return n
+
+
+def set_flags(refs: Iterable[ItemRef], flags: int) -> int:
+    return set_field(refs, 'state_flags', int(flags))
+
+
+def delete_items(refs: Iterable[ItemRef]) -> List[ItemRef]:
+    """Remove the items from their containers; returns the refs actually removed.
+
+    Dict containers drop the keys; each list container is rebuilt once
+    (instead of one O(n) del per item).
+    """
+    removed = []
+    by_list: Dict[int, Tuple[list, set, list]] = {}
+    for ref in refs:
+        c = ref.container
+        if isinstance(c, dict):
+            if c.get(ref.ckey) is ref.item:
+                del c[ref.ckey]
+                removed.append(ref)
+        elif isinstance(c, list):
+            entry = by_list.setdefault(id(c), (c, set(), []))
+            entry[1].add(id(ref.item))
+            entry[2].append(ref)
+    for c, ids, refs_in in by_list.values():
+        present = {id(x) for x in c}
+        c[:] = [x for x in c if id(x) not in ids]
+        removed.extend(r for r in refs_in if id(r.item) in present)
+    return removed
+
+
+def duplicate_items(refs: Iterable[ItemRef], target: Target, key_hint: str = 'item') -> List[ItemRef]:
+    """Deep-copy the items into the target container; returns the new refs.
+
+    Pass the section's target from collect_items(). Equipped items have none
+    (None: nothing is copied): a copy next to them would be a new slot.
+    """
+    container = resolve_target(target)
+    if container is None:
+        return []
+    added = []
+    for ref in refs:
+        ref_new = insert_item(container, copy.deepcopy(ref.item), key_hint)
+        if ref_new is not None:
+            added.append(ref_new)
+    return added
+
+
+def move_items(refs: Iterable[ItemRef], target: Target, key_hint: str = 'item') -> Tuple[List[ItemRef], List[ItemRef]]:
+    """Move items into the target container; returns (removed refs, new refs).
+
+    The same item dicts are moved (not copied), so e.g. backpack -> bank keeps
+    serial, flags and notes as they are.
+    """
+    container = resolve_target(target)
+    if container is None:
+        return [], []
+    refs = [r for r in refs if r.container is not container]
+    removed = delete_items(refs)
+    added = []
+    for ref in removed:
+        ref_new = insert_item(container, ref.item, key_hint)
+        if ref_new is not None:
+            added.append(ref_new)
+    return removed, added
@@ -1,74 +1,196 @@
-import logging, os, glob, time
+import logging, logging.handlers, os, glob, time, queue, atexit, threading, multiprocessing.util
 from datetime import datetime
 from bl4_editor.core import settings
-LOG_DIR = os.path.join(os.getcwd(), "logs")
-os.makedirs(LOG_DIR, exist_ok=True)
-# cleanup old logs once at startup
-retention_minutes = settings.get_setting("log_retention_minutes", 10)
-try:
-    cutoff = time.time() - (int(retention_minutes) * 60)
-    for p in glob.glob(os.path.join(LOG_DIR, "debug_*.log")):
+# set by init(); nothing touches the disk until then
+LOG_DIR = None
+LOG_FILE = None
+
+# Callers only put records on a queue; a QueueListener thread does the file,
+# console and debug-tab output. Each category logs to a child logger
+# ("BL4SaveEditor.Crypt", ...) so its level can be set on its own, and
+# messages use %-style args so disabled levels are never formatted:
+#     logger.debug('Decrypted %s (%d bytes)', path, n, category='Crypt')
+logger = logging.getLogger("BL4SaveEditor")
+logger.setLevel(logging.DEBUG)
+logger.propagate = False
+
+
+class _CategoryFormatter(logging.Formatter):
+    """Prefixes the message with "[Category] " when the record has one."""
+
+    def format(self, record):
+        cat = getattr(record, "category", None)
+        record.cat_prefix = f"[{cat}] " if cat else ""
+        return super().format(record)
+
+
+class _DebugTabHandler(logging.Handler):
+    """Forwards records to the debug tab (which queues them for the GUI thread)."""
+
+    def emit(self, record):
+        tab = _debug_tab
+        if tab is None:
+            return
         try:
-            if os.path.getmtime(p) < cutoff:
-                os.remove(p)
+            tab.append_log(record.levelname.lower(), record.getMessage(), category=getattr(record, "category", None))
         except Exception:
             pass
-except Exception:
-    pass
-timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-LOG_FILE = os.path.join(LOG_DIR, f"debug_{timestamp}.log")
-logger = logging.getLogger("BL4SaveEditor")
-logger.setLevel(logging.DEBUG)
-# file handler
-fh = logging.FileHandler(LOG_FILE, encoding="utf-8")
-fh.setLevel(logging.DEBUG)
-fmt = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-fh.setFormatter(fmt)
-logger.addHandler(fh)
-# console handler
+
+
+fmt = _CategoryFormatter("%(asctime)s - %(levelname)s - %(cat_prefix)s%(message)s")
+# console handler (the file handler is created by init())
 ch = logging.StreamHandler()
 ch.setLevel(logging.DEBUG)
 ch.setFormatter(fmt)
-logger.addHandler(ch)
+tab_handler = _DebugTabHandler(logging.DEBUG)
+fh = None
+
+_queue = queue.SimpleQueue()
+_queue_handler = None
+_listener = None
+_init_lock = threading.Lock()
+# set in forked children, which log without a file unless init() says otherwise
+_forked = False
+
+
+def init(log_dir=None, to_file=True):
+    """Set up logging: prune old logs, open the log file and start the listener.
+
+    Called automatically by the first log call; call it explicitly to choose
+    the directory or to log without a file (to_file=False, e.g. in worker
+    processes; forked workers default to that). Levels from settings are
+    applied here. Later calls are no-ops.
+    """
+    global LOG_DIR, LOG_FILE, fh, _queue_handler, _listener
+    with _init_lock:
+        if _listener is not None:
+            return
+        handlers = [ch, tab_handler]
+        if to_file:
+            LOG_DIR = log_dir or os.path.join(os.getcwd(), "logs")
+            os.makedirs(LOG_DIR, exist_ok=True)
+            # cleanup old logs once at startup
+            retention_minutes = settings.get_setting("log_retention_minutes", 10)
+            try:
+                cutoff = time.time() - (int(retention_minutes) * 60)
+                for p in glob.glob(os.path.join(LOG_DIR, "debug_*.log")):
+                    try:
+                        if os.path.getmtime(p) < cutoff:
+                            os.remove(p)
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            LOG_FILE = os.path.join(LOG_DIR, f"debug_{timestamp}.log")
+            # file handler
+            fh = logging.FileHandler(LOG_FILE, encoding="utf-8", delay=True)
+            fh.setLevel(logging.DEBUG)
+            fh.setFormatter(fmt)
+            handlers.insert(0, fh)
+        # levels from settings: "log_level" and {"Category": "LEVEL"} in "log_levels"
+        logger.setLevel(_level(settings.get_setting("log_level", "DEBUG")))
+        for cat, lvl in (settings.get_setting("log_levels", {}) or {}).items():
+            _category_logger(cat).setLevel(_level(lvl, logging.NOTSET))
+        _queue_handler = logging.handlers.QueueHandler(_queue)
+        logger.addHandler(_queue_handler)
+        listener = logging.handlers.QueueListener(_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listener = listener
+        atexit.register(_stop, listener)
+        if multiprocessing.parent_process() is not None:
+            # pool workers exit without running atexit; multiprocessing's finalizers do run
+            multiprocessing.util.Finalize(None, _stop, args=(listener,), exitpriority=0)
+
+
+def _stop(listener):
+    # stops once, writing out whatever is still queued
+    if listener._thread is not None:
+        listener.stop()
+
+
+def _reset_in_child():
+    # forked workers (cli/open_many) inherit the parent's listener (without its
+    # thread), its queued records and its log file; drop all of it so the
+    # worker's own init() takes effect and never writes to the parent's file
+    global LOG_FILE, fh, _queue, _queue_handler, _listener, _init_lock, _forked
+    if _queue_handler is not None:
+        logger.removeHandler(_queue_handler)
+    _queue = queue.SimpleQueue()
+    _queue_handler = None
+    _listener = None
+    _init_lock = threading.Lock()
+    fh = None
+    LOG_FILE = None
+    _forked = True
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_in_child)
+
+
+def _level(value, default=logging.DEBUG):
+    if isinstance(value, int):
+        return value
+    lvl = logging.getLevelName(str(value).upper())
+    return lvl if isinstance(lvl, int) else default
+
+
+def set_level(level):
+    """Set the base level for all categories without their own level."""
+    logger.setLevel(_level(level))
+
+
+_category_loggers = {}
+def _category_logger(category):
+    log = _category_loggers.get(category)
+    if log is None:
+        log = _category_loggers[category] = logging.getLogger(f"BL4SaveEditor.{category}")
+    return log
+
+
+def set_category_level(category, level):
+    """Set the level for one category (e.g. set_category_level('Crypt', 'WARNING'))."""
+    _category_logger(category).setLevel(_level(level, logging.NOTSET))
+
+
+def set_console_level(level):
+    """Change the console handler level (e.g. logging.WARNING for headless tools)."""
+    ch.setLevel(level)
+
+
+def flush():
+    """Block until queued records have been written (e.g. before exiting)."""
+    if _listener is not None:
+        _listener.stop()
+        _listener.start()
+
+
 _debug_tab = None
 def set_debug_tab(tab):
     global _debug_tab
     _debug_tab = tab
-def _push_to_tab(level, msg):
-    if _debug_tab:
-        try:
-            # level: debug/info/warning/error ; msg: may be a tuple (text, category) or str
-            if isinstance(msg, tuple) and len(msg) == 2:
-                text, category = msg
-            else:
-                text, category = msg, None
-            _debug_tab.append_log(level.lower(), text, category=category)
-        except Exception:
-            pass
-def debug(msg, category=None):
-    if category:
-        logger.debug(f"[{category}] {msg}")
-    else:
-        logger.debug(msg)
-    _push_to_tab("debug", (msg, category))
-
-def info(msg, category=None):
-    if category:
-        logger.info(f"[{category}] {msg}")
-    else:
-        logger.info(msg)
-    _push_to_tab("info", (msg, category))
-
-def warning(msg, category=None):
-    if category:
-        logger.warning(f"[{category}] {msg}")
-    else:
-        logger.warning(msg)
-    _push_to_tab("warning", (msg, category))
-
-def error(msg, category=None):
-    if category:
-        logger.error(f"[{category}] {msg}")
-    else:
-        logger.error(msg)
-    _push_to_tab("error", (msg, category))
+
+
+def _log(level, msg, args, category):
+    log = _category_logger(category) if category else logger
+    # checked before any formatting happens
+    if log.isEnabledFor(level):
+        if _listener is None:
+            init(to_file=not _forked)
+            if not log.isEnabledFor(level):
+                return
+        log.log(level, msg, *args, extra={"category": category})
+
+
+def debug(msg, *args, category=None):
+    _log(logging.DEBUG, msg, args, category)
+
+def info(msg, *args, category=None):
+    _log(logging.INFO, msg, args, category)
+
+def warning(msg, *args, category=None):
+    _log(logging.WARNING, msg, args, category)
+
+def error(msg, *args, category=None):
+    _log(logging.ERROR, msg, args, category)
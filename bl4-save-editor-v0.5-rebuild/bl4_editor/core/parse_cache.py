@@ -0,0 +1,124 @@
+"""On-disk cache of parsed saves, keyed by file content hash plus UserID.
+
+Re-opening an unchanged .sav or YAML loads a pickle of the parsed structure
+instead of decrypting and parsing again. Entries live in ./temp/parse_cache
+as <key>.pickle; a cache hit touches the file so eviction (oldest mtime first,
+once the folder exceeds 'parse_cache_max_mb') is least-recently-used.
+
+Entries are only ever read back by this editor from its own workspace; they
+are pickles, so do not point the cache at a shared or untrusted folder.
+"""
+import hashlib, os, pickle, tempfile
+from bl4_editor.core import logger, trace
+from bl4_editor.core import settings as core_settings
+
+# bump when the loader changes what parsed data looks like
+CACHE_VERSION = b'1'
+SUFFIX = '.pickle'
+# None: ./temp/parse_cache in the working directory
+CACHE_DIR = None
+
+
+def cache_dir():
+    return CACHE_DIR or os.path.join(os.getcwd(), 'temp', 'parse_cache')
+
+
+def enabled():
+    return bool(core_settings.get_setting('parse_cache_enabled', True))
+
+
+def make_key(raw, userid=None):
+    """Cache key for the source file bytes (and the UserID used to decrypt them)."""
+    h = hashlib.blake2b(CACHE_VERSION, digest_size=20)
+    h.update(b'\0' + str(userid or '').encode('utf-8') + b'\0')
+    h.update(raw)
+    return h.hexdigest()
+
+
+def get(key):
+    """Parsed data stored under key, or None on a miss."""
+    path = os.path.join(cache_dir(), key + SUFFIX)
+    try:
+        with trace.span('cache.load', 'Cache'):
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # truncated or from an incompatible version: drop it and parse again
+        logger.debug('Discarding unreadable cache entry %s: %s', key, e, category='Cache')
+        _remove(path)
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    logger.debug('Cache hit %s', key, category='Cache')
+    return data
+
+
+def put(key, data):
+    """Store data under key (atomically), then evict old entries over the size limit."""
+    directory = cache_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with trace.span('cache.store', 'Cache'):
+            blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=directory)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(blob)
+                os.replace(tmp, os.path.join(directory, key + SUFFIX))
+            except Exception:
+                _remove(tmp)
+                raise
+    except Exception as e:
+        logger.debug('Could not cache %s: %s', key, e, category='Cache')
+        return
+    evict()
+
+
+def evict(max_bytes=None):
+    """Delete least recently used entries until the cache fits in max_bytes."""
+    if max_bytes is None:
+        try:
+            max_bytes = int(float(core_settings.get_setting('parse_cache_max_mb', 256)) * 1024 * 1024)
+        except Exception:
+            max_bytes = 256 * 1024 * 1024
+    entries = []
+    total = 0
+    try:
+        with os.scandir(cache_dir()) as it:
+            for e in it:
+                if e.name.endswith(SUFFIX):
+                    try:
+                        st = e.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, e.path))
+                    total += st.st_size
+    except FileNotFoundError:
+        return 0
+    removed = 0
+    for _mtime, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if _remove(path):
+            removed += 1
+        total -= size
+    if removed:
+        logger.debug('Evicted %d cache entries', removed, category='Cache')
+    return removed
+
+
+def clear():
+    """Remove every cache entry; returns the number removed."""
+    return evict(0)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
@@ -0,0 +1,100 @@
+"""Search query syntax shared by the item table filter and the save search.
+
+A query is a list of space-separated terms that must all match:
+
+    word / "two words"   plain text
+    field:value          text of one field ("field:two words" quotes too)
+    field:=value         exact value, for fields that allow it
+    /regex/  re:regex    regular expression (case-insensitive)
+
+An unknown field prefix is kept as plain text ('a:b'). Each searcher
+chooses its fields, and can turn some of them into its own term kinds
+through parse_field (e.g. numeric item attributes):
+
+    terms = parse_query(text, fields=('key', 'value'), exact_fields=('key',))
+"""
+import re
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+_TOKEN = re.compile(r'(?:(\w+):)?("[^"]*"|/(?:[^/\\]|\\.)*/|\S+)')
+
+
+class Term(NamedTuple):
+    kind: str               # 'text', 'field', 'regex', or a searcher's own kind
+    field: Optional[str]
+    value: Any              # lowercase needle, compiled pattern, or searcher value
+    exact: bool = False
+
+
+def compile_regex(pattern: str, flags: int = 0) -> Term:
+    """A regex Term (case-insensitive); ValueError for a bad pattern."""
+    try:
+        return Term('regex', None, re.compile(pattern, re.IGNORECASE | flags))
+    except re.error as e:
+        raise ValueError(f'bad regex {pattern!r}: {e}') from None
+
+
+def parse_query(text: str, fields: Iterable[str] = (), exact_fields: Iterable[str] = (),
+                aliases: Optional[Dict[str, str]] = None,
+                parse_field: Optional[Callable[[str, str], Optional[Term]]] = None,
+                regex_flags: int = 0) -> List[Term]:
+    """Split a search string into Terms (see the module docstring).
+
+    parse_field(field, value) may return a Term for fields it handles (or
+    raise ValueError); None falls through to the default handling.
+    Raises ValueError for a bad regex.
+    """
+    fields = set(fields)
+    exact_fields = set(exact_fields)
+    aliases = aliases or {}
+    terms = []
+    for field, value in _TOKEN.findall(text or ''):
+        field = field.lower()
+        field = aliases.get(field, field)
+        quoted = len(value) >= 2 and value.startswith('"') and value.endswith('"')
+        if quoted:
+            value = value[1:-1]
+        if field == 're':
+            terms.append(compile_regex(value, regex_flags))
+            continue
+        if not field and not quoted and len(value) > 2 and value.startswith('/') and value.endswith('/'):
+            terms.append(compile_regex(value[1:-1], regex_flags))
+            continue
+        term = parse_field(field, value) if parse_field and field else None
+        if term is not None:
+            terms.append(term)
+        elif field in fields:
+            exact = field in exact_fields and value.startswith('=')
+            if exact:
+                value = value[1:]
+            if value or exact:
+                terms.append(Term('field', field, value.lower(), exact))
+        elif field:
+            # unknown prefix: treat "a:b" as plain text
+            terms.append(Term('text', None, f'{field}:{value}'.lower()))
+        elif value:
+            terms.append(Term('text', None, value.lower()))
+    return terms
+
+
+def narrows(old_terms: List[Term], new_terms: List[Term]) -> bool:
+    """True when new_terms can only match a subset of what old_terms match.
+
+    Each old text/field term needs a new term of the same kind and field
+    whose value contains the old value (or equals it, for exact terms). A
+    raw-string prefix test is not enough: a half-typed 'notes:' or '"fav'
+    parses as literal text.
+    """
+    if not old_terms:
+        return False
+    for old in old_terms:
+        if old.kind not in ('text', 'field'):
+            return False
+        if old.exact:
+            implied = any(new == old for new in new_terms)
+        else:
+            implied = any(new.kind == old.kind and new.field == old.field and old.value in new.value
+                          for new in new_terms)
+        if not implied:
+            return False
+    return True
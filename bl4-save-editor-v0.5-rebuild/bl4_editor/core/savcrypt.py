@@ -0,0 +1,231 @@
+"""In-process codec for BL4 .sav files.
+
+A .sav is the YAML document zlib-compressed, followed by an 8 byte trailer
+(adler32 of the YAML, uncompressed length; both little-endian uint32), PKCS#7
+padded and encrypted with AES-256-ECB. The key is a fixed base key with its
+first 8 bytes XORed against the little-endian SteamID64.
+
+If the `cryptography` package is installed it is used for the AES step,
+otherwise a table-driven pure-Python AES is used.
+"""
+import struct, zlib
+
+BASE_KEY = bytes([
+    0x35, 0xEC, 0x33, 0x77, 0xF3, 0x5D, 0xB0, 0xEA,
+    0xBE, 0x6B, 0x83, 0x11, 0x54, 0x03, 0xEB, 0xFB,
+    0x27, 0x25, 0x64, 0x2E, 0xD5, 0x49, 0x06, 0x29,
+    0x05, 0x78, 0xBD, 0x60, 0xBA, 0x4A, 0xA7, 0x87,
+])
+BLOCK_SIZE = 16
+
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except Exception:
+    Cipher = None
+
+
+class SavCryptError(ValueError):
+    """Raised when a .sav cannot be decoded/encoded in-process."""
+
+
+def derive_key(userid) -> bytes:
+    """Derive the AES key for a SteamID64 userid.
+
+    Only numeric (Steam) ids are supported here; other id kinds raise
+    SavCryptError so callers can fall back to the external CLI.
+    """
+    uid = str(userid or '').strip()
+    if not uid.isdigit():
+        raise SavCryptError('In-process crypt supports SteamID64 user ids only')
+    sid = int(uid).to_bytes(8, 'little', signed=False)
+    key = bytearray(BASE_KEY)
+    for i in range(8):
+        key[i] ^= sid[i]
+    return bytes(key)
+
+
+# --- AES-256 (ECB) ----------------------------------------------------------
+
+def _xtime(a):
+    a <<= 1
+    return (a ^ 0x11B) if a & 0x100 else a
+
+
+def _build_tables():
+    exp = [0] * 512
+    log = [0] * 256
+    x = 1
+    for i in range(255):
+        exp[i] = x
+        log[x] = i
+        x ^= _xtime(x)  # multiply by generator 3
+    for i in range(255, 512):
+        exp[i] = exp[i - 255]
+
+    def mul(a, b):
+        if a == 0 or b == 0:
+            return 0
+        return exp[log[a] + log[b]]
+
+    sbox = [0] * 256
+    inv_sbox = [0] * 256
+    for a in range(256):
+        b = 0 if a == 0 else exp[255 - log[a]]
+        s = b
+        for shift in range(1, 5):
+            s ^= ((b << shift) | (b >> (8 - shift))) & 0xFF
+        s ^= 0x63
+        sbox[a] = s
+        inv_sbox[s] = a
+
+    def rotr(w):
+        return ((w >> 8) | (w << 24)) & 0xFFFFFFFF
+
+    te0 = [(mul(s, 2) << 24) | (s << 16) | (s << 8) | mul(s, 3) for s in sbox]
+    td0 = [(mul(s, 14) << 24) | (mul(s, 9) << 16) | (mul(s, 13) << 8) | mul(s, 11) for s in inv_sbox]
+    te = [te0]
+    td = [td0]
+    for _ in range(3):
+        te.append([rotr(w) for w in te[-1]])
+        td.append([rotr(w) for w in td[-1]])
+    return sbox, inv_sbox, te, td
+
+
+_SBOX, _INV_SBOX, _TE, _TD = _build_tables()
+
+
+def _expand_key(key: bytes):
+    if len(key) != 32:
+        raise SavCryptError('AES-256 key must be 32 bytes')
+    nk, rounds = 8, 14
+    w = list(struct.unpack('>8I', key))
+    rcon = 1
+    for i in range(nk, 4 * (rounds + 1)):
+        t = w[i - 1]
+        if i % nk == 0:
+            t = ((t << 8) & 0xFFFFFFFF) | (t >> 24)
+            t = (_SBOX[t >> 24] << 24) | (_SBOX[(t >> 16) & 255] << 16) | (_SBOX[(t >> 8) & 255] << 8) | _SBOX[t & 255]
+            t ^= rcon << 24
+            rcon = _xtime(rcon)
+        elif i % nk == 4:
+            t = (_SBOX[t >> 24] << 24) | (_SBOX[(t >> 16) & 255] << 16) | (_SBOX[(t >> 8) & 255] << 8) | _SBOX[t & 255]
+        w.append(w[i - nk] ^ t)
+    enc = [w[4 * r:4 * r + 4] for r in range(rounds + 1)]
+    # decryption schedule: reversed, with InvMixColumns on the inner rounds
+    td0, td1, td2, td3 = _TD
+    dec = [enc[rounds]]
+    for r in range(rounds - 1, 0, -1):
+        dec.append([td0[_SBOX[k >> 24]] ^ td1[_SBOX[(k >> 16) & 255]] ^ td2[_SBOX[(k >> 8) & 255]] ^ td3[_SBOX[k & 255]] for k in enc[r]])
+    dec.append(enc[0])
+    return enc, dec
+
+
+def _py_encrypt_ecb(key: bytes, data: bytes) -> bytes:
+    enc, _ = _expand_key(key)
+    te0, te1, te2, te3 = _TE
+    sb = _SBOX
+    inner = enc[1:-1]
+    k0, kl = enc[0], enc[-1]
+    words = struct.unpack(f'>{len(data) // 4}I', data)
+    out = []
+    for i in range(0, len(words), 4):
+        s0 = words[i] ^ k0[0]
+        s1 = words[i + 1] ^ k0[1]
+        s2 = words[i + 2] ^ k0[2]
+        s3 = words[i + 3] ^ k0[3]
+        for rk in inner:
+            t0 = te0[s0 >> 24] ^ te1[(s1 >> 16) & 255] ^ te2[(s2 >> 8) & 255] ^ te3[s3 & 255] ^ rk[0]
+            t1 = te0[s1 >> 24] ^ te1[(s2 >> 16) & 255] ^ te2[(s3 >> 8) & 255] ^ te3[s0 & 255] ^ rk[1]
+            t2 = te0[s2 >> 24] ^ te1[(s3 >> 16) & 255] ^ te2[(s0 >> 8) & 255] ^ te3[s1 & 255] ^ rk[2]
+            t3 = te0[s3 >> 24] ^ te1[(s0 >> 16) & 255] ^ te2[(s1 >> 8) & 255] ^ te3[s2 & 255] ^ rk[3]
+            s0, s1, s2, s3 = t0, t1, t2, t3
+        out.append(((sb[s0 >> 24] << 24) | (sb[(s1 >> 16) & 255] << 16) | (sb[(s2 >> 8) & 255] << 8) | sb[s3 & 255]) ^ kl[0])
+        out.append(((sb[s1 >> 24] << 24) | (sb[(s2 >> 16) & 255] << 16) | (sb[(s3 >> 8) & 255] << 8) | sb[s0 & 255]) ^ kl[1])
+        out.append(((sb[s2 >> 24] << 24) | (sb[(s3 >> 16) & 255] << 16) | (sb[(s0 >> 8) & 255] << 8) | sb[s1 & 255]) ^ kl[2])
+        out.append(((sb[s3 >> 24] << 24) | (sb[(s0 >> 16) & 255] << 16) | (sb[(s1 >> 8) & 255] << 8) | sb[s2 & 255]) ^ kl[3])
+    return struct.pack(f'>{len(out)}I', *out)
+
+
+def _py_decrypt_ecb(key: bytes, data: bytes) -> bytes:
+    _, dec = _expand_key(key)
+    td0, td1, td2, td3 = _TD
+    isb = _INV_SBOX
+    inner = dec[1:-1]
+    k0, kl = dec[0], dec[-1]
+    words = struct.unpack(f'>{len(data) // 4}I', data)
+    out = []
+    for i in range(0, len(words), 4):
+        s0 = words[i] ^ k0[0]
+        s1 = words[i + 1] ^ k0[1]
+        s2 = words[i + 2] ^ k0[2]
+        s3 = words[i + 3] ^ k0[3]
+        for rk in inner:
+            t0 = td0[s0 >> 24] ^ td1[(s3 >> 16) & 255] ^ td2[(s2 >> 8) & 255] ^ td3[s1 & 255] ^ rk[0]
+            t1 = td0[s1 >> 24] ^ td1[(s0 >> 16) & 255] ^ td2[(s3 >> 8) & 255] ^ td3[s2 & 255] ^ rk[1]
+            t2 = td0[s2 >> 24] ^ td1[(s1 >> 16) & 255] ^ td2[(s0 >> 8) & 255] ^ td3[s3 & 255] ^ rk[2]
+            t3 = td0[s3 >> 24] ^ td1[(s2 >> 16) & 255] ^ td2[(s1 >> 8) & 255] ^ td3[s0 & 255] ^ rk[3]
+            s0, s1, s2, s3 = t0, t1, t2, t3
+        out.append(((isb[s0 >> 24] << 24) | (isb[(s3 >> 16) & 255] << 16) | (isb[(s2 >> 8) & 255] << 8) | isb[s1 & 255]) ^ kl[0])
+        out.append(((isb[s1 >> 24] << 24) | (isb[(s0 >> 16) & 255] << 16) | (isb[(s3 >> 8) & 255] << 8) | isb[s2 & 255]) ^ kl[1])
+        out.append(((isb[s2 >> 24] << 24) | (isb[(s1 >> 16) & 255] << 16) | (isb[(s0 >> 8) & 255] << 8) | isb[s3 & 255]) ^ kl[2])
+        out.append(((isb[s3 >> 24] << 24) | (isb[(s2 >> 16) & 255] << 16) | (isb[(s1 >> 8) & 255] << 8) | isb[s0 & 255]) ^ kl[3])
+    return struct.pack(f'>{len(out)}I', *out)
+
+
+def aes_ecb_encrypt(key: bytes, data: bytes) -> bytes:
+    if len(data) % BLOCK_SIZE:
+        raise SavCryptError('AES input is not block aligned')
+    if Cipher is not None:
+        enc = Cipher(algorithms.AES(key), modes.ECB()).encryptor()
+        return enc.update(data) + enc.finalize()
+    return _py_encrypt_ecb(key, data)
+
+
+def aes_ecb_decrypt(key: bytes, data: bytes) -> bytes:
+    if len(data) % BLOCK_SIZE:
+        raise SavCryptError('AES input is not block aligned')
+    if Cipher is not None:
+        dec = Cipher(algorithms.AES(key), modes.ECB()).decryptor()
+        return dec.update(data) + dec.finalize()
+    return _py_decrypt_ecb(key, data)
+
+
+# --- .sav container ---------------------------------------------------------
+
+def _pkcs7_pad(data: bytes) -> bytes:
+    n = BLOCK_SIZE - (len(data) % BLOCK_SIZE)
+    return data + bytes([n]) * n
+
+
+def _pkcs7_unpad(data: bytes) -> bytes:
+    if not data:
+        return data
+    n = data[-1]
+    if 1 <= n <= BLOCK_SIZE and data[-n:] == bytes([n]) * n:
+        return data[:-n]
+    # some saves are not padded; leave as-is and let zlib decide
+    return data
+
+
+def decrypt_sav(sav_data: bytes, userid) -> bytes:
+    """Decrypt and decompress raw .sav bytes, returning the YAML bytes."""
+    key = derive_key(userid)
+    plain = _pkcs7_unpad(aes_ecb_decrypt(key, sav_data))
+    try:
+        d = zlib.decompressobj()
+        yaml_bytes = d.decompress(plain) + d.flush()
+    except zlib.error as e:
+        raise SavCryptError(f'Decompression failed (wrong UserID?): {e}')
+    trailer = d.unused_data
+    if len(trailer) >= 8:
+        checksum, length = struct.unpack('<II', trailer[:8])
+        if length != len(yaml_bytes) or checksum != (zlib.adler32(yaml_bytes) & 0xFFFFFFFF):
+            raise SavCryptError('Checksum mismatch in decrypted save')
+    return yaml_bytes
+
+
+def encrypt_sav(yaml_bytes: bytes, userid) -> bytes:
+    """Compress and encrypt YAML bytes into raw .sav bytes."""
+    key = derive_key(userid)
+    packed = zlib.compress(yaml_bytes, 9) + struct.pack('<II', zlib.adler32(yaml_bytes) & 0xFFFFFFFF, len(yaml_bytes))
+    return aes_ecb_encrypt(key, _pkcs7_pad(packed))
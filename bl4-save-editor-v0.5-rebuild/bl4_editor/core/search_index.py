@@ -0,0 +1,230 @@
+"""Flat path -> value index over a loaded save, for global search (no Qt required).
+
+SaveIndex walks the data once (iteratively) and keeps every node below the
+root, containers included, as a path tuple plus two lowercase text blobs
+with one line per node, in document order:
+
+    lines   'state.currencies.cash\\t12345'    (dotted path, tab, value)
+    keys    'cash'                            (last path key)
+
+A query scans a blob with str.find or one compiled regex and maps match
+offsets back to nodes with bisect, so answering it is a few C-level scans
+instead of a walk over the tree, and it stops once `limit` hits are found:
+
+    index = SaveIndex(data)
+    hits, more = index.search('key:cash')
+    hits[0].path        # ('state', 'currencies', 'cash')
+
+The index is a snapshot: build a new one after the data is replaced or edited.
+"""
+import re
+from bisect import bisect_right
+from itertools import accumulate, repeat
+from operator import add
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple
+from bl4_editor.core import query
+from bl4_editor.core.datapath import format_path
+from bl4_editor.core.query import Term
+
+# longer values are indexed by their start only
+MAX_VALUE_CHARS = 1024
+LIMIT = 500
+
+_FIELDS = ('key', 'value', 'path')
+# newlines and tabs separate lines and fields in the blobs
+_CLEAN = str.maketrans('\n\t\r', '   ')
+
+
+class Hit(NamedTuple):
+    path: Tuple[Any, ...]
+    path_text: str
+    value: Any
+
+
+def parse_query(text: str) -> List[Term]:
+    """Split a search string into terms (all must match; syntax in core.query).
+
+    word / "two words"   substring of a node's dotted path or value
+    key:cash  key:=cash  last path key contains / equals
+    value:999 value:=0   scalar value contains / equals (val: works too)
+    path:state.stats     dotted path contains
+    /regex/  re:regex    regular expression over 'path<TAB>value' (case-insensitive)
+    Raises ValueError for a bad regex.
+    """
+    return query.parse_query(text, fields=_FIELDS, exact_fields=('key', 'value'),
+                             aliases={'val': 'value'}, regex_flags=re.MULTILINE)
+
+
+def value_text(value: Any) -> str:
+    """Text a node's value is indexed (and shown) as; '' for containers."""
+    if isinstance(value, (dict, list)):
+        return ''
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _offsets(parts: List[str]) -> List[int]:
+    """Line start offsets in '\n' + '\n'.join(parts) + '\n', plus one past the end."""
+    return list(accumulate(map(add, map(len, parts), repeat(1)), initial=1))
+
+
+def _cleaned(parts: List[str]) -> List[str]:
+    # keys or values containing separators are rare; only then clean per part
+    joined = ''.join(parts)
+    if '\n' in joined or '\t' in joined or '\r' in joined:
+        return [p.translate(_CLEAN) for p in parts]
+    return parts
+
+
+class SaveIndex:
+    """Every node of a save as (path, value), searchable by key, value, path or regex."""
+
+    def __init__(self, data: Any):
+        self.paths: List[Tuple[Any, ...]] = []
+        self._values: List[Any] = []
+        texts = []
+        values = []
+        keys = []
+        # iterative, children pushed in reverse so they pop in document order
+        stack = [((), '', '', data)]
+        while stack:
+            path, text, key, value = stack.pop()
+            if isinstance(value, dict):
+                items = value.items()
+                shown = ''
+            elif isinstance(value, list):
+                items = enumerate(value)
+                shown = ''
+            else:
+                items = None
+                shown = value_text(value)[:MAX_VALUE_CHARS]
+            if path:
+                self.paths.append(path)
+                self._values.append(value)
+                texts.append(text)
+                values.append(shown)
+                keys.append(key)
+            if items is not None:
+                prefix = f'{text}.' if text else ''
+                children = []
+                for k, v in items:
+                    ks = str(k)
+                    children.append((path + (k,), prefix + ks, ks, v))
+                children.reverse()
+                stack.extend(children)
+        texts, values, keys = _cleaned(texts), _cleaned(values), _cleaned(keys)
+        lines = [f'{t}\t{v}' for t, v in zip(texts, values)]
+        # each blob starts and ends with '\n', so '\nx\n' finds an exact line
+        self._lines = ('\n' + '\n'.join(lines) + '\n').lower()
+        self._keys = ('\n' + '\n'.join(keys) + '\n').lower()
+        # offset of each line, plus one past the end (line i ends at starts[i + 1] - 1)
+        self._line_starts = _offsets(lines)
+        self._key_starts = _offsets(keys)
+        # where each line's value starts (after the tab)
+        self._value_starts = [tab + 1 for tab in map(add, self._line_starts, map(len, texts))]
+        # key offsets moved onto the '\n' before each key, for exact key matches
+        self._key_bounds = None
+
+    def __len__(self):
+        return len(self.paths)
+
+    def hit(self, i: int) -> Hit:
+        path = self.paths[i]
+        return Hit(path, format_path(path), self._values[i])
+
+    # --- scanning --------------------------------------------------------------
+
+    def _fields(self, i: int) -> Tuple[str, str, str]:
+        """(path, value, key) of node i as indexed (lowercase)."""
+        lines, starts, v = self._lines, self._line_starts, self._value_starts[i]
+        key = self._keys[self._key_starts[i]:self._key_starts[i + 1] - 1]
+        return lines[starts[i]:v - 1], lines[v:starts[i + 1] - 1], key
+
+    @staticmethod
+    def _scan(starts: List[int], find, after: Optional[List[int]] = None) -> Iterator[int]:
+        """Node numbers whose line has a match; find(pos) returns its offset or None.
+
+        Matches starting before after[i] (if given) are skipped; after the
+        first match in a line the scan continues with the next line.
+        """
+        last = len(starts) - 2
+        start = find(0)
+        while start is not None:
+            i = bisect_right(starts, start) - 1
+            if i > last:
+                return
+            if i < 0:
+                start = find(starts[0])
+                continue
+            if after is not None and start < after[i]:
+                start = find(start + 1)
+                continue
+            yield i
+            start = find(starts[i + 1])
+
+    @staticmethod
+    def _finder(blob: str, needle: str):
+        def find(pos):
+            at = blob.find(needle, pos)
+            return None if at == -1 else at
+        return find
+
+    def _candidates(self, t: Term) -> Iterator[int]:
+        if t.kind == 'regex':
+            def find(pos, blob=self._lines, search=t.value.search):
+                m = search(blob, pos)
+                return None if m is None else m.start()
+            # a match can run past its line (e.g. through \s); keep those within one
+            return (i for i in self._scan(self._line_starts, find) if self._matches(i, t))
+        if t.field == 'key':
+            if t.exact:
+                # an exact match starts on the '\n' before the key
+                if self._key_bounds is None:
+                    self._key_bounds = [s - 1 for s in self._key_starts]
+                return self._scan(self._key_bounds, self._finder(self._keys, f'\n{t.value}\n'))
+            return self._scan(self._key_starts, self._finder(self._keys, t.value))
+        if t.field == 'value':
+            if t.exact:
+                # '\t' only appears between path and value
+                return self._scan(self._line_starts, self._finder(self._lines, f'\t{t.value}\n'))
+            return self._scan(self._line_starts, self._finder(self._lines, t.value), self._value_starts)
+        if t.field == 'path':
+            # a path match has to end before the tab
+            return (i for i in self._scan(self._line_starts, self._finder(self._lines, t.value))
+                    if t.value in self._fields(i)[0])
+        return self._scan(self._line_starts, self._finder(self._lines, t.value))
+
+    def _matches(self, i: int, t: Term) -> bool:
+        path, value, key = self._fields(i)
+        if t.kind == 'regex':
+            return t.value.search(f'{path}\t{value}') is not None
+        if t.field == 'key':
+            return key == t.value if t.exact else t.value in key
+        if t.field == 'value':
+            return value == t.value if t.exact else t.value in value
+        if t.field == 'path':
+            return t.value in path
+        return t.value in path or t.value in value
+
+    def search(self, query: str, limit: int = LIMIT) -> Tuple[List[Hit], bool]:
+        """Nodes matching query (see parse_query) in document order, at most limit.
+
+        Returns (hits, more): more is True when the search stopped at limit.
+        Raises ValueError for an invalid query.
+        """
+        terms = parse_query(query)
+        if not terms:
+            return [], False
+        # scan for the most selective-looking term, check the rest per node
+        first = max(terms, key=lambda t: (t.kind != 'regex', len(getattr(t.value, 'pattern', t.value)), t.exact))
+        rest = [t for t in terms if t is not first]
+        hits = []
+        for i in self._candidates(first):
+            if all(self._matches(i, t) for t in rest):
+                if len(hits) >= limit:
+                    return hits, True
+                hits.append(self.hit(i))
+        return hits, False
@@ -0,0 +1,303 @@
+"""Item serial decoding and an inverted index over decoded items.
+
+A BL4 serial is '@U' followed by Base85 text (RFC 1924 alphabet with '/' in
+place of '|'). The decoded bytes are read with the bits of each byte
+reversed; after a 7-bit header the stream is a sequence of tokens:
+
+    00  separator ('|')         01  soft separator (',')
+    100 varint                  110 varbit (5-bit length, then value)
+    101 part {index[:value]}    111 string (varint length, 7-bit chars)
+
+The ints before the first '|' are the header: the first is the item type
+(which also identifies the manufacturer) and the fourth is the item level.
+Parts follow as {index} / {index:value} / {index:[values]}.
+
+decode() is memoized, so each distinct serial is decoded once. ItemIndex
+maps decoded attributes (type, level, part, flags) to the items having them,
+so filtering thousands of items is a few set intersections.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+PREFIX = '@U'
+ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz!#$%&()*+-;<=>?@^_`{/}~'
+HEADER_BITS = '0010000'
+# distinct serials kept decoded (a large bank plus backpack is well below this)
+CACHE_SIZE = 65536
+
+# optional names for item type ids, e.g. {10: 'Jakobs Pistol'}; ids are shown when missing
+TYPE_NAMES: Dict[int, str] = {}
+
+_B85 = {c: i for i, c in enumerate(ALPHABET)}
+_MIRROR = bytes(int(f'{b:08b}'[::-1], 2) for b in range(256))
+_BITS = tuple(f'{b:08b}' for b in range(256))
+
+
+class SerialError(ValueError):
+    pass
+
+
+class DecodedSerial(NamedTuple):
+    """Fields of one serial; `error` is set (and the rest empty) when it did not decode."""
+    serial: str
+    type_id: Optional[int] = None
+    level: Optional[int] = None
+    header: Tuple[int, ...] = ()
+    parts: Tuple[Tuple[int, Any], ...] = ()
+    text: str = ''
+    error: Optional[str] = None
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None
+
+    @property
+    def type_name(self) -> str:
+        if self.type_id is None:
+            return ''
+        return TYPE_NAMES.get(self.type_id, str(self.type_id))
+
+    @property
+    def part_indexes(self) -> Tuple[int, ...]:
+        return tuple(p[0] for p in self.parts)
+
+
+def b85_decode(text: str) -> bytes:
+    out = bytearray()
+    n = len(text)
+    for i in range(0, n, 5):
+        chunk = text[i:i + 5]
+        try:
+            digits = [_B85[c] for c in chunk]
+        except KeyError as e:
+            raise SerialError(f'invalid character {e.args[0]!r}') from None
+        pad = 5 - len(digits)
+        if pad == 4:
+            raise SerialError('truncated Base85 group')
+        digits.extend([84] * pad)
+        value = 0
+        for d in digits:
+            value = value * 85 + d
+        if value > 0xFFFFFFFF:
+            raise SerialError('Base85 group out of range')
+        out.extend(value.to_bytes(4, 'big')[:4 - pad])
+    return bytes(out)
+
+
+class _Bits:
+    __slots__ = ('bits', 'pos')
+
+    def __init__(self, data: bytes):
+        self.bits = ''.join(_BITS[_MIRROR[b]] for b in data)
+        self.pos = 0
+
+    def read(self, n: int) -> str:
+        if self.pos + n > len(self.bits):
+            raise SerialError('unexpected end of serial')
+        s = self.bits[self.pos:self.pos + n]
+        self.pos += n
+        return s
+
+    def read_int(self, n: int) -> int:
+        # values are stored least significant bit first
+        return int(self.read(n)[::-1], 2) if n else 0
+
+    def done(self) -> bool:
+        # the tail is zero padding up to the byte boundary
+        return '1' not in self.bits[self.pos:]
+
+    def varint(self) -> int:
+        value = shift = 0
+        for _ in range(8):
+            value |= self.read_int(4) << shift
+            shift += 4
+            if self.read(1) == '0':
+                return value
+        raise SerialError('varint too long')
+
+    def varbit(self) -> int:
+        return self.read_int(self.read_int(5))
+
+
+def _read_value(bits: _Bits) -> int:
+    kind = bits.read(3)
+    if kind == '100':
+        return bits.varint()
+    if kind == '110':
+        return bits.varbit()
+    raise SerialError(f'unexpected token {kind} in part value')
+
+
+def _read_part(bits: _Bits) -> Tuple[int, Any]:
+    index = bits.varint()
+    if bits.read(1) == '1':
+        value = bits.varint()
+        if bits.read(3) != '000':
+            raise SerialError('bad part terminator')
+        return index, value
+    kind = bits.read(2)
+    if kind == '01':
+        return index, None
+    if kind == '10':
+        values = []
+        while not bits.bits.startswith('00', bits.pos):
+            values.append(_read_value(bits))
+        bits.read(2)
+        return index, tuple(values)
+    raise SerialError(f'unknown part kind {kind}')
+
+
+def _tokens(bits: _Bits) -> List[Tuple[str, Any]]:
+    tokens = []
+    while not bits.done():
+        head = bits.read(2)
+        if head == '00':
+            tokens.append(('|', None))
+            continue
+        if head == '01':
+            tokens.append((',', None))
+            continue
+        kind = head + bits.read(1)
+        if kind in ('100', '110'):
+            tokens.append(('int', bits.varint() if kind == '100' else bits.varbit()))
+        elif kind == '101':
+            tokens.append(('part', _read_part(bits)))
+        else:
+            length = bits.varint()
+            tokens.append(('str', ''.join(chr(bits.read_int(7)) for _ in range(length))))
+    return tokens
+
+
+def _format(tokens: List[Tuple[str, Any]]) -> str:
+    out = []
+    for kind, value in tokens:
+        if kind == '|':
+            out.append('|')
+        elif kind == ',':
+            out.append(',')
+        elif kind == 'int':
+            out.append(f' {value}')
+        elif kind == 'str':
+            out.append(f' {value!r}')
+        else:
+            index, v = value
+            if v is None:
+                out.append(f' {{{index}}}')
+            elif isinstance(v, tuple):
+                out.append(f" {{{index}:[{' '.join(str(x) for x in v)}]}}")
+            else:
+                out.append(f' {{{index}:{v}}}')
+    return ''.join(out).strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def decode(serial: str) -> DecodedSerial:
+    """Decode a serial into a DecodedSerial (never raises; see .error)."""
+    if not isinstance(serial, str) or not serial.startswith(PREFIX):
+        return DecodedSerial(str(serial), error='not an item serial')
+    try:
+        bits = _Bits(b85_decode(serial[len(PREFIX):]))
+        if bits.read(len(HEADER_BITS)) != HEADER_BITS:
+            raise SerialError('unknown serial version')
+        tokens = _tokens(bits)
+    except SerialError as e:
+        return DecodedSerial(serial, error=str(e))
+    header = []
+    for kind, value in tokens:
+        if kind == '|':
+            break
+        if kind == 'int':
+            header.append(value)
+    parts = tuple(value for kind, value in tokens if kind == 'part')
+    return DecodedSerial(
+        serial,
+        type_id=header[0] if header else None,
+        level=header[3] if len(header) > 3 else None,
+        header=tuple(header),
+        parts=parts,
+        text=_format(tokens),
+    )
+
+
+def cache_info():
+    return decode.cache_info()
+
+
+class ItemIndex:
+    """Inverted index from decoded item attributes to item keys.
+
+    Keys are whatever identifies an item to the caller (the items table uses
+    its ItemRef rows). Attributes: 'type', 'level', 'part' (each part index),
+    'flags' and 'valid'. Call update() when an item's serial or flags change.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Any, dict]] = ()):
+        self._postings: Dict[Tuple[str, Any], Set[Any]] = {}
+        self._attrs: Dict[Any, Tuple[Tuple[str, Any], ...]] = {}
+        for key, item in entries:
+            self.add(key, item)
+
+    def __len__(self):
+        return len(self._attrs)
+
+    @staticmethod
+    def attributes(item: dict) -> Tuple[Tuple[str, Any], ...]:
+        d = decode(item.get('serial', '')) if isinstance(item, dict) else decode('')
+        attrs = [('valid', d.valid), ('flags', item.get('state_flags', 0) if isinstance(item, dict) else 0)]
+        if d.type_id is not None:
+            attrs.append(('type', d.type_id))
+        if d.level is not None:
+            attrs.append(('level', d.level))
+        attrs.extend(('part', i) for i in set(d.part_indexes))
+        return tuple(attrs)
+
+    def add(self, key: Any, item: dict):
+        if key in self._attrs:
+            self.remove(key)
+        attrs = self.attributes(item)
+        self._attrs[key] = attrs
+        for a in attrs:
+            self._postings.setdefault(a, set()).add(key)
+
+    def remove(self, key: Any):
+        for a in self._attrs.pop(key, ()):
+            keys = self._postings.get(a)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[a]
+
+    def update(self, key: Any, item: dict):
+        self.add(key, item)
+
+    def values(self, attr: str) -> List[Any]:
+        """Distinct indexed values of attr (e.g. all item type ids present)."""
+        return sorted((v for a, v in self._postings if a == attr), key=lambda v: (str(type(v)), v))
+
+    def lookup(self, attr: str, value: Any) -> Set[Any]:
+        return self._postings.get((attr, value), set())
+
+    def query(self, **criteria) -> Set[Any]:
+        """Keys matching every criterion, e.g. query(type=10, level=50, part=[3, 7]).
+
+        A list/tuple/set value matches all of its elements for 'part' and any
+        of them for other attributes. No criteria returns every key.
+        """
+        if not criteria:
+            return set(self._attrs)
+        sets = []
+        for attr, want in criteria.items():
+            if isinstance(want, (list, tuple, set, frozenset)):
+                if attr == 'part':
+                    sets.extend(self.lookup(attr, v) for v in want)
+                else:
+                    sets.append(set().union(*(self.lookup(attr, v) for v in want)))
+            else:
+                sets.append(self.lookup(attr, want))
+        sets.sort(key=len)
+        result = set(sets[0])
+        for s in sets[1:]:
+            if not result:
+                break
+            result &= s
+        return result
@@ -1,10 +1,34 @@
-import json, os
-SETTINGS_FILE = os.path.join(os.getcwd(), "settings.json")
+import atexit, json, os, tempfile, threading, time
+# resolved on first use (or by init()), so importing this module does no I/O
+SETTINGS_FILE = None
+_settings = None
+# set_setting() only updates memory; the file is written once no change has
+# been made for this long (and on exit / flush())
+SAVE_DELAY = 0.5
+_lock = threading.RLock()
+_dirty = False
+_last_change = 0.0
+_timer = None
+_NOTHING = object()
 _defaults = {
     "backup_on_save": True,
     "log_retention_minutes": 10,
     "last_userid": "",
     "yaml_as_source": False,
+    # .sav codec: auto (in-process, CLI fallback), native or cli
+    "crypt_backend": "auto",
+    # write a working copy of opened files to ./temp
+    "keep_temp_copies": False,
+    # cache parsed saves in ./temp/parse_cache, keyed by file content + UserID
+    "parse_cache_enabled": True,
+    "parse_cache_max_mb": 256,
+    # logging: base level, plus per-category overrides e.g. {"Crypt": "WARNING"}
+    "log_level": "DEBUG",
+    "log_levels": {},
+    # pause in typing (ms) before YAML tab edits are applied to the other tabs
+    "yaml_sync_delay_ms": 400,
+    # record timing spans for the status bar breakdown and Debug > Export trace
+    "trace_enabled": True,
     # UI/theme settings
     "ui_theme": "Dark",  # one of: Light, Dark, System (default changed to Dark)
     "custom_stylesheet": "",  # user-provided Qt stylesheet (applied on startup)
@@ -20,8 +44,18 @@ _defaults = {
     "ui_tab_spacing": 6,
     "ui_selected_tab_color": "#3d7bd9"
 }
+def init(path=None):
+    """Load settings from path (default: settings.json in the working directory).
+
+    Optional: the first get_setting/set_setting call loads them otherwise.
+    """
+    global SETTINGS_FILE
+    SETTINGS_FILE = path or os.path.join(os.getcwd(), "settings.json")
+    _ensure_loaded()
 def _ensure_loaded():
-    global _settings
+    global _settings, SETTINGS_FILE
+    if SETTINGS_FILE is None:
+        SETTINGS_FILE = os.path.join(os.getcwd(), "settings.json")
     try:
         if os.path.exists(SETTINGS_FILE):
             with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
@@ -34,22 +68,74 @@ def _ensure_loaded():
         if k not in _settings:
             _settings[k] = v
 def save_settings():
-    try:
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(_settings, f, indent=2)
-    except Exception:
-        pass
+    """Write settings.json now (atomically: temp file + os.replace)."""
+    global _dirty
+    with _lock:
+        _cancel_timer()
+        if _settings is None:
+            return
+        _dirty = False
+        text = json.dumps(_settings, indent=2)
+        directory = os.path.dirname(os.path.abspath(SETTINGS_FILE))
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(prefix='.settings.', suffix='.tmp', dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, SETTINGS_FILE)
+        except Exception:
+            if tmp:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+def flush():
+    """Write pending changes, if any (called at exit)."""
+    with _lock:
+        if _dirty:
+            save_settings()
+def _cancel_timer():
+    global _timer
+    if _timer is not None:
+        _timer.cancel()
+        _timer = None
+def _schedule_save():
+    # one timer per burst of changes: it re-arms itself until SAVE_DELAY has
+    # passed since the last change, so dragging a slider writes once
+    global _timer
+    if _timer is None:
+        _timer = threading.Timer(SAVE_DELAY, _on_timer)
+        _timer.daemon = True
+        _timer.start()
+def _on_timer():
+    global _timer
+    with _lock:
+        _timer = None
+        if not _dirty:
+            return
+        remaining = _last_change + SAVE_DELAY - time.monotonic()
+        if remaining > 0.01:
+            _timer = threading.Timer(remaining, _on_timer)
+            _timer.daemon = True
+            _timer.start()
+            return
+        save_settings()
+atexit.register(flush)
 def get_setting(key, default=None):
-    try:
-        return _settings.get(key, default if default is not None else _defaults.get(key))
-    except NameError:
+    if _settings is None:
         _ensure_loaded()
-        return _settings.get(key, default if default is not None else _defaults.get(key))
+    return _settings.get(key, default if default is not None else _defaults.get(key))
 def set_setting(key, value):
-    try:
-        _settings[key] = value
-    except NameError:
-        _ensure_loaded()
+    """Update a setting in memory; it is written to disk shortly after changes stop."""
+    global _dirty, _last_change
+    with _lock:
+        if _settings is None:
+            _ensure_loaded()
+        current = _settings.get(key, _NOTHING)
+        # an equal but separate value is a no-op; the same object may have been mutated
+        if current is not value and current == value:
+            return
         _settings[key] = value
-    save_settings()
-_ensure_loaded()
+        _dirty = True
+        _last_change = time.monotonic()
+        _schedule_save()
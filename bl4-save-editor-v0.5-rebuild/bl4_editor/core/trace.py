@@ -0,0 +1,138 @@
+"""Lightweight timing spans for the load/save hot paths.
+
+    with trace.span('yaml.parse', 'IO'):
+        ...
+
+    @trace.traced('crypt.decrypt', 'Crypt')
+    def decrypt_bytes(...): ...
+
+Finished spans go into a bounded in-memory buffer (thread-safe, a couple of
+perf_counter calls per span). breakdown(t0, t1) turns the spans recorded in a
+time window into self-time per span name, which is what the status bar and the
+Debug tab show after an open or save; export_chrome_trace() writes the buffer
+in Chrome trace format (chrome://tracing, Perfetto).
+"""
+import functools, itertools, json, os, threading, time
+from collections import deque
+
+# spans kept for export/breakdowns (oldest dropped first)
+MAX_EVENTS = 50000
+
+enabled = True
+_events = deque(maxlen=MAX_EVENTS)
+_ids = itertools.count(1)
+_local = threading.local()
+_EPOCH = time.perf_counter()
+
+now = time.perf_counter
+
+
+def set_enabled(flag):
+    global enabled
+    enabled = bool(flag)
+
+
+def clear():
+    _events.clear()
+
+
+class _Span:
+    __slots__ = ('name', 'cat', 'args', 'id', 'parent', 't0')
+
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        if not enabled:
+            self.id = None
+            return self
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        self.id = next(_ids)
+        self.parent = stack[-1].id if stack else 0
+        stack.append(self)
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.id is None:
+            return False
+        t1 = time.perf_counter()
+        _local.stack.pop()
+        # (id, parent id, name, category, start, duration, thread id, args)
+        _events.append((self.id, self.parent, self.name, self.cat, self.t0, t1 - self.t0,
+                        threading.get_ident(), self.args))
+        return False
+
+
+def span(name, cat=None, **args):
+    """Context manager timing the enclosed block as `name`."""
+    return _Span(name, cat, args or None)
+
+
+def traced(name=None, cat=None):
+    """Decorator timing every call of the function (default name: module.qualname)."""
+    def wrap(fn):
+        label = name or f'{fn.__module__.rsplit(".", 1)[-1]}.{fn.__qualname__}'
+
+        @functools.wraps(fn)
+        def inner(*a, **kw):
+            with _Span(label, cat, None):
+                return fn(*a, **kw)
+        return inner
+    return wrap
+
+
+def events_between(t0, t1=None):
+    """Spans that started at/after t0 and finished by t1 (default: now)."""
+    t1 = time.perf_counter() if t1 is None else t1
+    return [e for e in list(_events) if e[4] >= t0 and e[4] + e[5] <= t1]
+
+
+def breakdown(t0, t1=None):
+    """{span name: self time in seconds} for the spans in [t0, t1].
+
+    Self time excludes child spans, so the values add up to the traced time
+    and show where it actually went (e.g. yaml.parse vs crypt.decrypt).
+    """
+    events = events_between(t0, t1)
+    child_time = {}
+    for e in events:
+        if e[1]:
+            child_time[e[1]] = child_time.get(e[1], 0.0) + e[5]
+    out = {}
+    for e in events:
+        self_time = max(0.0, e[5] - child_time.get(e[0], 0.0))
+        out[e[2]] = out.get(e[2], 0.0) + self_time
+    return out
+
+
+def format_breakdown(parts, limit=6, min_ms=1.0):
+    """'yaml.parse 310 ms, crypt.decrypt 95 ms, ...' for the largest parts."""
+    items = sorted(parts.items(), key=lambda kv: kv[1], reverse=True)
+    shown = []
+    for name, secs in items[:limit]:
+        ms = secs * 1000
+        if ms >= min_ms:
+            shown.append(f'{name} {ms:.0f} ms' if ms >= 10 else f'{name} {ms:.1f} ms')
+    return ', '.join(shown)
+
+
+def export_chrome_trace(path, events=None):
+    """Write spans as Chrome trace JSON ('X' complete events, microseconds)."""
+    events = list(_events) if events is None else events
+    pid = os.getpid()
+    trace_events = []
+    for _id, _parent, name, cat, t0, dur, tid, args in events:
+        ev = {'name': name, 'cat': cat or 'default', 'ph': 'X',
+              'ts': round((t0 - _EPOCH) * 1e6, 3), 'dur': round(dur * 1e6, 3),
+              'pid': pid, 'tid': tid}
+        if args:
+            ev['args'] = {k: str(v) for k, v in args.items()}
+        trace_events.append(ev)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f)
+    return len(trace_events)
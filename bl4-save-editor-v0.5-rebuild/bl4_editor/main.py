@@ -1,7 +1,11 @@
-from PySide6 import QtWidgets
+import time
+_T_START = time.perf_counter()
+import argparse, json, sys
+from PySide6 import QtWidgets, QtCore
 from pathlib import Path
 from bl4_editor.ui.mainwindow import MainWindow
 from bl4_editor.ui import default_ui
+from bl4_editor.core import logger, settings
 
 def load_theme(app):
     qss_path = Path("qss/example-purple.qss")
@@ -15,12 +19,60 @@ def load_theme(app):
     # fallback
     default_ui.apply_default_theme(app)
 
-def main():
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog='python -m bl4_editor.main', description='BL4 Save Editor')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='start the editor once, then print per-module import and per-phase startup times')
+    parser.add_argument('--profile-json', metavar='PATH', help='with --profile-startup: also write the results as JSON')
+    # used by the profiler's child process: dump phase timings and quit once the window is up
+    parser.add_argument('--startup-phases-out', metavar='PATH', help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    if args.profile_startup:
+        from bl4_editor import startup_profile
+        return startup_profile.run(json_out=args.profile_json)
+
+    phases = [('imports', time.perf_counter())]
+    def mark(name):
+        phases.append((name, time.perf_counter()))
+
+    # importing bl4_editor does no disk I/O; load settings and start logging here
+    settings.init()
+    logger.init()
+    mark('settings and logger')
     app = QtWidgets.QApplication([])
+    mark('QApplication')
     load_theme(app)
+    mark('theme')
     win = MainWindow()
+    mark('window constructed')
     win.show()
-    app.exec()
+    mark('window shown')
+
+    if args.startup_phases_out:
+        def dump_and_quit():
+            win._report_startup()
+            mark('first event loop pass')
+            prev = _T_START
+            rows = []
+            for name, t in phases:
+                rows.append((name, (t - prev) * 1000.0))
+                prev = t
+            result = {
+                'phases': rows,
+                'total_ms': (prev - _T_START) * 1000.0,
+                'window_phases': [(name, t * 1000.0) for name, t in win.startup_timings],
+            }
+            with open(args.startup_phases_out, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+            app.quit()
+        QtCore.QTimer.singleShot(0, dump_and_quit)
+
+    code = app.exec()
+    settings.flush()
+    return code
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""Startup profiler for the editor (python -m bl4_editor.main --profile-startup).
+
+Runs the editor once in a child interpreter under `-X importtime`. The child
+records its startup phases, writes them to a JSON file and quits as soon as
+the first window is shown. The parent summarizes the import times per
+package and prints them next to the phase timings; --profile-json also saves
+everything for comparing runs.
+"""
+import json, os, subprocess, sys, tempfile
+
+_PREFIX = 'import time:'
+
+
+def parse_importtime(text):
+    """Parse `-X importtime` output into (module, self_us, cumulative_us, depth) tuples."""
+    entries = []
+    for line in text.splitlines():
+        if not line.startswith(_PREFIX):
+            continue
+        parts = line[len(_PREFIX):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cum_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip(' ')
+        entries.append((stripped, self_us, cum_us, (len(name) - len(stripped)) // 2))
+    return entries
+
+
+def summarize_imports(entries, top=15):
+    """Totals per top-level package plus the slowest modules (by self time)."""
+    by_package = {}
+    for name, self_us, _cum, _depth in entries:
+        root = name.split('.')[0]
+        by_package[root] = by_package.get(root, 0) + self_us
+    slowest = sorted(entries, key=lambda e: e[1], reverse=True)[:top]
+    return {
+        'total_ms': sum(e[1] for e in entries) / 1000.0,
+        'modules': len(entries),
+        'by_package_ms': {k: v / 1000.0 for k, v in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:top]},
+        'slowest_ms': [(name, self_us / 1000.0, cum_us / 1000.0) for name, self_us, cum_us, _depth in slowest],
+    }
+
+
+def format_report(result):
+    lines = ['Startup profile', '']
+    lines.append('Phases (main):')
+    for phase, ms in result.get('phases', []):
+        lines.append(f'  {phase:<28} {ms:9.1f} ms')
+    window = result.get('window_phases', [])
+    if window:
+        lines.append('Phases (MainWindow, cumulative):')
+        for phase, ms in window:
+            lines.append(f'  {phase:<28} {ms:9.1f} ms')
+    imports = result.get('imports', {})
+    if imports:
+        lines.append('')
+        lines.append(f"Imports: {imports['modules']} modules, {imports['total_ms']:.1f} ms total")
+        lines.append('  by package:')
+        for pkg, ms in imports['by_package_ms'].items():
+            lines.append(f'    {pkg:<30} {ms:9.1f} ms')
+        lines.append('  slowest modules (self / cumulative):')
+        for name, self_ms, cum_ms in imports['slowest_ms']:
+            lines.append(f'    {name:<44} {self_ms:8.1f} / {cum_ms:8.1f} ms')
+    return '\n'.join(lines)
+
+
+def run(json_out=None, top=15, env=None):
+    """Profile one editor startup; prints the report and returns an exit code."""
+    fd, phases_path = tempfile.mkstemp(suffix='.json', prefix='bl4_startup_')
+    os.close(fd)
+    try:
+        cmd = [sys.executable, '-X', 'importtime', '-m', 'bl4_editor.main', '--startup-phases-out', phases_path]
+        proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                              env=env or os.environ.copy())
+        try:
+            with open(phases_path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            result = None
+        if proc.returncode != 0 or result is None:
+            other = [l for l in proc.stderr.splitlines() if not l.startswith(_PREFIX)]
+            print('Editor did not start cleanly:', file=sys.stderr)
+            print('\n'.join(other[-30:]), file=sys.stderr)
+            return proc.returncode or 1
+    finally:
+        try:
+            os.remove(phases_path)
+        except OSError:
+            pass
+    result['imports'] = summarize_imports(parse_importtime(proc.stderr), top=top)
+    print(format_report(result))
+    if json_out:
+        with open(json_out, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f'\nWrote {json_out}')
+    return 0
@@ -0,0 +1,64 @@
+from PySide6 import QtCore
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function once cancellation has been requested."""
+
+
+class JobSignals(QtCore.QObject):
+    progress = QtCore.Signal(int, str)
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(str)
+    cancelled = QtCore.Signal()
+
+
+class Job(QtCore.QRunnable):
+    """Run fn(job, *args, **kwargs) on the global QThreadPool.
+
+    The function runs off the GUI thread and must not touch widgets. It can
+    call job.report(percent, text) for progress and job.check_cancelled() at
+    safe points; both raise JobCancelled after cancel(). Results, errors and
+    cancellation are delivered through job.signals, which are queued to the
+    receiver's (GUI) thread.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = JobSignals()
+        self._cancel_requested = False
+        # the owner keeps a reference while the job is active
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self._cancel_requested = True
+
+    def is_cancelled(self):
+        return self._cancel_requested
+
+    def check_cancelled(self):
+        if self._cancel_requested:
+            raise JobCancelled()
+
+    def report(self, percent, text=''):
+        self.check_cancelled()
+        self.signals.progress.emit(int(percent), text)
+
+    def start(self, pool=None):
+        (pool or QtCore.QThreadPool.globalInstance()).start(self)
+
+    def run(self):
+        try:
+            result = self.fn(self, *self.args, **self.kwargs)
+        except JobCancelled:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        if self._cancel_requested:
+            self.signals.cancelled.emit()
+        else:
+            self.signals.finished.emit(result)
@@ -1,26 +1,54 @@
 # Updated mainwindow.py with proper integration
-from PySide6 import QtWidgets, QtGui
-import os, re, tempfile, shutil
-from bl4_editor.ui.tabs.character_tab import CharacterTab
-from bl4_editor.ui.tabs.items_tab import ItemsTab
-from bl4_editor.ui.tabs.progression_tab import ProgressionTab
-from bl4_editor.ui.tabs.stats_tab import StatsTab
-from bl4_editor.ui.tabs.world_tab import WorldTab
-from bl4_editor.ui.tabs.unlockables_tab import UnlockablesTab
-from bl4_editor.ui.tabs.profile_tab import ProfileTab
-from bl4_editor.ui.tabs.yaml_tab import YamlTab
+from PySide6 import QtWidgets, QtGui, QtCore
+import os, re, tempfile, shutil, time
+from bl4_editor.ui.tabs.yaml_tab import YamlTab, dump_yaml_text, parse_yaml_text
 from bl4_editor.ui.tabs.debug_tab import DebugTab
-from bl4_editor.ui.tabs.readme_tab import ReadmeTab
+from bl4_editor.ui.widgets.lazy_tab import LazyTab, tab_factory
 from bl4_editor.core.controller import TabController
 from bl4_editor.core import fileio
 from bl4_editor.core import crypt as crypt_mod
-from bl4_editor.core import logger
+from bl4_editor.core import logger, trace
 from bl4_editor.core import settings as core_settings
-from bl4_editor.ui.settings_dialog import SettingsDialog
+from bl4_editor.core.datapath import diff_paths, apply_paths, relative_path
+from bl4_editor.core.search_index import SaveIndex
 from bl4_editor.ui import default_ui
+from bl4_editor.ui.jobs import Job
+
+# (name, title, factory) for tabs built on first activation; YAML and Debug
+# are always built (the YAML view and the logger use them from the start)
+LAZY_TABS = (
+    ('character', 'Character', tab_factory('bl4_editor.ui.tabs.character_tab', 'CharacterTab')),
+    ('items', 'Items', tab_factory('bl4_editor.ui.tabs.items_tab', 'ItemsTab')),
+    ('progression', 'Progression', tab_factory('bl4_editor.ui.tabs.progression_tab', 'ProgressionTab')),
+    ('stats', 'Stats', tab_factory('bl4_editor.ui.tabs.stats_tab', 'StatsTab')),
+    ('world', 'World', tab_factory('bl4_editor.ui.tabs.world_tab', 'WorldTab')),
+    ('unlockables', 'Unlockables', tab_factory('bl4_editor.ui.tabs.unlockables_tab', 'UnlockablesTab')),
+    ('profile', 'Profile', tab_factory('bl4_editor.ui.tabs.profile_tab', 'ProfileTab')),
+)
+README_TAB = ('readme', 'Readme', tab_factory('bl4_editor.ui.tabs.readme_tab', 'ReadmeTab', 'load_data'))
+# tabs showing their data as a ProfileTree; search results open in these when they can
+TREE_TABS = ('progression', 'stats', 'world', 'unlockables', 'profile')
+
+
+def _lazy_tab_property(name):
+    # the real tab widget, built on first access
+    return property(lambda self: self.lazy_tabs[name].widget())
+
 
 class MainWindow(QtWidgets.QMainWindow):
+    character_tab = _lazy_tab_property('character')
+    items_tab = _lazy_tab_property('items')
+    progression_tab = _lazy_tab_property('progression')
+    stats_tab = _lazy_tab_property('stats')
+    world_tab = _lazy_tab_property('world')
+    unlockables_tab = _lazy_tab_property('unlockables')
+    profile_tab = _lazy_tab_property('profile')
+    readme_tab = _lazy_tab_property('readme')
+
     def __init__(self):
+        # startup phases as (name, seconds since __init__ started)
+        self._startup_t0 = time.perf_counter()
+        self.startup_timings = []
         super().__init__()
         self.setWindowTitle('BL4 Save Editor - Modular Version')
         self.resize(1200, 800)
@@ -35,104 +63,116 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tabs = QtWidgets.QTabWidget()
         self.setCentralWidget(self.tabs)
 
-        # Create tab instances (some are QWidget subclasses, some are logic-only)
-        self.character_tab = CharacterTab()
-        self.items_tab = ItemsTab()
-        self.progression_tab = ProgressionTab()
-        self.stats_tab = StatsTab()
-        self.world_tab = WorldTab()
-        self.unlockables_tab = UnlockablesTab()
-        self.profile_tab = ProfileTab()
+        # Data tabs and the readme are placeholders until first shown
+        self.lazy_tabs = {}
+        for name, title, factory in LAZY_TABS + (README_TAB,):
+            self.lazy_tabs[name] = LazyTab(name, factory, on_built=self._on_tab_built)
         self.yaml_tab = YamlTab()
         self.debug_tab = DebugTab()
-        self.readme_tab = ReadmeTab()
         # sync suppression flag to avoid back-and-forth updates
         self._yaml_sync_in_progress = False
-
-        # Build display widgets: ensure every entry added to QTabWidget is a QWidget
-        def make_display_widget(obj):
-            # If object is already a QWidget, return it directly
-            if isinstance(obj, QtWidgets.QWidget):
-                return obj, obj
-            # Otherwise create a simple QWidget container that holds a placeholder
-            container = QtWidgets.QWidget()
-            layout = QtWidgets.QVBoxLayout(container)
-            lbl = QtWidgets.QLabel(f"{type(obj).__name__} (no GUI)")
-            lbl.setWordWrap(True)
-            layout.addWidget(lbl)
-            layout.addStretch()
-            # attach logic object for later use
-            container._logic = obj
-            return container, obj
-
-        # Prepare display widgets and logic mapping
-        self._disp_character, self._logic_character = make_display_widget(self.character_tab)
-        self._disp_items, self._logic_items = make_display_widget(self.items_tab)
-        self._disp_progression, self._logic_progression = make_display_widget(self.progression_tab)
-        self._disp_stats, self._logic_stats = make_display_widget(self.stats_tab)
-        self._disp_world, self._logic_world = make_display_widget(self.world_tab)
-        self._disp_unlockables, self._logic_unlockables = make_display_widget(self.unlockables_tab)
-        self._disp_profile, self._logic_profile = make_display_widget(self.profile_tab)
-        self._disp_yaml, self._logic_yaml = make_display_widget(self.yaml_tab)
-        self._disp_debug, self._logic_debug = make_display_widget(self.debug_tab)
-        self._disp_readme, self._logic_readme = make_display_widget(self.readme_tab)
+        # background open/save job (one at a time)
+        self._active_job = None
+        self._job_on_done = None
+        self._job_error_title = None
+        # trace.now() when the running job's operation started
+        self._job_t0 = None
+        trace.set_enabled(core_settings.get_setting('trace_enabled', True))
+        # background YAML-editor parse; newer text waits in _yaml_pending_text
+        self._yaml_parse_job = None
+        self._yaml_pending_text = None
+        # bumped when the text is synced on the GUI thread (before a save);
+        # parse results started earlier are dropped
+        self._yaml_parse_gen = 0
+        # YAML text edited but not yet applied to current_data
+        self._yaml_dirty = False
+        # controller.edit_count when the YAML view was last rendered
+        self._yaml_view_edits = 0
+        # global search: dock built on first use, index built in the background
+        # and valid while _search_key() is unchanged
+        self.search_dock = None
+        self.search_panel = None
+        self._search_index = None
+        self._search_index_key = None
+        self._index_job = None
 
         # wire logger to debug tab so logs appear in UI
         try:
-            # _logic_debug is the actual logic object (DebugTab QWidget)
-            logger.set_debug_tab(self._logic_debug)
+            logger.set_debug_tab(self.debug_tab)
             logger.info('Debug tab attached to logger')
         except Exception:
             pass
 
-        # ADD TABS TO THE TAB WIDGET (use display widgets)
-        self.tabs.addTab(self._disp_character, "Character")
-        self.tabs.addTab(self._disp_items, "Items")
-        self.tabs.addTab(self._disp_progression, "Progression")
-        self.tabs.addTab(self._disp_stats, "Stats")
-        self.tabs.addTab(self._disp_world, "World")
-        self.tabs.addTab(self._disp_unlockables, "Unlockables")
-        self.tabs.addTab(self._disp_profile, "Profile")
-        self.tabs.addTab(self._disp_yaml, "YAML")
-        self.tabs.addTab(self._disp_debug, "Debug")
-        self.tabs.addTab(self._disp_readme, "Readme")
+        # ADD TABS TO THE TAB WIDGET
+        for name, title, _factory in LAZY_TABS:
+            self.tabs.addTab(self.lazy_tabs[name], title)
+        self.tabs.addTab(self.yaml_tab, "YAML")
+        self.tabs.addTab(self.debug_tab, "Debug")
+        self.tabs.addTab(self.lazy_tabs['readme'], README_TAB[1])
+        self._mark_startup('tabs registered')
 
         # Initialize controller with proper tab mapping
         # Tab controller mapping points to logic objects (not necessarily QWidgets)
-        self.tab_mapping = {
-            'character': self._logic_character,
-            'items': self._logic_items,
-            'progression': self._logic_progression,
-            'stats': self._logic_stats,
-            'world': self._logic_world,
-            'unlockables': self._logic_unlockables,
-            'profile': self._logic_profile,
-        }
+        # (LazyTab placeholders keep payloads until their tab is built)
+        self.tab_mapping = {name: self.lazy_tabs[name] for name, _title, _factory in LAZY_TABS}
         self.controller = TabController(self.tab_mapping)
+        self._mark_startup('controller')
 
         # crypt wrapper instance
         try:
-            exe = os.path.join(os.getcwd(), 'bl4-crypt-cli.exe') if os.path.exists(os.path.join(os.getcwd(),'bl4-crypt-cli.exe')) else 'bl4-crypt-cli'
-            self.crypt = crypt_mod.CryptWrapper(exe_path=exe, logger=logger)
+            self.crypt = crypt_mod.CryptWrapper(exe_path=crypt_mod.default_exe_path(), logger=logger)
         except Exception:
             self.crypt = crypt_mod.CryptWrapper()
 
         # connect YAML editor changes to a handler that will attempt to parse
-        # and apply YAML to the tabs automatically (auto-sync)
+        # and apply YAML to the tabs automatically (auto-sync, debounced)
         try:
-            if hasattr(self.yaml_tab, 'text_changed'):
-                self.yaml_tab.text_changed.connect(self._on_yaml_edited)
+            if hasattr(self.yaml_tab, 'edit_settled'):
+                self.yaml_tab.edit_settled.connect(self._on_yaml_edited)
+                self.yaml_tab.text_changed.connect(self._on_yaml_text_changed)
         except Exception:
             pass
 
         # Create toolbar and other UI elements
         self._create_toolbar()
+        self._create_job_status()
         self._load_userid()
+        self._mark_startup('toolbar and settings')
         # Apply UI stylesheet and theme from settings
         try:
             self.apply_stylesheet(core_settings.get_setting('custom_stylesheet', ''), core_settings.get_setting('ui_theme', 'System'))
         except Exception:
             pass
+        self._mark_startup('theme')
+        self._startup_reported = False
+
+    # --- startup timing ----------------------------------------------------
+
+    def _mark_startup(self, phase):
+        self.startup_timings.append((phase, time.perf_counter() - self._startup_t0))
+
+    def _on_tab_built(self, name, seconds):
+        logger.debug('Built %s tab in %.1f ms', name, seconds * 1000, category='Startup')
+        if not self._startup_reported:
+            self.startup_timings.append((f'{name} tab built', time.perf_counter() - self._startup_t0))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._startup_reported:
+            # runs once the first frame (and the current tab) is up
+            QtCore.QTimer.singleShot(0, self._report_startup)
+
+    def _report_startup(self):
+        if self._startup_reported:
+            return
+        self._mark_startup('first window shown')
+        self._startup_reported = True
+        prev = 0.0
+        lines = []
+        for phase, t in self.startup_timings:
+            lines.append(f'{phase}: +{(t - prev) * 1000:.1f} ms')
+            prev = t
+        logger.info('Startup %.1f ms (%s)', prev * 1000, ', '.join(lines), category='Startup')
 
     def _create_toolbar(self):
         """Create the main toolbar"""
@@ -156,6 +196,12 @@ class MainWindow(QtWidgets.QMainWindow):
         refresh_action.triggered.connect(self.refresh_tabs)
         self.toolbar.addAction(refresh_action)
 
+        search_action = QtGui.QAction('Search', self)
+        search_action.setShortcut(QtGui.QKeySequence('Ctrl+Shift+F'))
+        search_action.setToolTip('Search keys and values of the whole save (Ctrl+Shift+F)')
+        search_action.triggered.connect(self.show_search)
+        self.toolbar.addAction(search_action)
+
         # Settings dialog
         settings_action = QtGui.QAction('Settings', self)
         settings_action.triggered.connect(self.open_settings)
@@ -177,6 +223,18 @@ class MainWindow(QtWidgets.QMainWindow):
         self.userid_save_btn.triggered.connect(self.save_userid)
         self.toolbar.addAction(self.userid_save_btn)
 
+    def _create_job_status(self):
+        """Progress bar and cancel button shown in the status bar while a job runs"""
+        self.job_progress = QtWidgets.QProgressBar()
+        self.job_progress.setRange(0, 100)
+        self.job_progress.setFixedWidth(180)
+        self.job_progress.setVisible(False)
+        self.statusBar().addPermanentWidget(self.job_progress)
+        self.job_cancel_btn = QtWidgets.QPushButton('Cancel')
+        self.job_cancel_btn.setVisible(False)
+        self.job_cancel_btn.clicked.connect(self._cancel_job)
+        self.statusBar().addPermanentWidget(self.job_cancel_btn)
+
     def _load_userid(self):
         # load last_userid from core settings if available
         try:
@@ -198,6 +256,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def open_settings(self):
         try:
+            # imported on first use; not needed to show the window
+            from bl4_editor.ui.settings_dialog import SettingsDialog
             dlg = SettingsDialog(self, apply_callback=self.apply_stylesheet)
             if dlg.exec() == QtWidgets.QDialog.Accepted:
                 # settings are applied live by SettingsTab via core_settings
@@ -316,6 +376,132 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception as e:
             QtWidgets.QMessageBox.warning(self, 'UserID', str(e))
 
+    # --- background jobs -------------------------------------------------
+
+    def _run_job(self, label, fn, args, on_done, error_title, t0=None):
+        """Run fn(job, *args) off the GUI thread; on_done(result) runs on the GUI thread.
+
+        Trace spans recorded from t0 (default: now) until on_done returns are
+        summarized in the status bar and the Debug tab.
+        """
+        if self._active_job is not None:
+            self.statusBar().showMessage('Another operation is still running')
+            return
+        job = Job(fn, *args)
+        self._active_job = job
+        self._job_t0 = trace.now() if t0 is None else t0
+        self._job_on_done = on_done
+        self._job_error_title = error_title
+        job.signals.progress.connect(self._on_job_progress)
+        job.signals.finished.connect(self._on_job_finished)
+        job.signals.failed.connect(self._on_job_failed)
+        job.signals.cancelled.connect(self._on_job_cancelled)
+        self._set_busy(True, label)
+        job.start()
+
+    def _set_busy(self, busy, label=''):
+        # block edits while a job reads/writes current_data
+        self.tabs.setEnabled(not busy)
+        self.toolbar.setEnabled(not busy)
+        self.job_progress.setVisible(busy)
+        self.job_cancel_btn.setVisible(busy)
+        self.job_cancel_btn.setEnabled(busy)
+        if busy:
+            self.job_progress.setValue(0)
+            self.statusBar().showMessage(label)
+
+    def _end_job(self):
+        self._active_job = None
+        self._job_on_done = None
+        self._job_t0 = None
+        self._set_busy(False)
+
+    def _cancel_job(self):
+        if self._active_job is not None:
+            self._active_job.cancel()
+            self.job_cancel_btn.setEnabled(False)
+            self.statusBar().showMessage('Cancelling...')
+
+    def _on_job_progress(self, percent, text):
+        self.job_progress.setValue(percent)
+        if text:
+            self.statusBar().showMessage(text)
+
+    def _on_job_finished(self, result):
+        on_done = self._job_on_done
+        t0 = self._job_t0
+        self._end_job()
+        if on_done:
+            on_done(result)
+        if t0 is not None:
+            self._report_trace(t0)
+
+    def _report_trace(self, t0):
+        # per-operation breakdown (self time per span) after the status message
+        parts = trace.breakdown(t0)
+        if not parts:
+            return
+        total = trace.now() - t0
+        summary = trace.format_breakdown(parts)
+        status = self.statusBar().currentMessage()
+        self.statusBar().showMessage(f'{status} in {total * 1000:.0f} ms ({summary})' if summary
+                                     else f'{status} in {total * 1000:.0f} ms')
+        logger.info('%s: %.0f ms total; %s', status, total * 1000, trace.format_breakdown(parts, limit=20, min_ms=0.1),
+                    category='Trace')
+
+    def _on_job_failed(self, message):
+        title = self._job_error_title or 'Error'
+        self._end_job()
+        logger.error(f'{title}: {message}')
+        self.statusBar().showMessage(title)
+        QtWidgets.QMessageBox.critical(self, 'Error', f'{title}:\n{message}')
+
+    def _on_job_cancelled(self):
+        self._end_job()
+        self.statusBar().showMessage('Operation cancelled')
+        logger.info('Operation cancelled by user')
+
+    def closeEvent(self, event):
+        # let a running save finish its write rather than killing it mid-file
+        if self._active_job is not None:
+            self._active_job.cancel()
+            QtCore.QThreadPool.globalInstance().waitForDone()
+        # write settings changed in the last moments (normally debounced)
+        core_settings.flush()
+        super().closeEvent(event)
+
+    def _collect_data_for_save(self):
+        """Apply pending YAML edits and merge tab edits on the GUI thread; returns the data to write.
+
+        YAML text not synced yet (still in the debounce or being parsed) is
+        applied first. Dirty tabs are then merged unless the YAML tab takes
+        priority ('prefer_tabs_on_save' off). Raises ValueError when the YAML
+        tab has edits that do not parse.
+        """
+        self._sync_yaml_now()
+        if core_settings.get_setting('prefer_tabs_on_save', True):
+            try:
+                self.controller.save_from_tabs(self.current_data)
+            except Exception:
+                pass
+        return self.current_data
+
+    def _yaml_view_stale(self):
+        """True when tab edits were made since the YAML view was last rendered."""
+        return self.controller.edit_count != self._yaml_view_edits
+
+    def _set_yaml_view(self, data, text=None):
+        try:
+            self._yaml_sync_in_progress = True
+            if hasattr(self.yaml_tab, 'set_yaml'):
+                self.yaml_tab.set_yaml(data, text=text)
+            self._yaml_dirty = False
+            self._yaml_view_edits = self.controller.edit_count
+        finally:
+            self._yaml_sync_in_progress = False
+
+    # --- open ------------------------------------------------------------
+
     def open_file(self):
         dlg = QtWidgets.QFileDialog(self, 'Open Save or YAML', os.getcwd())
         dlg.setFileMode(QtWidgets.QFileDialog.ExistingFile)
@@ -323,28 +509,39 @@ class MainWindow(QtWidgets.QMainWindow):
         if not dlg.exec():
             return
         path = dlg.selectedFiles()[0]
-        try:
-            # fileio.open_file handles .yaml and .sav (requires userid for .sav)
-            if path.lower().endswith('.sav') and not self.current_userid:
-                # ask for userid if missing
-                uid, ok = QtWidgets.QInputDialog.getText(self, 'UserID required', 'Enter Steam/UserID:')
-                if not ok or not uid:
-                    self.statusBar().showMessage('Open cancelled: UserID required for .sav')
-                    return
-                self.current_userid = uid
-                core_settings.set_setting('last_userid', uid)
-            tmp_path, data = fileio.open_file(path, userid=self.current_userid)
-            self.current_yaml_path = tmp_path
-            self.current_original_path = path
-            self.current_data = data
-            self._apply_loaded_data(data)
-            self.statusBar().showMessage(f'Loaded {os.path.basename(path)}')
-            logger.info(f'Opened file: {path}')
-        except Exception as e:
-            logger.error(f'Error opening file {path}: {e}')
-            QtWidgets.QMessageBox.critical(self, 'Error', f'Failed to open file:\n{e}')
-
-    def _apply_loaded_data(self, data):
+        # fileio.open_file handles .yaml and .sav (requires userid for .sav)
+        if path.lower().endswith('.sav') and not self.current_userid:
+            # ask for userid if missing
+            uid, ok = QtWidgets.QInputDialog.getText(self, 'UserID required', 'Enter Steam/UserID:')
+            if not ok or not uid:
+                self.statusBar().showMessage('Open cancelled: UserID required for .sav')
+                return
+            self.current_userid = uid
+            core_settings.set_setting('last_userid', uid)
+        materialize = bool(core_settings.get_setting('keep_temp_copies', False))
+        self._run_job(f'Opening {os.path.basename(path)}...', self._open_job,
+                      (path, self.current_userid, materialize), self._open_done,
+                      f'Failed to open {os.path.basename(path)}')
+
+    @staticmethod
+    def _open_job(job, path, userid, materialize):
+        job.report(5, f'Reading {os.path.basename(path)}...')
+        tmp_path, data = fileio.open_file(path, userid=userid, materialize=materialize)
+        job.report(60, 'Rendering YAML view...')
+        text = dump_yaml_text(data)
+        job.report(85, 'Populating tabs...')
+        return path, tmp_path, data, text
+
+    def _open_done(self, result):
+        path, tmp_path, data, text = result
+        self.current_yaml_path = tmp_path
+        self.current_original_path = path
+        self.current_data = data
+        self._apply_loaded_data(data, yaml_text=text)
+        self.statusBar().showMessage(f'Loaded {os.path.basename(path)}')
+        logger.info(f'Opened file: {path}')
+
+    def _apply_loaded_data(self, data, yaml_text=None):
         # Update YAML tab and other tabs via controller
         try:
             # Prefer to populate tabs first (tabs are authoritative by default)
@@ -354,18 +551,16 @@ class MainWindow(QtWidgets.QMainWindow):
                 logger.warning(f'Controller load warning: {e}')
             # update YAML editor from data but avoid triggering the textChanged handler
             try:
-                self._yaml_sync_in_progress = True
-                if hasattr(self.yaml_tab, 'set_yaml'):
-                    try:
-                        # show the merged view
-                        self.yaml_tab.set_yaml(data)
-                    except Exception:
-                        pass
-            finally:
-                self._yaml_sync_in_progress = False
+                # show the merged view
+                self._set_yaml_view(data, text=yaml_text)
+            except Exception:
+                pass
+            self._refresh_search()
         except Exception as e:
             logger.error(f'Error applying loaded data: {e}')
 
+    # --- save ------------------------------------------------------------
+
     def save_as_yaml(self):
         if not self.current_data:
             QtWidgets.QMessageBox.information(self, 'No data', 'No data loaded to save')
@@ -376,52 +571,46 @@ class MainWindow(QtWidgets.QMainWindow):
         if not dlg.exec():
             return
         path = dlg.selectedFiles()[0]
+        t0 = trace.now()
         try:
-            prefer_tabs = core_settings.get_setting('prefer_tabs_on_save', True)
-            # If tabs take priority, collect tab edits into current_data first
-            if prefer_tabs:
-                try:
-                    self.controller.save_from_tabs(self.current_data)
-                except Exception:
-                    pass
-                data_to_write = self.current_data
-            else:
-                # YAML content takes priority
-                try:
-                    if hasattr(self.yaml_tab, 'get_yaml'):
-                        data_to_write = self.yaml_tab.get_yaml()
-                    else:
-                        data_to_write = self.current_data
-                except ValueError as e:
-                    QtWidgets.QMessageBox.warning(self, 'YAML Error', str(e))
-                    return
-
-            # use safe writer that disables PyYAML aliases
-            # use atomic write and create a timestamped backup if overwriting
-            fileio.safe_write_yaml(path, data_to_write, atomic=True, make_backup=True)
-            # update current data
+            data_to_write = self._collect_data_for_save()
+        except ValueError as e:
+            QtWidgets.QMessageBox.warning(self, 'YAML Error', str(e))
+            return
+        # the editor only needs re-rendering if tab edits are not in it yet
+        render = self._yaml_view_stale()
+        self._run_job(f'Saving {os.path.basename(path)}...', self._save_yaml_job,
+                      (path, data_to_write, self.current_original_path, render), self._save_yaml_done,
+                      'Failed to save YAML', t0=t0)
+
+    @staticmethod
+    def _save_yaml_job(job, path, data_to_write, original_path, render=True):
+        job.report(10, 'Writing YAML...')
+        # use safe writer that disables PyYAML aliases
+        # use atomic write and create a timestamped backup if overwriting
+        fileio.safe_write_yaml(path, data_to_write, atomic=True, make_backup=True)
+        # if user saved back to the original file path, update original with backup
+        try:
+            if original_path and os.path.abspath(path) == os.path.abspath(original_path):
+                # replace the original with this saved file (we already backed it up above)
+                shutil.copy2(path, original_path)
+                logger.info(f'Committed YAML back to original: {original_path}')
+        except Exception:
+            pass
+        # reflect merged result in YAML editor once back on the GUI thread
+        text = dump_yaml_text(data_to_write) if render else None
+        return path, data_to_write, text
+
+    def _save_yaml_done(self, result):
+        path, data_to_write, text = result
+        # update current data
+        if data_to_write is not self.current_data:
             self.current_data = data_to_write
-            # reflect merged result in YAML editor
-            try:
-                self._yaml_sync_in_progress = True
-                if hasattr(self.yaml_tab, 'set_yaml'):
-                    self.yaml_tab.set_yaml(self.current_data)
-            finally:
-                self._yaml_sync_in_progress = False
-
-            self.statusBar().showMessage(f'Saved YAML to {path}')
-            logger.info(f'Saved YAML: {path}')
-            # if user saved back to the original file path, update original with backup
-            try:
-                if self.current_original_path and os.path.abspath(path) == os.path.abspath(self.current_original_path):
-                    # replace the original with this saved file (we already backed it up above)
-                    shutil.copy2(path, self.current_original_path)
-                    logger.info(f'Committed YAML back to original: {self.current_original_path}')
-            except Exception:
-                pass
-        except Exception as e:
-            logger.error(f'Error saving YAML {path}: {e}')
-            QtWidgets.QMessageBox.critical(self, 'Error', f'Failed to save YAML:\n{e}')
+            self.controller.load_into_tabs(self.current_data)
+        if text is not None:
+            self._set_yaml_view(self.current_data, text=text)
+        self.statusBar().showMessage(f'Saved YAML to {path}')
+        logger.info(f'Saved YAML: {path}')
 
     def save_as_sav(self):
         if not self.current_data:
@@ -433,151 +622,308 @@ class MainWindow(QtWidgets.QMainWindow):
         if not dlg.exec():
             return
         out_path = dlg.selectedFiles()[0]
+        t0 = trace.now()
         try:
-            # determine save precedence
-            prefer_tabs = core_settings.get_setting('prefer_tabs_on_save', True)
-            if prefer_tabs:
-                try:
-                    self.controller.save_from_tabs(self.current_data)
-                except Exception:
-                    pass
-                tmp_data = self.current_data
-            else:
-                if hasattr(self.yaml_tab, 'get_yaml'):
-                    try:
-                        tmp_data = self.yaml_tab.get_yaml()
-                    except ValueError as e:
-                        QtWidgets.QMessageBox.warning(self, 'YAML Error', str(e))
-                        return
-                else:
-                    tmp_data = self.current_data
-
-            # write temporary yaml
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.yaml')
-            tmp_path = tmp.name
-            tmp.close()
-            # use safe writer to avoid aliases (non-atomic temp write)
-            fileio.safe_write_yaml(tmp_path, tmp_data, atomic=False, make_backup=False)
-            # use crypt wrapper to encrypt
-            # if the out file exists, back it up first
-            if os.path.exists(out_path):
-                try:
-                    shutil.copy2(out_path, out_path + '.bak')
-                except Exception:
-                    pass
-            ok = self.crypt.encrypt(tmp_path, out_path, userid=self.current_userid)
-            os.unlink(tmp_path)
-            if not ok:
-                raise RuntimeError('Encryption failed (see logs)')
-            self.statusBar().showMessage(f'Saved .sav to {out_path}')
-            logger.info(f'Saved .sav: {out_path}')
-            # if user originally opened a .sav, and saved to same path, commit by replacing original
+            tmp_data = self._collect_data_for_save()
+        except ValueError as e:
+            QtWidgets.QMessageBox.warning(self, 'YAML Error', str(e))
+            return
+        self._run_job(f'Saving {os.path.basename(out_path)}...', self._save_sav_job,
+                      (self.crypt, out_path, tmp_data, self.current_userid, self.current_original_path),
+                      self._save_sav_done, 'Failed to save .sav', t0=t0)
+
+    @staticmethod
+    def _save_sav_job(job, crypt, out_path, tmp_data, userid, original_path):
+        job.report(10, 'Serializing YAML...')
+        # serialize in memory (no aliases) and hand the bytes to the crypt wrapper
+        yaml_bytes = fileio.safe_dump_yaml(tmp_data).encode('utf-8')
+        # last chance to cancel before anything on disk changes
+        job.report(50, 'Encrypting...')
+        # if the out file exists, back it up first
+        if os.path.exists(out_path):
             try:
-                if self.current_original_path and os.path.abspath(out_path) == os.path.abspath(self.current_original_path):
-                    shutil.copy2(out_path, self.current_original_path)
-                    logger.info(f'Committed .sav back to original: {self.current_original_path}')
+                shutil.copy2(out_path, out_path + '.bak')
             except Exception:
                 pass
-        except Exception as e:
-            logger.error(f'Error saving .sav {out_path}: {e}')
-            QtWidgets.QMessageBox.critical(self, 'Error', f'Failed to save .sav:\n{e}')
+        ok = crypt.encrypt_bytes(yaml_bytes, out_path, userid=userid)
+        if not ok:
+            raise RuntimeError('Encryption failed (see logs)')
+        # if user originally opened a .sav, and saved to same path, commit by replacing original
+        try:
+            if original_path and os.path.abspath(out_path) == os.path.abspath(original_path):
+                shutil.copy2(out_path, original_path)
+                logger.info(f'Committed .sav back to original: {original_path}')
+        except Exception:
+            pass
+        return out_path
+
+    def _save_sav_done(self, out_path):
+        self.statusBar().showMessage(f'Saved .sav to {out_path}')
+        logger.info(f'Saved .sav: {out_path}')
 
     def refresh_tabs(self):
-        # simple refresh: reload YAML tab from current_data and call load_into_tabs
+        # merge tab edits, then reload only tabs showing data another tab changed
+        # and re-render the YAML editor only if it is behind
         if not self.current_data:
             return
-        # reload the YAML editor from current_data then reapply to tabs
-        self._apply_loaded_data(self.current_data)
+        try:
+            self.controller.save_from_tabs(self.current_data)
+        except Exception:
+            pass
+        stale = self.controller.stale_tabs()
+        if stale:
+            try:
+                self.controller.load_into_tabs(self.current_data, only=stale)
+            except Exception as e:
+                logger.warning(f'Controller load warning: {e}')
+        self.controller.dirty_paths.clear()
+        if self._yaml_view_stale() or self._yaml_dirty:
+            self._set_yaml_view(self.current_data)
+        logger.debug('Refresh: reloaded %s', sorted(stale), category='UI')
 
     def commit_to_original(self):
-        """Commit the currently edited temp file back to the original file path, making a .bak of the original first."""
-        if not self.current_yaml_path or not self.current_original_path:
+        """Commit the current in-memory data back to the original file path, making a .bak of the original first."""
+        if self.current_data is None or not self.current_original_path:
             QtWidgets.QMessageBox.information(self, 'No original', 'No original file to commit to (open a file first)')
             return
         # confirm with user
         resp = QtWidgets.QMessageBox.question(self, 'Commit', f'Commit changes to original file? This will overwrite:\n{self.current_original_path}\nA .bak will be created.')
         if resp != QtWidgets.QMessageBox.StandardButton.Yes:
             return
+        # write from current_data or yaml tab depending on preference
+        try:
+            to_write = self._collect_data_for_save()
+        except ValueError as e:
+            QtWidgets.QMessageBox.warning(self, 'YAML Error', str(e))
+            return
+        self._run_job('Committing changes...', self._commit_job,
+                      (self.crypt, self.current_original_path, to_write, self.current_userid),
+                      self._commit_done, 'Commit failed')
+
+    @staticmethod
+    def _commit_job(job, crypt, original_path, to_write, userid):
+        job.report(10, 'Serializing YAML...')
+        text = fileio.safe_dump_yaml(to_write)
+        job.report(40, 'Writing original...')
+        # create backup of original
         try:
-            # create backup of original
+            if os.path.exists(original_path):
+                bak = original_path + '.bak'
+                shutil.copy2(original_path, bak)
+        except Exception as e:
+            logger.warning(f'Failed to create .bak: {e}')
+
+        # If original was a .sav, we need to encrypt the YAML to produce a .sav
+        if original_path.lower().endswith('.sav'):
+            ok = crypt.encrypt_bytes(text.encode('utf-8'), original_path, userid=userid)
+            if not ok:
+                raise RuntimeError('Encryption failed during commit')
+        else:
+            # For yaml originals, write to a temp file then copy over
+            t = tempfile.NamedTemporaryFile(delete=False, suffix='.yaml')
+            tpath = t.name
+            t.close()
             try:
-                if os.path.exists(self.current_original_path):
-                    bak = self.current_original_path + '.bak'
-                    shutil.copy2(self.current_original_path, bak)
-            except Exception as e:
-                logger.warning(f'Failed to create .bak: {e}')
-
-            # If original was a .sav, we need to encrypt current temp yaml to produce a .sav
-            if self.current_original_path.lower().endswith('.sav'):
-                # write temp yaml from current_data or yaml tab depending on preference
-                prefer_tabs = core_settings.get_setting('prefer_tabs_on_save', True)
-                if prefer_tabs:
-                    try:
-                        self.controller.save_from_tabs(self.current_data)
-                    except Exception:
-                        pass
-                    tmp_data = self.current_data
-                else:
-                    try:
-                        tmp_data = self.yaml_tab.get_yaml()
-                    except Exception:
-                        tmp_data = self.current_data
-                # create temporary yaml file
-                t = tempfile.NamedTemporaryFile(delete=False, suffix='.yaml')
-                tpath = t.name
-                t.close()
-                # use safe writer to avoid aliases (non-atomic temp write)
-                fileio.safe_write_yaml(tpath, tmp_data, atomic=False, make_backup=False)
-                ok = self.crypt.encrypt(tpath, self.current_original_path, userid=self.current_userid)
-                os.unlink(tpath)
-                if not ok:
-                    raise RuntimeError('Encryption failed during commit')
-            else:
-                # For yaml originals, write current_data or yaml tab content to a temp file then copy over
-                prefer_tabs = core_settings.get_setting('prefer_tabs_on_save', True)
-                if prefer_tabs:
-                    try:
-                        self.controller.save_from_tabs(self.current_data)
-                    except Exception:
-                        pass
-                    to_write = self.current_data
-                else:
-                    try:
-                        to_write = self.yaml_tab.get_yaml()
-                    except Exception:
-                        to_write = self.current_data
-                t = tempfile.NamedTemporaryFile(delete=False, suffix='.yaml')
-                tpath = t.name
-                t.close()
-                fileio.safe_write_yaml(tpath, to_write, atomic=False, make_backup=False)
+                with open(tpath, 'w', encoding='utf-8') as f:
+                    f.write(text)
                 # copy temp over original
-                shutil.copy2(tpath, self.current_original_path)
+                shutil.copy2(tpath, original_path)
+            finally:
                 os.unlink(tpath)
+        return original_path
 
-            self.statusBar().showMessage(f'Committed changes to {self.current_original_path}')
-            logger.info(f'Committed changes to original: {self.current_original_path}')
-        except Exception as e:
-            logger.error(f'Error committing to original: {e}')
-            QtWidgets.QMessageBox.critical(self, 'Commit Failed', str(e))
+    def _commit_done(self, original_path):
+        self.statusBar().showMessage(f'Committed changes to {original_path}')
+        logger.info(f'Committed changes to original: {original_path}')
+
+    def _on_yaml_text_changed(self):
+        if not self._yaml_sync_in_progress:
+            self._yaml_dirty = True
 
-    def _on_yaml_edited(self):
-        # user edited YAML text; attempt to parse and apply into tabs
+    def _on_yaml_edited(self, text):
+        # user paused typing in the YAML tab: parse off the GUI thread, then
+        # apply only the subtrees that changed
         if getattr(self, '_yaml_sync_in_progress', False):
             return
+        if self._yaml_parse_job is not None:
+            # one parse at a time; the latest text is parsed when it finishes
+            self._yaml_pending_text = text
+            return
+        job = Job(self._parse_yaml_job, text, self.current_data, self._yaml_parse_gen)
+        self._yaml_parse_job = job
+        job.signals.finished.connect(self._on_yaml_parsed)
+        job.signals.failed.connect(self._on_yaml_parse_failed)
+        job.start()
+
+    @staticmethod
+    def _parse_yaml_job(job, text, current, gen):
+        # only the parse runs here: current_data stays editable in the tabs,
+        # so it is diffed on the GUI thread (_on_yaml_parsed)
+        return gen, current, parse_yaml_text(text)
+
+    def _next_yaml_parse(self):
+        self._yaml_parse_job = None
+        text, self._yaml_pending_text = self._yaml_pending_text, None
+        if text is not None:
+            self._on_yaml_edited(text)
+            return True
+        return False
+
+    def _on_yaml_parse_failed(self, message):
+        # invalid YAML (usually mid-edit) — don't apply
+        logger.debug('YAML sync skipped: %s', message, category='YAML')
+        self._next_yaml_parse()
+
+    def _on_yaml_parsed(self, result):
+        if self._next_yaml_parse():
+            # newer text is already being parsed; this result is stale
+            return
+        gen, base, parsed = result
+        if gen != self._yaml_parse_gen or base is not self.current_data:
+            # the text was synced before a save, or a file was opened meanwhile
+            return
+        if self._active_job is not None:
+            # a save is reading current_data; retry once it is done
+            self.yaml_tab.schedule_sync()
+            return
+        self._apply_yaml(parsed)
+
+    def _sync_yaml_now(self):
+        """Parse and apply YAML edits not synced yet, on the GUI thread.
+
+        Used before saving, so the pending debounce or a parse still running
+        cannot leave the latest text out. Raises ValueError if it does not parse.
+        """
+        if not self._yaml_dirty or self.current_data is None:
+            return
+        self.yaml_tab.cancel_sync()
+        self._yaml_pending_text = None
+        self._yaml_parse_gen += 1
+        self._apply_yaml(self.yaml_tab.get_yaml())
+
+    def _apply_yaml(self, parsed):
+        """Apply parsed YAML-tab text to current_data and reload the affected tabs."""
+        base = self.current_data
+        # None means "replace everything" (no previous data or not a mapping)
+        changed = None
+        if isinstance(base, dict) and isinstance(parsed, dict):
+            changed = diff_paths(base, parsed)
         try:
             self._yaml_sync_in_progress = True
-            if not hasattr(self.yaml_tab, 'get_yaml'):
-                return
-            try:
-                parsed = self.yaml_tab.get_yaml()
-            except ValueError:
-                # invalid YAML — don't apply
+            if changed is None:
+                # replace current_data and re-load into tabs
+                self.current_data = parsed
+                only = None
+            elif not changed:
+                self._yaml_dirty = False
                 return
-            # replace current_data and re-load into tabs
-            self.current_data = parsed
+            else:
+                # graft changed subtrees so untouched ones (and the tabs showing them) are kept
+                apply_paths(self.current_data, parsed, changed)
+                only = self.controller.tabs_for_changes(self.current_data, changed)
+                logger.debug('YAML sync: %d changed path(s), reloading %s', len(changed), sorted(only), category='YAML')
             try:
-                self.controller.load_into_tabs(parsed)
+                self.controller.load_into_tabs(self.current_data, only=only)
             except Exception as e:
                 logger.warning(f'Failed to load YAML edits into tabs: {e}')
+            self._yaml_dirty = False
         finally:
-            self._yaml_sync_in_progress = False
\ No newline at end of file
+            self._yaml_sync_in_progress = False
+        self._refresh_search()
+
+    # --- global search -----------------------------------------------------
+
+    def show_search(self):
+        """Show the search dock (built on first use) and focus its search box."""
+        if self.search_dock is None:
+            from bl4_editor.ui.widgets.save_search import SaveSearchPanel
+            self.search_panel = SaveSearchPanel(self.search_index)
+            self.search_panel.path_activated.connect(self.goto_path)
+            self.search_dock = QtWidgets.QDockWidget('Search', self)
+            self.search_dock.setObjectName('search_dock')
+            self.search_dock.setWidget(self.search_panel)
+            self.addDockWidget(QtCore.Qt.RightDockWidgetArea, self.search_dock)
+        self.search_dock.show()
+        self.search_dock.raise_()
+        # start indexing while the query is typed
+        self.search_index()
+        self.search_panel.focus_search()
+
+    def _search_key(self):
+        return (id(self.current_data), self.controller.load_count, self.controller.edit_count)
+
+    def search_index(self):
+        """The SaveIndex of current_data, or None while it is being (re)built.
+
+        The index is built once per load, off the GUI thread, and again only
+        after the data was edited or reloaded.
+        """
+        if self.current_data is None:
+            return None
+        key = self._search_key()
+        if self._search_index is not None and self._search_index_key == key:
+            return self._search_index
+        if self._index_job is None:
+            job = Job(self._index_job_fn, self.current_data, key)
+            self._index_job = job
+            job.signals.finished.connect(self._on_index_built)
+            job.signals.failed.connect(lambda message, k=key: self._on_index_failed(message, k))
+            job.start()
+        return None
+
+    @staticmethod
+    def _index_job_fn(job, data, key):
+        with trace.span('search.index', 'Search'):
+            return key, SaveIndex(data)
+
+    def _on_index_built(self, result):
+        self._index_job = None
+        key, index = result
+        self._search_index, self._search_index_key = index, key
+        logger.debug('Search index: %d nodes', len(index), category='Search')
+        if key != self._search_key():
+            # edited or reloaded while indexing
+            self.search_index()
+        elif self.search_panel is not None:
+            self.search_panel.run_search()
+
+    def _on_index_failed(self, message, key):
+        self._index_job = None
+        logger.warning(f'Search index failed: {message}')
+        # the data changed under the job (e.g. an edit mid-walk): try again
+        if key != self._search_key() and self.search_panel is not None:
+            self.search_panel.run_search()
+
+    def _refresh_search(self):
+        # re-run the shown query against the new data (indexing first)
+        if self.search_dock is not None and self.search_dock.isVisible():
+            self.search_panel.run_search()
+
+    def goto_path(self, path):
+        """Show the node at path (keys from the save root) and select it.
+
+        Opens the tree tab holding it (the one with the most specific source
+        path) or, for nodes not shown in a tree, the YAML view. Only the
+        nodes along path are visited.
+        """
+        data = self.current_data
+        if not isinstance(data, dict):
+            return False
+        path = list(path)
+        sources = self.controller.source_paths(data)
+        names = [n for n in TREE_TABS if n in sources and tuple(path[:len(sources[n])]) == sources[n]]
+        for name in sorted(names, key=lambda n: -len(sources[n])):
+            tab = self.lazy_tabs[name]
+            tree = getattr(tab.widget(), 'tree', None)
+            if tree is None or tree.data_model is None:
+                continue
+            rel = relative_path(data, path, tree.data_model)
+            if rel is not None and tree.tree_model.index_for_path(rel).isValid():
+                self.tabs.setCurrentWidget(tab)
+                tree.select_path(rel)
+                return True
+        # character fields, items and hidden subtrees: the YAML view
+        if self._yaml_view_stale() and not self._yaml_dirty:
+            self._set_yaml_view(data)
+        self.tabs.setCurrentWidget(self.yaml_tab)
+        return self.yaml_tab.goto_path(path)
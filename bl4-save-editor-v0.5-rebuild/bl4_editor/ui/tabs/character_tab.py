@@ -4,6 +4,8 @@ from typing import Any, Dict
 
 class CharacterTab(QtWidgets.QWidget):
     """Character editing tab with form-based UI similar to your alpha build"""
+    # path (relative to self.data) of each edit made in the form
+    data_edited = QtCore.Signal(object)
     
     def __init__(self):
         super().__init__()
@@ -146,11 +148,13 @@ class CharacterTab(QtWidgets.QWidget):
             for part in parts[:-1]:
                 current = current.setdefault(part, {})
             current[parts[-1]] = value
+            self.data_edited.emit(('state', *parts))
         else:
             # Direct key in state
             if 'state' not in self.data:
                 self.data['state'] = {}
             self.data['state'][key] = value
+            self.data_edited.emit(('state', key))
     
     def _update_experience_value(self, index: int, field: str, value: Any):
         """Update experience array values"""
@@ -164,6 +168,7 @@ class CharacterTab(QtWidgets.QWidget):
             exp_list.append({})
         
         exp_list[index][field] = value
+        self.data_edited.emit(('state', 'experience', index, field))
     
     def save_data(self) -> Dict[str, Any]:
         """Return current character data"""
@@ -1,23 +1,73 @@
+from collections import deque
+import time
 from PySide6 import QtWidgets, QtCore
+from bl4_editor.core import trace
+
+# lines kept in the view (older ones are dropped by the document)
+MAX_LINES = 5000
+# how often queued lines are written to the view
+FLUSH_INTERVAL_MS = 100
 
 
 class DebugTab(QtWidgets.QWidget):
+    """Log view backed by a bounded QPlainTextEdit.
+
+    append_log() only queues the formatted line, so it is cheap and safe to
+    call from any thread; a timer on the GUI thread appends the queued lines
+    in one batch.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         layout = QtWidgets.QVBoxLayout(self)
+        row = QtWidgets.QHBoxLayout()
+        row.addStretch(1)
+        self.export_trace_btn = QtWidgets.QPushButton('Export trace...', self)
+        self.export_trace_btn.setToolTip('Save recorded load/save timings as Chrome trace JSON (chrome://tracing, Perfetto)')
+        self.export_trace_btn.clicked.connect(self.export_trace)
+        row.addWidget(self.export_trace_btn)
+        layout.addLayout(row)
         self.text = QtWidgets.QPlainTextEdit(self)
         self.text.setReadOnly(True)
+        self.text.setMaximumBlockCount(MAX_LINES)
         layout.addWidget(self.text)
+        # deque appends/pops are thread-safe; excess lines are dropped before display
+        self._pending = deque(maxlen=MAX_LINES)
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.timeout.connect(self.flush)
+        self._flush_timer.start(FLUSH_INTERVAL_MS)
 
     def append_log(self, level: str, msg: str, category: str = None):
-        ts = QtCore.QDateTime.currentDateTime().toString('yyyy-MM-dd HH:mm:ss')
-        cur = self.text.toPlainText() or ''
+        ts = time.strftime('%Y-%m-%d %H:%M:%S')
         cat = f'[{category}] ' if category else ''
-        cur += f'[{ts}] {level.upper()}: {cat}{msg}\n'
-        if len(cur) > 20000:
-            cur = cur[-20000:]
-        self.text.setPlainText(cur)
-        self.text.verticalScrollBar().setValue(self.text.verticalScrollBar().maximum())
+        self._pending.append(f'[{ts}] {level.upper()}: {cat}{msg}')
+
+    def flush(self):
+        if not self._pending:
+            return
+        lines = []
+        try:
+            while True:
+                lines.append(self._pending.popleft())
+        except IndexError:
+            pass
+        bar = self.text.verticalScrollBar()
+        # only follow the tail if the user has not scrolled up
+        at_bottom = bar.value() >= bar.maximum() - 2
+        self.text.appendPlainText('\n'.join(lines))
+        if at_bottom:
+            bar.setValue(bar.maximum())
+
+    def export_trace(self):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, 'Export trace', 'bl4_trace.json', 'Trace JSON (*.json)')
+        if not path:
+            return
+        try:
+            count = trace.export_chrome_trace(path)
+        except OSError as e:
+            QtWidgets.QMessageBox.warning(self, 'Export trace', f'Could not write {path}:\n{e}')
+            return
+        self.append_log('info', f'Exported {count} trace events to {path}', 'Trace')
 
     def load_data(self, d):
         # Debug has no model to load
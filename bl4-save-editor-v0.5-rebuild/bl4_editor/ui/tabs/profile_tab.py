@@ -9,7 +9,9 @@ class ProfileTab(QtWidgets.QWidget):
 
     - load_data(data): load the profile dict
     - save_data(): return the possibly-updated profile dict
+    - data_edited(path): emitted for each edit, path relative to the profile dict
     """
+    data_edited = QtCore.Signal(object)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -21,7 +23,8 @@ class ProfileTab(QtWidgets.QWidget):
 
         # Left: tree
         self.tree = ProfileTree()
-        self.tree.itemSelectionChanged.connect(self._on_selection_changed)
+        self.tree.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.tree.tree_model.value_edited.connect(lambda path: self.data_edited.emit(tuple(path)))
         lay.addWidget(self.tree, 1)
         # Right: simple details pane (placeholder + editors)
         self.right = QtWidgets.QStackedWidget()
@@ -67,17 +70,22 @@ class ProfileTab(QtWidgets.QWidget):
 
         self.data = profile_candidate
 
-        # Build tree rooted at 'Profile', but exclude the domains.local.shared.inventory.items.bank subtree
+        # Build tree rooted at 'Profile', hiding the inventory.items.bank subtrees;
+        # the tree wraps self.data itself, so edits land on the loaded profile
         try:
-            tree_data = self._profile_tree_copy(self.data)
-            self.tree.build_from('Profile', tree_data)
+            self.tree.build_from('Profile', self.data, exclude=self.TREE_EXCLUDE)
         except Exception:
             # fallback: just clear
             self.tree.clear()
 
         # Build group pages for each top-level key for quick navigation
         # Rebuild the right-side pages and pref subtabs
-        self.right.clear()
+        # (QStackedWidget has no clear(); keep the placeholder label alive)
+        self.right_placeholder.setParent(None)
+        while self.right.count():
+            page = self.right.widget(0)
+            self.right.removeWidget(page)
+            page.deleteLater()
         # ensure placeholder is present
         placeholder_page = QtWidgets.QWidget()
         ph_l = QtWidgets.QVBoxLayout(placeholder_page)
@@ -115,40 +123,11 @@ class ProfileTab(QtWidgets.QWidget):
     def save_data(self):
         return self.data
 
-    def _profile_tree_copy(self, src):
-        """Return a copy of src suitable for the ProfileTree: strip out domains.local.shared.inventory.items.bank to avoid duplicate bank display."""
-        try:
-            import copy
-            s = copy.deepcopy(src)
-            # remove domains.local.shared.inventory.items.bank
-            try:
-                if isinstance(s, dict) and 'domains' in s:
-                    local = s['domains'].get('local', {})
-                    if isinstance(local, dict) and 'shared' in local:
-                        shared = local['shared']
-                        if isinstance(shared, dict):
-                            inv = shared.get('inventory', {})
-                            if isinstance(inv, dict):
-                                items = inv.get('items', {})
-                                if isinstance(items, dict) and 'bank' in items:
-                                    del items['bank']
-            except Exception:
-                pass
-
-            # also remove top-level shared.inventory.items.bank if present
-            try:
-                if isinstance(s, dict) and 'shared' in s and isinstance(s['shared'], dict):
-                    inv = s['shared'].get('inventory', {})
-                    if isinstance(inv, dict):
-                        items = inv.get('items', {})
-                        if isinstance(items, dict) and 'bank' in items:
-                            del items['bank']
-            except Exception:
-                pass
-
-            return s
-        except Exception:
-            return src
+    # bank items are shown by the ItemsTab
+    TREE_EXCLUDE = (
+        ('domains', 'local', 'shared', 'inventory', 'items', 'bank'),
+        ('shared', 'inventory', 'items', 'bank'),
+    )
 
     def _write_pref_value(self, section, key, value):
         try:
@@ -157,9 +136,10 @@ class ProfileTab(QtWidgets.QWidget):
             if section not in self.data or not isinstance(self.data[section], dict):
                 self.data[section] = {}
             self.data[section][key] = value
+            self.data_edited.emit((section, key))
             # refresh tree view to reflect change
             try:
-                self.tree.build_from('Profile', self.data)
+                self.tree.build_from('Profile', self.data, exclude=self.TREE_EXCLUDE)
             except Exception:
                 pass
         except Exception:
@@ -177,25 +157,26 @@ class ProfileTab(QtWidgets.QWidget):
         except Exception:
             pass
 
-    def _on_selection_changed(self):
-        sel = self.tree.selectedItems()
+    def _on_selection_changed(self, *_):
+        sel = self.tree.selectionModel().selectedRows(0)
         if not sel:
             self.right.setCurrentIndex(0)
             return
-        item = sel[0]
-        path = item.data(0, QtCore.Qt.UserRole)
+        index = sel[0]
+        path = index.data(QtCore.Qt.UserRole)
         if not path:
             self.right.setCurrentIndex(0)
             return
+        value_index = index.siblingAtColumn(1)
         # show a small editor panel for the selected item
         editor = QtWidgets.QWidget()
         el = QtWidgets.QFormLayout(editor)
         key_label = QtWidgets.QLabel(str(path[-1]))
-        value_edit = QtWidgets.QLineEdit(str(item.text(1)))
+        value_edit = QtWidgets.QLineEdit(str(value_index.data() or ''))
 
         def commit():
-            # update the tree item text to trigger the ProfileTree set_by_path
-            item.setText(1, value_edit.text())
+            # write through the tree model, which applies set_by_path
+            self.tree.model().setData(value_index, value_edit.text())
 
         save_btn = QtWidgets.QPushButton('Save')
         save_btn.clicked.connect(commit)
@@ -220,19 +201,5 @@ class ProfileTab(QtWidgets.QWidget):
             self.right.setCurrentIndex(self.right.count() - 1)
 
     def _select_path(self, path_list):
-        # traverse tree to find item by matching UserRole path
-        def walk(parent):
-            for i in range(parent.childCount()):
-                ch = parent.child(i)
-                p = ch.data(0, QtCore.Qt.UserRole)
-                if p == path_list:
-                    self.tree.setCurrentItem(ch)
-                    return True
-                if ch.childCount() and walk(ch):
-                    return True
-            return False
-
-        for i in range(self.tree.topLevelItemCount()):
-            root = self.tree.topLevelItem(i)
-            if walk(root):
-                return
+        # the tree model resolves the path and fetches only the nodes along it
+        self.tree.select_path(path_list)
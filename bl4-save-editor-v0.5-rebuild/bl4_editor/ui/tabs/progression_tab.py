@@ -1,13 +1,17 @@
-from PySide6 import QtWidgets
+from PySide6 import QtWidgets, QtCore
 from bl4_editor.ui.widgets.profile_tree import ProfileTree
 
 
 class ProgressionTab(QtWidgets.QWidget):
+    # path (relative to self.data) of each edit made in the tab
+    data_edited = QtCore.Signal(object)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.data = {}
         layout = QtWidgets.QVBoxLayout(self)
         self.tree = ProfileTree(self)
+        self.tree.tree_model.value_edited.connect(lambda path: self.data_edited.emit(tuple(path)))
         layout.addWidget(self.tree)
 
     def load_data(self, d):
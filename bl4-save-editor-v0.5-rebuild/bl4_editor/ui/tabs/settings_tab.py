@@ -25,6 +25,12 @@ class SettingsTab(QtWidgets.QWidget):
         self.save_precedence_chk.stateChanged.connect(self.toggle_save_precedence)
         layout.addWidget(self.save_precedence_chk)
 
+        # Working copies of opened files
+        self.temp_copy_chk = QtWidgets.QCheckBox("Keep a working copy of opened files in ./temp")
+        self.temp_copy_chk.setChecked(core_settings.get_setting("keep_temp_copies", False))
+        self.temp_copy_chk.stateChanged.connect(self.toggle_temp_copies)
+        layout.addWidget(self.temp_copy_chk)
+
         # Log retention spinbox
         retention_layout = QtWidgets.QHBoxLayout()
         retention_label = QtWidgets.QLabel("Log retention (minutes):")
@@ -47,5 +53,8 @@ class SettingsTab(QtWidgets.QWidget):
     def toggle_save_precedence(self, state):
         core_settings.set_setting("prefer_tabs_on_save", bool(state))
 
+    def toggle_temp_copies(self, state):
+        core_settings.set_setting("keep_temp_copies", bool(state))
+
     def change_retention(self, val):
         core_settings.set_setting("log_retention", int(val))
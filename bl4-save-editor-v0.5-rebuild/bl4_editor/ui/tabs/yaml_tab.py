@@ -1,5 +1,144 @@
 from PySide6 import QtWidgets, QtGui, QtCore
 import yaml
+from bl4_editor.core import settings as core_settings
+from bl4_editor.core import trace
+
+# libyaml parser when available (same documents, much faster on big saves)
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def dump_yaml_text(data):
+    """YAML text shown in the editor for data (safe to call off the GUI thread)."""
+    try:
+        with trace.span('yaml.render', 'YAML'):
+            return yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
+    except Exception:
+        # fallback to a repr
+        return repr(data)
+
+
+def parse_yaml_text(text):
+    """Parse editor text into data (safe to call off the GUI thread).
+
+    Raises ValueError for invalid YAML.
+    """
+    if not text.strip():
+        return {}
+    try:
+        return yaml.load(text, Loader=_SafeLoader)
+    except Exception as e:
+        # re-raise with context so callers can show a message box
+        raise ValueError(f'Invalid YAML: {e}')
+
+
+def _yaml_key(body):
+    """(key text, rest after ':') of a 'key: value' line body, or (None, '')."""
+    if body[:1] in ('"', "'"):
+        q = body[0]
+        i = 1
+        while True:
+            i = body.find(q, i)
+            if i == -1:
+                return None, ''
+            # '' is an escaped quote inside single quotes
+            if q == "'" and body.startswith("''", i):
+                i += 2
+                continue
+            if q == '"' and body[i - 1] == '\\':
+                i += 1
+                continue
+            break
+        key = body[1:i]
+        key = key.replace("''", "'") if q == "'" else key.replace('\\"', '"')
+        rest = body[i + 1:]
+        if not rest.startswith(':'):
+            return None, ''
+        return key, rest[1:]
+    key, sep, rest = body.partition(': ')
+    if not sep:
+        if not body.endswith(':'):
+            return None, ''
+        key, rest = body[:-1], ''
+    return key, rest
+
+
+def _yaml_child(lines, line, col, key):
+    """Find key among the entries of the block node whose first entry is at (line, col).
+
+    Returns (line of the entry, (line, col) of its block content or None for
+    a scalar/flow value), or None when not found.
+    """
+    j = line
+    n = -1
+    seq = None
+    while j < len(lines):
+        raw = lines[j]
+        if j == line:
+            body, ind = raw[col:], col
+        else:
+            body = raw.lstrip(' ')
+            ind = len(raw) - len(body)
+            if not body or body.startswith('#') or ind > col:
+                # blank, comment, or nested under an earlier entry
+                j += 1
+                continue
+            if ind < col:
+                return None
+        is_item = body == '-' or body.startswith('- ')
+        if seq is None:
+            seq = is_item
+        if seq:
+            if not is_item:
+                # an indentless sequence ends at its parent's next key
+                return None
+            n += 1
+            if isinstance(key, int) and n == key:
+                rest = body[1:].lstrip(' ')
+                if rest:
+                    return j, (j, col + len(body) - len(rest))
+                return j, _yaml_block_start(lines, j, col)
+        elif not is_item:
+            k, rest = _yaml_key(body)
+            if k is not None and k == str(key):
+                rest = rest.strip()
+                if rest and not rest.startswith(('|', '>', '&', '!')):
+                    return j, None
+                return j, _yaml_block_start(lines, j, col)
+        j += 1
+    return None
+
+
+def _yaml_block_start(lines, line, col):
+    # first line after `line` holding the value of the entry at col
+    for j in range(line + 1, len(lines)):
+        body = lines[j].lstrip(' ')
+        if not body or body.startswith('#'):
+            continue
+        ind = len(lines[j]) - len(body)
+        if ind > col or (ind == col and (body == '-' or body.startswith('- '))):
+            return j, ind
+        return None
+    return None
+
+
+def yaml_line_for_path(text, path):
+    """Line number (0-based) of the node at path in block-style YAML text.
+
+    Meant for text written by dump_yaml_text. Only the entries of the nodes
+    along the path are scanned; if a key is not found, the line of its
+    deepest ancestor that was found is returned.
+    """
+    lines = text.split('\n')
+    found = 0
+    at = (0, 0)
+    for key in path:
+        if at is None:
+            break
+        hit = _yaml_child(lines, at[0], at[1], key)
+        if hit is None:
+            break
+        found, at = hit
+    return found
 
 
 class YAMLSyntaxHighlighter(QtGui.QSyntaxHighlighter):
@@ -49,11 +188,15 @@ class YamlTab(QtWidgets.QWidget):
     """A simple YAML editor tab that shows raw YAML and can parse it back.
 
     Methods:
-    - set_yaml(data): populate the editor with YAML text for `data`
+    - set_yaml(data, text=None): populate the editor with YAML text for `data`
     - get_yaml(): parse and return Python object (dict/list) from editor text
+
+    text_changed fires on every edit; edit_settled(text) fires once typing has
+    paused for the 'yaml_sync_delay_ms' setting, and is what syncing should use.
     """
     # signal emitted when user edits YAML (after Qt's textChanged)
     text_changed = QtCore.Signal()
+    edit_settled = QtCore.Signal(str)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -68,6 +211,11 @@ class YamlTab(QtWidgets.QWidget):
         # syntax highlighter
         self._highlighter = YAMLSyntaxHighlighter(self.editor.document())
 
+        # debounce: restarted on each edit, fires edit_settled when it runs out
+        self._settle_timer = QtCore.QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.timeout.connect(self._emit_settled)
+
         # relay editor changes
         self.editor.textChanged.connect(self._on_text_changed)
 
@@ -77,21 +225,43 @@ class YamlTab(QtWidgets.QWidget):
             self.text_changed.emit()
         except Exception:
             pass
+        self.schedule_sync()
 
-    def set_yaml(self, data):
+    def schedule_sync(self):
+        """(Re)start the debounce timer for edit_settled."""
         try:
-            text = yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
+            delay = int(core_settings.get_setting('yaml_sync_delay_ms', 400))
         except Exception:
-            # fallback to a repr
-            text = repr(data)
-        self.editor.setPlainText(text)
+            delay = 400
+        self._settle_timer.start(max(0, delay))
+
+    def cancel_sync(self):
+        """Drop a pending edit_settled (the caller syncs the text itself)."""
+        self._settle_timer.stop()
+
+    def _emit_settled(self):
+        self.edit_settled.emit(self.editor.toPlainText())
+
+    def set_yaml(self, data, text=None):
+        # text may be pre-rendered (e.g. by a background job) via dump_yaml_text
+        if text is None:
+            text = dump_yaml_text(data)
+        with trace.span('tab.yaml.set_yaml', 'YAML'):
+            self.editor.setPlainText(text)
+        # programmatic updates are not user edits
+        self._settle_timer.stop()
+
+    def goto_path(self, path):
+        """Select the line of the node at path (see yaml_line_for_path)."""
+        line = yaml_line_for_path(self.editor.toPlainText(), list(path))
+        block = self.editor.document().findBlockByNumber(line)
+        if not block.isValid():
+            return False
+        cursor = QtGui.QTextCursor(block)
+        cursor.movePosition(QtGui.QTextCursor.EndOfBlock, QtGui.QTextCursor.KeepAnchor)
+        self.editor.setTextCursor(cursor)
+        self.editor.centerCursor()
+        return True
 
     def get_yaml(self):
-        text = self.editor.toPlainText()
-        if not text.strip():
-            return {}
-        try:
-            return yaml.safe_load(text)
-        except Exception as e:
-            # re-raise with context so callers can show a message box
-            raise ValueError(f'Invalid YAML: {e}')
+        return parse_yaml_text(self.editor.toPlainText())
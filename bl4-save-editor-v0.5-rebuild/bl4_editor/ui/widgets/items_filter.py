@@ -0,0 +1,192 @@
+from typing import List, Optional, Set
+from PySide6 import QtCore
+from bl4_editor.core import query
+from bl4_editor.core.query import Term, narrows
+from bl4_editor.core.serials import decode
+from bl4_editor.ui.widgets.items_model import ItemRef
+
+# field:value terms; type/level/part/flags use the model's catalog (exact ints)
+TEXT_FIELDS = ('slot', 'serial', 'notes', 'decoded')
+INDEXED_FIELDS = ('type', 'level', 'part', 'flags')
+
+
+def _index_term(field: str, value: str) -> Optional[Term]:
+    if field not in INDEXED_FIELDS:
+        return None
+    lo, sep, hi = value.partition('-')
+    try:
+        vals = range(int(lo), int(hi) + 1) if sep and field == 'level' else (int(value),)
+    except ValueError:
+        raise ValueError(f'{field}: expects a number, got {value!r}') from None
+    return Term('index', field, tuple(vals))
+
+
+def parse_query(text: str) -> List[Term]:
+    """Split a search string into terms (all must match; syntax in core.query).
+
+    word / "two words"   substring of slot, serial, flags, notes or decoded text
+    serial:@Ug notes:x   substring of one field
+    level:50 type:24     exact decoded value (level:40-50 is a range)
+    part:7 flags:3       item has that part index / state_flags value
+    /regex/  re:regex    regular expression (case-insensitive)
+    Raises ValueError for a bad regex or a non-numeric indexed value.
+    """
+    return query.parse_query(text, fields=TEXT_FIELDS, parse_field=_index_term)
+
+
+def _field_text(ref: ItemRef, field: str) -> str:
+    if field == 'slot':
+        return str(ref.key)
+    if field == 'decoded':
+        return decode(ref.item.get('serial', '')).text
+    return str(ref.item.get(field, ''))
+
+
+class ItemsFilterProxy(QtCore.QSortFilterProxyModel):
+    """Filter/sort proxy over an ItemsModel driven by parse_query() strings.
+
+    Matches are computed once per query into a set of ItemRefs (indexed terms
+    through the model's catalog, text terms against cached per-row strings),
+    so filterAcceptsRow is a set lookup. Typing more of the same text only
+    re-checks the previous matches. Rows added or edited while a filter is
+    active stay visible until the query changes. Sorting is delegated to
+    ItemsModel.sort().
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._text = ''
+        self._terms: List[Term] = []
+        self._matched: Optional[Set[ItemRef]] = None
+        # refs the current match set was computed over; others are new rows
+        self._seen: Set[ItemRef] = set()
+        self._haystacks = {}
+        self._source = None
+        # refs edited since the match set was computed
+        self._changed: Set[ItemRef] = set()
+        self.error = None
+
+    def setSourceModel(self, model):
+        old = self.sourceModel()
+        if old is not None:
+            old.modelAboutToBeReset.disconnect(self._on_source_reset)
+            old.dataChanged.disconnect(self._on_source_changed)
+        super().setSourceModel(model)
+        # kept to avoid a sourceModel() call per filtered row
+        self._source = model
+        model.modelAboutToBeReset.connect(self._on_source_reset)
+        model.dataChanged.connect(self._on_source_changed)
+        self._on_source_reset()
+
+    def _on_source_reset(self):
+        self._haystacks.clear()
+        self._matched = None
+
+    def _on_source_changed(self, top_left, bottom_right, _roles=()):
+        rows = self.sourceModel().rows
+        for r in range(top_left.row(), bottom_right.row() + 1):
+            if 0 <= r < len(rows):
+                self._haystacks.pop(rows[r], None)
+                self._changed.add(rows[r])
+
+    # --- query ------------------------------------------------------------
+
+    @property
+    def query(self) -> str:
+        return self._text
+
+    def set_query(self, text: str):
+        """Apply a search string; an invalid one matches nothing (see .error)."""
+        text = (text or '').strip()
+        if text == self._text:
+            return
+        old_terms = self._terms
+        # rows added or edited since then are re-checked too
+        old_matched = None if self._matched is None else self._matched | self._changed
+        if old_matched is not None:
+            old_matched |= {ref for ref in self.sourceModel().rows if ref not in self._seen}
+        self._text = text
+        try:
+            self._terms = parse_query(text)
+            self.error = None
+        except ValueError as e:
+            self._terms = []
+            self.error = str(e)
+        # a query implying the previous one only re-checks the previous matches
+        narrowing = old_matched is not None and self.error is None and narrows(old_terms, self._terms)
+        self._matched = None
+        self._compute(old_matched if narrowing else None)
+        self.invalidateRowsFilter()
+
+    def prepare(self):
+        """Build the per-row search strings (and catalog) ahead of the first query."""
+        model = self._source
+        if model is None:
+            return
+        for ref in model.rows:
+            self._haystack(ref)
+        model.catalog()
+
+    def _haystack(self, ref: ItemRef) -> str:
+        h = self._haystacks.get(ref)
+        if h is None:
+            item = ref.item
+            h = '\x00'.join((str(ref.key), str(item.get('serial', '')), str(item.get('state_flags', 0)),
+                             str(item.get('notes', '')), decode(item.get('serial', '')).text)).lower()
+            self._haystacks[ref] = h
+        return h
+
+    def _compute(self, candidates=None):
+        model = self.sourceModel()
+        rows = model.rows if model is not None else []
+        self._seen = set(rows)
+        self._changed = set()
+        if self.error:
+            self._matched = set()
+            return
+        if not self._terms:
+            self._matched = None
+            return
+        pool = self._seen if candidates is None else (candidates & self._seen)
+        catalog = model.catalog()
+        for t in self._terms:
+            if t.kind == 'index':
+                # a level range matches any of its values
+                pool = pool & catalog.query(**{t.field: list(t.value)})
+        checks = [t for t in self._terms if t.kind != 'index']
+        if checks:
+            keep = set()
+            for ref in pool:
+                hay = None
+                for t in checks:
+                    if t.kind == 'field':
+                        if t.value not in _field_text(ref, t.field).lower():
+                            break
+                    else:
+                        if hay is None:
+                            hay = self._haystack(ref)
+                        if t.kind == 'text':
+                            if t.value not in hay:
+                                break
+                        elif not t.value.search(hay):
+                            break
+                else:
+                    keep.add(ref)
+            pool = keep
+        self._matched = pool
+
+    # --- QSortFilterProxyModel --------------------------------------------
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        # the source sorts its rows with precomputed keys; the proxy keeps
+        # source order, so sorting 10k rows is one Python sort
+        self.sourceModel().sort(column, order)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._text:
+            return True
+        if self._matched is None:
+            self._compute()
+            if self._matched is None:
+                return True
+        ref = self._source.rows[source_row]
+        return ref in self._matched or ref not in self._seen
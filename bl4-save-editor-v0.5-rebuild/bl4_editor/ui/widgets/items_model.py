@@ -0,0 +1,291 @@
+import itertools
+from typing import Iterable, List, Optional
+from PySide6 import QtCore
+from bl4_editor.core import items as core_items
+from bl4_editor.core.items import ItemRef, Target
+from bl4_editor.core.serials import ItemIndex, decode
+
+
+class ItemsModel(QtCore.QAbstractTableModel):
+    """Table model over the save's own item dicts.
+
+    Cells are read from and written to the wrapped dicts directly, so edits
+    land in the loaded data as they happen and there is nothing to extract on
+    save. `target` is the container (or a callable returning it) that new
+    items are added to; None disables adding.
+
+    Type, Level and Decoded are read-only columns decoded from the serial
+    (memoized in core.serials); catalog() indexes the rows by those fields.
+    """
+    COLUMNS = ('Slot', 'Serial', 'Flags', 'Notes', 'Type', 'Level', 'Decoded')
+    FIELDS = (None, 'serial', 'state_flags', 'notes', None, None, None)
+    SLOT, SERIAL, FLAGS, NOTES, TYPE, LEVEL, DECODED = range(7)
+    # serials stay exactly as loaded
+    EDITABLE = (FLAGS, NOTES)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows: List[ItemRef] = []
+        self.target: Target = None
+        # built on first catalog() call, then kept in step with row edits
+        self._catalog: Optional[ItemIndex] = None
+        # ItemRef -> position in load/insert order, for sort(-1)
+        self._order = {}
+        self._seq = itertools.count()
+
+    # --- loading -----------------------------------------------------------
+
+    def reset(self, rows: List[ItemRef], target=None):
+        self.beginResetModel()
+        self.rows = rows
+        self.target = target
+        self._catalog = None
+        self._order = {ref: i for i, ref in enumerate(rows)}
+        self._seq = itertools.count(len(rows))
+        self.endResetModel()
+
+    def clear(self):
+        self.reset([], None)
+
+    # --- decoded serials --------------------------------------------------
+
+    def catalog(self) -> ItemIndex:
+        """Inverted index over the rows' decoded serials, keyed by ItemRef."""
+        if self._catalog is None:
+            self._catalog = ItemIndex((ref, ref.item) for ref in self.rows)
+        return self._catalog
+
+    def rows_matching(self, **criteria) -> List[int]:
+        """Row numbers whose items match catalog().query(**criteria)."""
+        matched = self.catalog().query(**criteria)
+        return [i for i, ref in enumerate(self.rows) if ref in matched]
+
+    def _index_ref(self, ref: ItemRef):
+        if self._catalog is not None:
+            self._catalog.update(ref, ref.item)
+
+    # --- Qt model API ------------------------------------------------------
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role not in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return None
+        ref = self.rows[index.row()]
+        col = index.column()
+        if col == self.SLOT:
+            return ref.key
+        if col == self.FLAGS:
+            flags = ref.item.get('state_flags', 0)
+            return flags if role == QtCore.Qt.EditRole else str(flags)
+        if col >= self.TYPE:
+            d = decode(ref.item.get('serial', ''))
+            if col == self.TYPE:
+                return d.type_name
+            if col == self.LEVEL:
+                return '' if d.level is None else str(d.level)
+            return d.text if d.valid else f'({d.error})'
+        value = ref.item.get(self.FIELDS[col], '')
+        return value if role == QtCore.Qt.EditRole else str(value)
+
+    def _sort_key(self, ref: ItemRef, col: int):
+        item = ref.item
+        if col == self.FLAGS:
+            try:
+                return int(item.get('state_flags', 0))
+            except (TypeError, ValueError):
+                return -1
+        if col in (self.TYPE, self.LEVEL):
+            d = decode(item.get('serial', ''))
+            value = d.type_id if col == self.TYPE else d.level
+            return -1 if value is None else value
+        if col == self.SLOT:
+            return str(ref.key).lower()
+        if col == self.DECODED:
+            return decode(item.get('serial', '')).text.lower()
+        return str(item.get(self.FIELDS[col], '')).lower()
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        """Reorder the rows by column (-1: load order). Save order is unaffected.
+
+        Keys are computed once per row and sorted in Python, instead of the
+        pairwise data() comparisons a sorting proxy would make.
+        """
+        n = len(self.rows)
+        if column < 0 or column >= len(self.COLUMNS):
+            keys = [self._order.get(ref, float('inf')) for ref in self.rows]
+            reverse = False
+        else:
+            keys = [self._sort_key(ref, column) for ref in self.rows]
+            reverse = order == QtCore.Qt.DescendingOrder
+        perm = sorted(range(n), key=keys.__getitem__, reverse=reverse)
+        if perm == list(range(n)):
+            return
+        self.layoutAboutToBeChanged.emit()
+        new_pos = [0] * n
+        for new, old in enumerate(perm):
+            new_pos[old] = new
+        self.rows = [self.rows[i] for i in perm]
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(old_indexes, [
+            self.index(new_pos[i.row()], i.column()) if 0 <= i.row() < n else QtCore.QModelIndex()
+            for i in old_indexes])
+        self.layoutChanged.emit()
+
+    def flags(self, index):
+        base = super().flags(index)
+        if index.isValid() and index.column() in self.EDITABLE:
+            base |= QtCore.Qt.ItemIsEditable
+        return base
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if not index.isValid() or role != QtCore.Qt.EditRole or index.column() not in self.EDITABLE:
+            return False
+        ref = self.rows[index.row()]
+        item = ref.item
+        col = index.column()
+        if col == self.FLAGS:
+            try:
+                item['state_flags'] = int(value)
+            except (TypeError, ValueError):
+                return False
+        else:
+            text = '' if value is None else str(value)
+            if text:
+                item['notes'] = text
+            else:
+                item.pop('notes', None)
+        if col == self.FLAGS:
+            self._index_ref(ref)
+        self.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole])
+        return True
+
+    # --- row operations (write through to the save) --------------------------
+
+    def _target_container(self):
+        return core_items.resolve_target(self.target)
+
+    def add_item(self, item: Optional[dict] = None) -> int:
+        """Append a new item to the target container; returns its row or -1."""
+        container = self._target_container()
+        if item is None:
+            item = {'serial': 'new_item_serial', 'state_flags': 0}
+        ref = core_items.insert_item(container, item, core_items.key_prefix(self.rows))
+        if ref is None:
+            return -1
+        row = len(self.rows)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.rows.append(ref)
+        self._order[ref] = next(self._seq)
+        self._index_ref(ref)
+        self.endInsertRows()
+        return row
+
+    def duplicate_row(self, row: int) -> int:
+        if not 0 <= row < len(self.rows):
+            return -1
+        src = self.rows[row]
+        added = core_items.duplicate_items([src], self.target, core_items.key_prefix(self.rows))
+        if not added:
+            return -1
+        ref = added[0]
+        new_row = len(self.rows)
+        self.beginInsertRows(QtCore.QModelIndex(), new_row, new_row)
+        self.rows.append(ref)
+        self._order[ref] = next(self._seq)
+        self._index_ref(ref)
+        self.endInsertRows()
+        return new_row
+
+    def remove_row(self, row: int) -> bool:
+        if not 0 <= row < len(self.rows):
+            return False
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        ref = self.rows.pop(row)
+        ref.detach()
+        if self._catalog is not None:
+            self._catalog.remove(ref)
+        self.endRemoveRows()
+        if core_items.relabel(self.rows):
+            self.dataChanged.emit(self.index(0, self.SLOT), self.index(len(self.rows) - 1, self.SLOT),
+                                  [QtCore.Qt.DisplayRole])
+        return True
+
+    # --- bulk operations (one pass over the data, one reset per batch) -------
+
+    def refs_at(self, rows: Iterable[int]) -> List[ItemRef]:
+        return [self.rows[r] for r in sorted(set(rows)) if 0 <= r < len(self.rows)]
+
+    def set_flags_rows(self, rows: Iterable[int], flags: int) -> int:
+        """Set state_flags on many rows; one dataChanged covers the batch."""
+        rows = sorted(set(r for r in rows if 0 <= r < len(self.rows)))
+        if not rows:
+            return 0
+        refs = [self.rows[r] for r in rows]
+        core_items.set_flags(refs, flags)
+        for ref in refs:
+            self._index_ref(ref)
+        self.dataChanged.emit(self.index(rows[0], self.FLAGS), self.index(rows[-1], self.FLAGS),
+                              [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole])
+        return len(refs)
+
+    def remove_rows(self, rows: Iterable[int]) -> int:
+        """Delete many rows (and their items) with a single model reset."""
+        refs = self.refs_at(rows)
+        if not refs:
+            return 0
+        self.beginResetModel()
+        removed = set(core_items.delete_items(refs)) | set(refs)
+        self._drop_refs(removed)
+        core_items.relabel(self.rows)
+        self.endResetModel()
+        return len(refs)
+
+    def duplicate_rows(self, rows: Iterable[int]) -> List[int]:
+        """Duplicate many rows into the target container; returns the new rows."""
+        refs = self.refs_at(rows)
+        if not refs or self._target_container() is None:
+            return []
+        self.beginResetModel()
+        start = len(self.rows)
+        self._add_refs(core_items.duplicate_items(refs, self.target, core_items.key_prefix(self.rows)))
+        self.endResetModel()
+        return list(range(start, len(self.rows)))
+
+    def move_rows_to(self, rows: Iterable[int], other: 'ItemsModel') -> int:
+        """Move the items of rows into other's target container (one reset per model)."""
+        refs = self.refs_at(rows)
+        container = other._target_container() if other is not self else None
+        if not refs or container is None:
+            return 0
+        self.beginResetModel()
+        other.beginResetModel()
+        removed, added = core_items.move_items(refs, container, core_items.key_prefix(other.rows))
+        self._drop_refs(set(removed))
+        core_items.relabel(self.rows)
+        other._add_refs(added)
+        other.endResetModel()
+        self.endResetModel()
+        return len(added)
+
+    def _drop_refs(self, refs: set):
+        self.rows = [r for r in self.rows if r not in refs]
+        for ref in refs:
+            self._order.pop(ref, None)
+            if self._catalog is not None:
+                self._catalog.remove(ref)
+
+    def _add_refs(self, refs: List[ItemRef]):
+        for ref in refs:
+            self.rows.append(ref)
+            self._order[ref] = next(self._seq)
+            self._index_ref(ref)
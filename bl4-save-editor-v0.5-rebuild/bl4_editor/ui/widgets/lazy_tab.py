@@ -0,0 +1,91 @@
+import importlib
+import time
+from typing import Any, Callable, Optional
+from PySide6 import QtWidgets, QtCore
+from bl4_editor.core import trace
+
+_NOTHING = object()
+
+
+def tab_factory(module: str, cls: str, *init_calls):
+    """Return a factory that imports module.cls only when the tab is built.
+
+    init_calls are method names called (without arguments) after construction,
+    e.g. 'load_data' for tabs that fill themselves.
+    """
+    def build():
+        widget = getattr(importlib.import_module(module), cls)()
+        for name in init_calls:
+            getattr(widget, name)()
+        return widget
+    return build
+
+
+class LazyTab(QtWidgets.QWidget):
+    """Tab page that builds the real tab the first time it is shown.
+
+    Until then load_data() payloads are kept and replayed on build, and
+    save_data()/data return the kept payload, so the controller can treat an
+    unbuilt tab like a built one. data_edited is relayed from the real tab.
+    on_built(name, seconds) is called after construction.
+    """
+    data_edited = QtCore.Signal(object)
+
+    def __init__(self, name: str, factory: Callable[[], QtWidgets.QWidget],
+                 on_built: Optional[Callable[[str, float], None]] = None, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self._factory = factory
+        self._on_built = on_built
+        self._widget = None
+        self._pending = _NOTHING
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def is_built(self) -> bool:
+        return self._widget is not None
+
+    def widget(self) -> QtWidgets.QWidget:
+        """The real tab (built now if needed)."""
+        if self._widget is None:
+            self._build()
+        return self._widget
+
+    def _build(self):
+        t0 = time.perf_counter()
+        with trace.span(f'tab.{self.name}.build', 'Tabs'):
+            widget = self._factory()
+        self._widget = widget
+        self.layout().addWidget(widget)
+        signal = getattr(widget, 'data_edited', None)
+        if signal is not None:
+            signal.connect(self.data_edited)
+        if self._pending is not _NOTHING:
+            payload, self._pending = self._pending, _NOTHING
+            with trace.span(f'tab.{self.name}.load_data', 'Tabs'):
+                widget.load_data(payload)
+        if self._on_built:
+            self._on_built(self.name, time.perf_counter() - t0)
+
+    def showEvent(self, event):
+        self.widget()
+        super().showEvent(event)
+
+    # --- tab interface used by TabController --------------------------------
+
+    @property
+    def data(self) -> Any:
+        if self._widget is not None:
+            return getattr(self._widget, 'data', None)
+        return None if self._pending is _NOTHING else self._pending
+
+    def load_data(self, d):
+        if self._widget is not None:
+            self._widget.load_data(d)
+        else:
+            self._pending = d
+
+    def save_data(self):
+        if self._widget is not None:
+            return self._widget.save_data()
+        return None if self._pending is _NOTHING else self._pending
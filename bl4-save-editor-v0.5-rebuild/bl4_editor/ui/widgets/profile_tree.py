@@ -1,116 +1,258 @@
-from typing import Any, List
+from typing import Any, Iterable, List, Optional
 from PySide6 import QtWidgets, QtCore
-import traceback
-
-
-def set_by_path(data: Any, path: List[Any], value: Any) -> bool:
-    if data is None or not path:
-        return False
-    cur = data
-    for p in path[:-1]:
-        if isinstance(cur, dict):
-            cur = cur.setdefault(p, {})
-        elif isinstance(cur, list) and isinstance(p, int):
-            while p >= len(cur):
-                cur.append({})
-            cur = cur[p]
-        else:
-            return False
-    last = path[-1]
-    if isinstance(cur, dict):
-        cur[last] = value
-        return True
-    if isinstance(cur, list) and isinstance(last, int):
-        while last >= len(cur):
-            cur.append(None)
-        cur[last] = value
-        return True
-    return False
+from bl4_editor.core.datapath import set_by_path
 
+# children are created in batches as the view asks for them
+FETCH_BATCH = 256
 
-class ProfileTree(QtWidgets.QTreeWidget):
-    """
-    QTreeWidget that stores a 'path' in Qt.UserRole for each item,
-    allows editing of the value column, and writes changes back via
-    callback to the data model using set_by_path.
+
+def _is_container(v: Any) -> bool:
+    return isinstance(v, (dict, list))
+
+
+def parse_value_text(new_text: str) -> Any:
+    """Convert edited text back to bool/int/float where it looks like one."""
+    if new_text.lower() in ("true", "false"):
+        return new_text.lower() == "true"
+    try:
+        if "." in new_text:
+            return float(new_text)
+        return int(new_text)
+    except Exception:
+        return new_text
+
+
+class _Node:
+    __slots__ = ('parent', 'label', 'key', 'path', 'value', 'row', 'children', '_keys', '_rows', 'exclude')
+
+    def __init__(self, parent, label: str, key: Any, path: List[Any], value: Any, row: int, exclude=frozenset()):
+        self.parent = parent
+        self.label = label
+        self.key = key
+        self.path = path
+        self.value = value
+        self.row = row
+        # None until first fetch; then the children built so far
+        self.children: Optional[List['_Node']] = None
+        self._keys = None
+        # child key -> row, built on the first row_of() call
+        self._rows = None
+        # set of path tuples hidden from the tree (shared by all nodes)
+        self.exclude = exclude
+
+    def child_keys(self):
+        if self._keys is None:
+            v = self.value
+            keys = list(v.keys()) if isinstance(v, dict) else list(range(len(v))) if isinstance(v, list) else []
+            if self.exclude and isinstance(v, dict):
+                base = tuple(self.path)
+                keys = [k for k in keys if base + (k,) not in self.exclude]
+            self._keys = keys
+        return self._keys
+
+    def row_of(self, key: Any) -> Optional[int]:
+        if self._rows is None:
+            self._rows = {k: i for i, k in enumerate(self.child_keys())}
+        return self._rows.get(key)
+
+    def total_children(self) -> int:
+        return len(self.child_keys()) if _is_container(self.value) else 0
+
+    def built(self) -> int:
+        return len(self.children) if self.children is not None else 0
+
+
+class ProfileTreeModel(QtCore.QAbstractItemModel):
+    """Two-column (Key, Value) tree over a nested dict/list.
+
+    Nodes are created only when their parent is expanded (canFetchMore /
+    fetchMore), in batches of FETCH_BATCH. Column 0 carries the node's path in
+    Qt.UserRole; editing column 1 writes back with set_by_path. Dict keys whose
+    path is in `exclude` are skipped, so subtrees can be hidden without copying
+    the data. value_edited(path) is emitted after each successful edit.
     """
+    value_edited = QtCore.Signal(list)
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setColumnCount(2)
-        self.setHeaderLabels(["Key", "Value"])
-        self.header().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
-        self.header().setStretchLastSection(True)
-        self.itemChanged.connect(self._on_item_changed)
-        self._editing_disabled = False
         self.data_model = None
+        self._root = _Node(None, '', None, [], None, 0)
+        self._root.children = []
 
-    def build_from(self, root_name: str, data_model: Any):
-        self.clear()
+    def reset(self, root_name: str, data_model: Any, exclude: Optional[Iterable[Iterable[Any]]] = None):
+        self.beginResetModel()
         self.data_model = data_model
-        root = QtWidgets.QTreeWidgetItem([root_name, ""])
-        root.setData(0, QtCore.Qt.UserRole, [])
-        self.addTopLevelItem(root)
-        self._add_children(root, data_model, [])
-        self.expandAll()
-        self.resizeColumnToContents(0)
-        self.resizeColumnToContents(1)
+        excluded = frozenset(tuple(p) for p in exclude) if exclude else frozenset()
+        top = _Node(self._root, root_name, None, [], data_model, 0, excluded)
+        self._root.children = [top] if root_name is not None else []
+        self.endResetModel()
 
-    def _add_children(self, parent_item: QtWidgets.QTreeWidgetItem, obj: Any, path: List[Any]):
-        try:
-            if isinstance(obj, dict):
-                for k, v in obj.items():
-                    child = QtWidgets.QTreeWidgetItem([str(k), "" if isinstance(v, (dict, list)) else str(v)])
-                    p = list(path) + [k]
-                    child.setData(0, QtCore.Qt.UserRole, p)
-                    if not isinstance(v, (dict, list)):
-                        child.setFlags(child.flags() | QtCore.Qt.ItemIsEditable)
-                    parent_item.addChild(child)
-                    if isinstance(v, (dict, list)):
-                        self._add_children(child, v, p)
-            elif isinstance(obj, list):
-                for i, v in enumerate(obj):
-                    child = QtWidgets.QTreeWidgetItem([f"[{i}]", "" if isinstance(v, (dict, list)) else str(v)])
-                    p = list(path) + [i]
-                    child.setData(0, QtCore.Qt.UserRole, p)
-                    if not isinstance(v, (dict, list)):
-                        child.setFlags(child.flags() | QtCore.Qt.ItemIsEditable)
-                    parent_item.addChild(child)
-                    if isinstance(v, (dict, list)):
-                        self._add_children(child, v, p)
-            else:
-                try:
-                    parent_item.setText(1, "" if obj is None else str(obj))
-                except Exception:
-                    pass
-        except Exception:
-            # keep UI responsive if model is unexpected
-            try:
-                parent_item.addChild(QtWidgets.QTreeWidgetItem(["<error>", "<error> "]))
-            except Exception:
-                pass
-
-    def _on_item_changed(self, item: QtWidgets.QTreeWidgetItem, column: int):
-        if self._editing_disabled:
-            return
-        if column != 1:
-            return
-        path = item.data(0, QtCore.Qt.UserRole)
-        if path is None or self.data_model is None:
+    # --- helpers -----------------------------------------------------------
+
+    def _node(self, index) -> _Node:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _make_child(self, node: _Node, key: Any, row: int) -> _Node:
+        v = node.value[key]
+        label = f"[{key}]" if isinstance(node.value, list) else str(key)
+        return _Node(node, label, key, node.path + [key], v, row, node.exclude)
+
+    def _fetch(self, node: _Node, parent_index, upto: int):
+        """Build children of node up to (excluding) row `upto`."""
+        if node.children is None:
+            node.children = []
+        start = len(node.children)
+        end = min(upto, node.total_children())
+        if end <= start:
             return
-        new_text = item.text(1)
-        value = new_text
-        if new_text.lower() in ("true", "false"):
-            value = new_text.lower() == "true"
-        else:
-            try:
-                if "." in new_text:
-                    value = float(new_text)
-                else:
-                    value = int(new_text)
-            except Exception:
-                value = new_text
+        keys = node.child_keys()
+        self.beginInsertRows(parent_index, start, end - 1)
+        for row in range(start, end):
+            node.children.append(self._make_child(node, keys[row], row))
+        self.endInsertRows()
+
+    # --- Qt model API ------------------------------------------------------
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        node = self._node(parent)
+        if node.children is None or not 0 <= row < len(node.children) or not 0 <= column < 2:
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        p = index.internalPointer().parent
+        if p is None or p is self._root:
+            return QtCore.QModelIndex()
+        return self.createIndex(p.row, 0, p)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        return self._node(parent).built()
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 2
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        node = self._node(parent)
+        if node is self._root:
+            return bool(node.children)
+        return node.total_children() > 0
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return node is not self._root and node.built() < node.total_children()
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        self._fetch(node, parent, node.built() + FETCH_BATCH)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return ("Key", "Value")[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == QtCore.Qt.UserRole and index.column() == 0:
+            return node.path
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            if index.column() == 0:
+                return node.label
+            if _is_container(node.value):
+                return ""
+            return "" if node.value is None else str(node.value)
+        return None
+
+    def flags(self, index):
+        base = super().flags(index)
+        if index.isValid() and index.column() == 1 and index.internalPointer().parent is not self._root \
+                and not _is_container(index.internalPointer().value):
+            base |= QtCore.Qt.ItemIsEditable
+        return base
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if role != QtCore.Qt.EditRole or not index.isValid() or index.column() != 1:
+            return False
+        node = index.internalPointer()
+        if self.data_model is None or not node.path:
+            return False
+        new_value = parse_value_text(str(value))
         try:
-            set_by_path(self.data_model, path, value)
+            if not set_by_path(self.data_model, node.path, new_value):
+                return False
         except Exception:
             # swallow errors
-            pass
+            return False
+        node.value = new_value
+        self.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole])
+        self.value_edited.emit(list(node.path))
+        return True
+
+    def index_for_path(self, path: List[Any]):
+        """Return the column-0 index for path, fetching only the nodes along it.
+
+        Each level is a dict lookup (row_of), so this costs the path's depth,
+        not the size of the tree.
+        """
+        if not self._root.children:
+            return QtCore.QModelIndex()
+        node = self._root.children[0]
+        index = self.createIndex(0, 0, node)
+        for key in path:
+            row = node.row_of(key) if _is_container(node.value) else None
+            if row is None:
+                return QtCore.QModelIndex()
+            self._fetch(node, index, row + 1)
+            node = node.children[row]
+            index = self.createIndex(row, 0, node)
+        return index
+
+
+class ProfileTree(QtWidgets.QTreeView):
+    """
+    Tree view over a ProfileTreeModel: stores a 'path' in Qt.UserRole for
+    each row, allows editing of the value column, and writes changes back to
+    the data model using set_by_path. Rows are built lazily on expand.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tree_model = ProfileTreeModel(self)
+        self.setModel(self.tree_model)
+        self.setUniformRowHeights(True)
+        self.header().setSectionResizeMode(0, QtWidgets.QHeaderView.Interactive)
+        self.header().setStretchLastSection(True)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.DoubleClicked |
+                             QtWidgets.QAbstractItemView.SelectedClicked |
+                             QtWidgets.QAbstractItemView.EditKeyPressed)
+
+    @property
+    def data_model(self):
+        return self.tree_model.data_model
+
+    def build_from(self, root_name: str, data_model: Any, exclude: Optional[Iterable[Iterable[Any]]] = None):
+        """Show data_model under root_name; paths in exclude (key lists) are hidden."""
+        self.tree_model.reset(root_name, data_model, exclude)
+        # only the root level is shown expanded; deeper levels load on demand
+        self.expand(self.tree_model.index(0, 0))
+        self.resizeColumnToContents(0)
+
+    def clear(self):
+        self.tree_model.reset(None, None)
+
+    def select_path(self, path: List[Any]) -> bool:
+        """Expand to and select the node at path; returns False if not found."""
+        index = self.tree_model.index_for_path(list(path))
+        if not index.isValid():
+            return False
+        parent = index.parent()
+        while parent.isValid():
+            self.expand(parent)
+            parent = parent.parent()
+        self.setCurrentIndex(index)
+        self.scrollTo(index)
+        return True
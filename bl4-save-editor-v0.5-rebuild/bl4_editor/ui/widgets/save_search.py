@@ -0,0 +1,111 @@
+from typing import Callable, List, Optional
+from PySide6 import QtWidgets, QtCore
+from bl4_editor.core.search_index import Hit, SaveIndex, value_text
+
+
+def _shown_value(value) -> str:
+    if isinstance(value, dict):
+        return f'{{{len(value)} keys}}'
+    if isinstance(value, list):
+        return f'[{len(value)} items]'
+    return value_text(value)
+
+
+class _HitsModel(QtCore.QAbstractTableModel):
+    COLUMNS = ('Path', 'Value')
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hits: List[Hit] = []
+
+    def reset(self, hits: List[Hit]):
+        self.beginResetModel()
+        self.hits = hits
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.hits)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role not in (QtCore.Qt.DisplayRole, QtCore.Qt.ToolTipRole):
+            return None
+        hit = self.hits[index.row()]
+        if index.column() == 0:
+            return hit.path_text
+        return _shown_value(hit.value)
+
+
+class SaveSearchPanel(QtWidgets.QWidget):
+    """Search box and result list over the whole loaded save.
+
+    get_index() returns the current SaveIndex, or None while it is being
+    built (call run_search() again once it is ready) or when nothing is
+    loaded. Clicking a result emits path_activated(path tuple).
+    """
+    path_activated = QtCore.Signal(tuple)
+
+    def __init__(self, get_index: Callable[[], Optional[SaveIndex]], parent=None):
+        super().__init__(parent)
+        self._get_index = get_index
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        self.search_edit = QtWidgets.QLineEdit()
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setPlaceholderText('Search save: text, "phrase", key:cash key:=cash, value:=0, path:stats, /regex/')
+        self.search_edit.textChanged.connect(self.run_search)
+        self.search_edit.returnPressed.connect(self._activate_first)
+        layout.addWidget(self.search_edit)
+        self.status = QtWidgets.QLabel()
+        layout.addWidget(self.status)
+        self.model = _HitsModel(self)
+        self.view = QtWidgets.QTreeView()
+        self.view.setRootIsDecorated(False)
+        self.view.setUniformRowHeights(True)
+        self.view.setModel(self.model)
+        self.view.header().setStretchLastSection(True)
+        self.view.clicked.connect(self._on_activated)
+        self.view.activated.connect(self._on_activated)
+        layout.addWidget(self.view, 1)
+
+    def focus_search(self):
+        self.search_edit.setFocus()
+        self.search_edit.selectAll()
+
+    def run_search(self, *_args):
+        query = self.search_edit.text().strip()
+        if not query:
+            self.model.reset([])
+            self.status.setText('')
+            return
+        index = self._get_index()
+        if index is None:
+            self.model.reset([])
+            self.status.setText('Indexing...')
+            return
+        try:
+            hits, more = index.search(query)
+        except ValueError as e:
+            self.model.reset([])
+            self.status.setText(str(e))
+            return
+        self.model.reset(hits)
+        self.view.resizeColumnToContents(0)
+        count = f'first {len(hits)}' if more else str(len(hits))
+        self.status.setText(f'{count} match(es) in {len(index)} nodes')
+
+    def _on_activated(self, index):
+        if index.isValid():
+            self.path_activated.emit(tuple(self.model.hits[index.row()].path))
+
+    def _activate_first(self):
+        if self.model.hits:
+            self.view.setCurrentIndex(self.model.index(0, 0))
+            self._on_activated(self.model.index(0, 0))
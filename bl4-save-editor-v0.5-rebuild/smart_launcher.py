@@ -1,11 +1,14 @@
-import sys, importlib, subprocess
-try:
-    import PySide6, yaml
-except Exception:
+import sys, importlib.util
+# probe without importing: the editor imports them itself, in this process
+missing = [m for m in ('PySide6', 'yaml') if importlib.util.find_spec(m) is None]
+if missing:
     try:
         from bl4_editor.core import logger
         logger.error('Missing dependencies. Run pip install -r requirements.txt')
     except Exception:
         print('Missing dependencies. Run pip install -r requirements.txt')
     sys.exit(1)
-subprocess.call([sys.executable, '-m', 'bl4_editor.main'])
+# run the editor here rather than in a second interpreter (arguments such as
+# --profile-startup are passed through)
+from bl4_editor.main import main
+sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,91 @@
+"""Saving right after a YAML-tab edit writes that edit, without waiting for the sync debounce."""
+import os
+import time
+
+import pytest
+import yaml
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+QtWidgets = pytest.importorskip('PySide6.QtWidgets')
+
+from bl4_editor.core import logger
+
+
+@pytest.fixture(scope='module')
+def app():
+    logger.init(to_file=False)
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def window(app):
+    from bl4_editor.ui.mainwindow import MainWindow
+    w = MainWindow()
+    data = {'state': {'currencies': {'cash': 123456789, 'eridium': 5}}}
+    w.current_data = data
+    w._apply_loaded_data(data)
+    yield w
+    w.close()
+
+
+def _wait(app, cond, timeout=10):
+    end = time.time() + timeout
+    while not cond() and time.time() < end:
+        app.processEvents()
+        time.sleep(0.01)
+    return cond()
+
+
+def _edit_yaml(w, old, new):
+    editor = w.yaml_tab.editor
+    editor.setPlainText(editor.toPlainText().replace(old, new))
+
+
+def _save_dialog(path):
+    class _Dialog:
+        AcceptSave = QtWidgets.QFileDialog.AcceptSave
+
+        def __init__(self, *args):
+            pass
+
+        def setAcceptMode(self, mode):
+            pass
+
+        def setNameFilters(self, filters):
+            pass
+
+        def exec(self):
+            return True
+
+        def selectedFiles(self):
+            return [path]
+    return _Dialog
+
+
+def test_save_as_yaml_right_after_edit(app, window, tmp_path, monkeypatch):
+    path = str(tmp_path / 'out.yaml')
+    monkeypatch.setattr(QtWidgets, 'QFileDialog', _save_dialog(path))
+    _edit_yaml(window, '123456789', '424242')
+    # the debounce has not fired: nothing is synced yet
+    assert window.current_data['state']['currencies']['cash'] == 123456789
+    window.save_as_yaml()
+    assert _wait(app, lambda: window._active_job is None)
+    with open(path, encoding='utf-8') as f:
+        assert yaml.safe_load(f)['state']['currencies']['cash'] == 424242
+
+
+def test_collect_ignores_older_parse_in_flight(app, window):
+    _edit_yaml(window, '123456789', '4242')
+    # a background parse of this text starts, then the user keeps typing
+    window._on_yaml_edited(window.yaml_tab.editor.toPlainText())
+    _edit_yaml(window, '4242', '424242')
+    assert window._collect_data_for_save()['state']['currencies']['cash'] == 424242
+    assert _wait(app, lambda: window._yaml_parse_job is None)
+    assert window.current_data['state']['currencies']['cash'] == 424242
+
+
+def test_collect_refuses_unparsable_yaml(window):
+    _edit_yaml(window, 'eridium: 5', 'eridium: [5')
+    with pytest.raises(ValueError):
+        window._collect_data_for_save()
+    assert window.current_data['state']['currencies']['cash'] == 123456789